@@ -92,6 +92,16 @@ class FontbakeryCallable:
       args.append(name)
     return tuple(args)
 
+  @property
+  @cached_getter
+  def is_async(self):
+    """ True for `async def` functions, coroutines and async generators.
+    The CheckRunner awaits their results.
+    """
+    func = inspect.unwrap(self)
+    return inspect.iscoroutinefunction(func) \
+                                      or inspect.isasyncgenfunction(func)
+
   def __call__(self, *args, **kwds):
     """ Each call to __call__ with the same arguments must return
     the same result.
@@ -129,14 +139,24 @@ class FontBakeryCondition(FontbakeryCallable):
        name = None, # very short text
        description = None, # short text
        documentation=None, # long text, markdown?
-       force=False
+       force=False,
+       prefetch=False, # expensive, see below
+       thread_safe=True # see FontBakeryCheck
       ):
+    """
+    prefetch: the condition is expensive, e.g. it downloads something or
+    runs an external program. The CheckRunner starts it in another thread
+    when the run starts, instead of waiting for it when it is first used.
+    Unless it is not thread_safe.
+    """
     super(FontBakeryCondition, self).__init__(func)
     # self.id = id
     self.name = func.__name__ if name is None else name
     self.description, self.documentation = get_doc_desc(
                                         func, description, documentation)
     self.force = force
+    self.prefetch = prefetch
+    self.thread_safe = thread_safe
 
 class FontBakeryCheck(FontbakeryCallable):
   def __init__(
@@ -150,6 +170,7 @@ class FontBakeryCheck(FontbakeryCallable):
        conditions=None,
        # arguments_setup=None,
        rationale=None, # long text explaining why this check is needed. Using markdown, perhaps?
+       thread_safe=True, # see below
        misc_metadata=None, # miscelaneous free-form metadata fields
                            # some of them may be promoted to first-class metadata fields
                            # if they start being used by the check-runner.
@@ -207,6 +228,13 @@ class FontBakeryCheck(FontbakeryCallable):
     documentation: text, used as a detailed documentation,
     read by humans(I suggest to make it markdown formatted).
 
+    thread_safe: False if the check must not run at the same time as
+    other checks and conditions, e.g. because it changes global state
+    like the working directory or sys.stdout, or because it modifies a
+    shared object. The CheckRunner doesn't start it ahead of time or in
+    another thread and, before it executes it, waits until everything it
+    started in other threads is done.
+
     advancedMessageSetup: depending on the instance of
     AdvancedMessageType returned by the check, this is the
     counterpart for it. Needed to make sense/use of an
@@ -225,6 +253,7 @@ class FontBakeryCheck(FontbakeryCallable):
     self.name = checkfunc.__name__ if name is None else name
     self.conditions = conditions or []
     self.rationale = rationale
+    self.thread_safe = thread_safe
     self.description, self.documentation = get_doc_desc(
                                       checkfunc, description, documentation)
     if not self.description:
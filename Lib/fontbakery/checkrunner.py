@@ -11,8 +11,12 @@ Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 
 """
+import asyncio
+import inspect
+import os
 import types
 from collections import OrderedDict, Counter
+from contextlib import contextmanager
 from functools import partial, wraps
 from itertools import chain
 import importlib
@@ -21,6 +25,8 @@ import json
 import logging
 from typing import Dict, Any, Iterable
 import re
+import threading
+import time
 
 from fontbakery.callable import ( FontbakeryCallable
                                 , FontBakeryCheck
@@ -28,6 +34,7 @@ from fontbakery.callable import ( FontbakeryCallable
                                 , FontBakeryExpectedValue
                                 )
 from fontbakery.message import Message
+from fontbakery.timing import set_recorder
 
 class Status:
   """ If you create a custom Status symbol, please keep in mind that
@@ -83,6 +90,11 @@ class Status:
   def __le__(self, other):
     return self.weight <= other.weight
 
+  def __reduce__(self):
+    # Unpickling goes through __new__, thus it returns the registered
+    # instance of the receiving process and `is` comparisons keep working.
+    return (Status, (self.name, self.weight))
+
   __repr__ = __str__
 
 # Status messages of the check runner protocol
@@ -215,6 +227,177 @@ class NamespaceError(FontBakeryRunnerError):
 class ValueValidationError(FontBakeryRunnerError):
   pass
 
+class WorkerError(FontBakeryRunnerError):
+  pass
+
+class TransportedMessage:
+  """ Stand-in for a log message that was sent from a worker process.
+
+  Arbitrary messages, especially the exceptions of this module, can't
+  be pickled reliably. This keeps what reporters consume: the string
+  representation, the `traceback` and the `code` if there was one.
+  """
+  def __init__(self, text, traceback=None, code=None):
+    self.text = text
+    if traceback is not None:
+      self.traceback = traceback
+    if code is not None:
+      self.code = code
+
+  @classmethod
+  def from_message(cls, message):
+    if message is None or isinstance(message, (str, Message, cls)):
+      return message
+    return cls(f'{message}'
+             , traceback=getattr(message, 'traceback', None)
+             , code=getattr(message, 'code', None))
+
+  def __str__(self):
+    return self.text
+
+  def __repr__(self):
+    return self.text
+
+  def getData(self):
+    """ return a dictionary with data suitable for serialization,
+        i.e. only stuff that is allowed in JSON.
+    """
+    data = {'message': self.text}
+    for attr in ('traceback', 'code'):
+      if hasattr(self, attr):
+        data[attr] = getattr(self, attr)
+    return data
+
+def message_to_data(message):
+  """ Return a JSON serializable form of a log message.
+
+  Strings stay as they are, Message instances are serialized with their
+  `getData` and anything else as a TransportedMessage.
+  `message_from_data` is the inverse.
+  """
+  if message is None or isinstance(message, str):
+    return message
+  if isinstance(message, Message):
+    return dict(message.getData(), type='Message')
+  return dict(TransportedMessage.from_message(message).getData()
+            , type='TransportedMessage')
+
+def message_from_data(data):
+  if data is None or isinstance(data, str):
+    return data
+  data = dict(data)
+  message_type = data.pop('type')
+  if message_type == 'Message':
+    return Message(data['code'], data['message'])
+  return TransportedMessage(data['message']
+                          , traceback=data.get('traceback')
+                          , code=data.get('code'))
+
+def _run_shard(runner, shard_id, indexes, queue):
+  """ Target of a worker process of `CheckRunner(jobs=N)`.
+
+  Puts `(shard_id, index, events)` for each executed item of the order
+  and `(shard_id, None, None)` when done. Messages are made picklable
+  with `TransportedMessage.from_message`.
+  """
+  try:
+    order = runner.order
+    shard_order = [order[index] for index in indexes]
+    for index, check_events in zip(indexes, runner._run_checks(shard_order)):
+      events = [(status, message if status == ENDCHECK
+                                  else TransportedMessage.from_message(message))
+                  for status, message in check_events]
+      timing = runner.get_timing(order[index])
+      queue.put((shard_id, index, events, timing))
+  except Exception as e:
+    queue.put((shard_id, None, "".join(traceback.format_exception(
+                                      type(e), e, e.__traceback__)), None))
+    return
+  queue.put((shard_id, None, None, None))
+
+
+class _ResourceRecorder:
+  """ Records the resources of fontbakery.timing in the timing of the
+  current item of a runner, see fontbakery.timing.set_recorder.
+  """
+  def __init__(self, runner):
+    self._runner = runner
+
+  def records(self):
+    return self._runner._current_timing is not None
+
+  def start_timer(self):
+    return self._runner._start_timer()
+
+  def stop_timer(self, timer, kind, name):
+    self._runner._stop_timer(timer, kind, name)
+
+  def count_use(self, kind, name):
+    timing = self._runner._current_timing
+    if timing is None:
+      return
+    target = timing.setdefault(kind, {}) \
+                   .setdefault(name, {'wall': 0.0, 'cpu': 0.0})
+    target['uses'] = target.get('uses', 0) + 1
+
+
+async def _await(awaitable):
+  return await awaitable
+
+
+class _EventLoop:
+  """ An asyncio event loop, running in a daemon thread, that executes
+  the awaitables of async checks and conditions. Everything else runs in
+  the thread of the CheckRunner, which waits for these results only when
+  it needs them, hence the awaitables overlap with each other and with
+  the items that don't use them.
+  """
+  def __init__(self):
+    self._loop = None
+    self._thread = None
+    self._pid = None
+    self._lock = threading.Lock()
+
+  def submit(self, awaitable):
+    """ Returns a concurrent.futures.Future of the result of awaitable. """
+    with self._lock:
+      # a forked worker process doesn't have the thread of its parent
+      if self._loop is None or self._pid != os.getpid():
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever
+                                      , daemon=True)
+        self._thread.start()
+        self._pid = os.getpid()
+      return asyncio.run_coroutine_threadsafe(_await(awaitable), self._loop)
+
+  def close(self):
+    """ Stop the thread, awaitables that are not done are cancelled. """
+    with self._lock:
+      loop, thread = self._loop, self._thread
+      if loop is None or self._pid != os.getpid():
+        return
+      self._loop = self._thread = self._pid = None
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    pending = asyncio.all_tasks(loop) if hasattr(asyncio, 'all_tasks') \
+                                      else asyncio.Task.all_tasks(loop)
+    for task in pending:
+      task.cancel()
+    if pending:
+      loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.close()
+
+
+class _PendingValue:
+  """ The value of an async condition that was started, but that may
+  not be done yet. See CheckRunner._get_condition.
+  """
+  __slots__ = ('condition', 'future')
+  def __init__(self, condition, future):
+    self.condition = condition
+    self.future = future
+
+
 # TODO: this should be part of FontBakeryCheck and check.conditions
 # should be a tuple (negated, name)
 def is_negated(name):
@@ -231,6 +414,13 @@ class CheckRunner:
              , custom_order=None
              , explicit_checks=None
              , exclude_checks=None
+             , jobs=1
+             , evict_conditions=False
+             , max_cached_conditions=None
+             , result_cache=None
+             , timings=False
+             , async_lookahead=32
+             , prefetch_workers=0
              ):
     # TODO: transform all iterables that are list like to tuples
     # to make sure that they won't change anymore.
@@ -239,6 +429,46 @@ class CheckRunner:
     self._custom_order = custom_order
     self._explicit_checks = explicit_checks
     self._exclude_checks = exclude_checks
+    # jobs > 1: run the checks in that many worker processes, see run
+    self._jobs = max(1, jobs or 1)
+    # evict_conditions: drop cached condition values after the last item
+    # of the order that uses them, see _get_condition_evictions
+    self._evict_conditions = evict_conditions
+    # max_cached_conditions: least recently used condition values are
+    # dropped when the cache grows beyond this size. They are evaluated
+    # again if needed later on.
+    self._max_cached_conditions = max_cached_conditions
+    # result_cache: e.g. a fontbakery.result_cache.ResultCache, results
+    # found in there are replayed instead of executing the check.
+    self._result_cache = result_cache
+    self._check_sources = {}
+    # compiled once per name/callable, see _get_resolution,
+    # _get_args_plan and _get_conditions_plan
+    self._resolutions = {}
+    self._args_plans = {}
+    self._conditions_plans = {}
+    self._condition_iterarg_names = {}
+    # timings: measure wall and cpu time of each item, see get_timing
+    self._timings = OrderedDict() if timings else None
+    self._current_timing = None
+    self._timer_stack = []
+    # records the resources of fontbakery.timing, e.g. tables of fonts
+    self._resource_recorder = _ResourceRecorder(self)
+    # timings of items that were prepared ahead, see _prepare_async
+    self._prepared_timings = {}
+    # async_lookahead: the async checks and conditions of this many
+    # items after the current one are started ahead, see _prepare_async
+    self._async_lookahead = async_lookahead
+    self._event_loop = _EventLoop()
+    # prefetch_workers: the conditions marked with `prefetch` that are
+    # used by the order are started in a pool of this many threads when
+    # the run starts, see _prefetch_conditions
+    self._prefetch_workers = prefetch_workers
+    self._prefetch_executor = None
+    # prefetch conditions that are not started yet, see _start_prefetches
+    self._prefetches = OrderedDict()
+    # futures of the work started in other threads, see _wait_for_running
+    self._running = []
     self._iterargs = OrderedDict()
     for singular, plural in profile.iterargs.items():
       values[plural] = tuple(values[plural])
@@ -261,8 +491,9 @@ class CheckRunner:
     self._values = values
 
     self._cache = {
-      'conditions': {}
+      'conditions': OrderedDict()
     , 'order': None
+    , 'order_index': None
     }
 
   @property
@@ -278,6 +509,10 @@ class CheckRunner:
   def profile(self):
     return self._profile
 
+  @property
+  def jobs(self):
+    return self._jobs
+
   def _check_result(self, result):
     """ Check that the check returned a well formed result:
           a tuple (<Status>, message)
@@ -314,7 +549,23 @@ class CheckRunner:
 
     return result
 
-  def _exec_check(self, check: FontbakeryCallable, args: Dict[str, Any]):
+  async def _collect_check_results(self, check, args):
+    """ The list of sub results of an async check, like _exec_check. """
+    results = []
+    try:
+      result = check(**args)  # Might raise.
+      if inspect.isasyncgen(result):
+        async for sub_result in result:  # Might raise.
+          results.append(self._check_result(sub_result))
+        return results
+      result = await result  # Might raise.
+    except Exception as e:
+      result = (ERROR, FailedCheckError(e))
+    results.append(self._check_result(result))
+    return results
+
+  def _exec_check(self, check: FontbakeryCallable, args: Dict[str, Any]
+                , future=None):
     """ Yields check sub results.
 
     Each check result is a tuple of: (<Status>, mixed message)
@@ -331,26 +582,55 @@ class CheckRunner:
       * we'll think of an AdvancedMessageType as well, so that
         we can connect the check result with more in depth
         knowledge from the check definition.
+
+    Async checks are executed by the event loop of the runner, `future`
+    is their result if they were started already, see _prepare_async.
     """
+    if future is None and check.is_async:
+      future = self._track(self._event_loop.submit(
+                                    self._collect_check_results(check, args)))
+    if future is not None:
+      timer = self._start_timer()
+      try:
+        results = future.result()
+      finally:
+        self._stop_timer(timer, 'check')
+      for result in results:
+        yield result
+      return
+
+    timer = None
     try:
       # A check can be either a normal function that returns one Status or a
       # generator that yields one or more. The latter will return a generator
       # object that we can detect with types.GeneratorType.
+      timer = self._start_timer()
       result = check(**args)  # Might raise.
+      self._stop_timer(timer, 'check')
+      timer = None
 
       if isinstance(result, types.GeneratorType):
         # Iterate over sub-results one-by-one, list(result) would abort on
         # encountering the first exception.
-        for sub_result in result:  # Might raise.
+        while True:
+          timer = self._start_timer()
+          try:
+            sub_result = next(result)  # Might raise.
+          except StopIteration:
+            break
+          self._stop_timer(timer, 'check')
+          timer = None
           yield self._check_result(sub_result)
+        self._stop_timer(timer, 'check')
         return  # Do not fall through to rest of method.
     except Exception as e:
+      self._stop_timer(timer, 'check')
       error = FailedCheckError(e)
       result = (ERROR, error)
 
     yield self._check_result(result)
 
-  def _evaluate_condition(self, name, iterargs, path=None):
+  def _evaluate_condition(self, name, iterargs, path=None, ahead=False):
     if path is None:
       # top level call
       path = []
@@ -372,38 +652,537 @@ class CheckRunner:
       return error, None
 
     path.pop()
+    if not condition.thread_safe:
+      self._wait_for_running()
+    elif ahead and condition.prefetch and self._prefetch_executor is not None:
+      # awaited when it is used, like an async condition
+      return None, _PendingValue(condition, self._track(
+                        self._prefetch_executor.submit(condition, **args)))
+    timer = self._start_timer()
     try:
-      return None, condition(**args)
+      value = condition(**args)
+      if condition.is_async:
+        # awaited when it is used, see _get_condition
+        return None, _PendingValue(condition
+                                , self._track(self._event_loop.submit(value)))
+      return None, value
     except Exception as err:
       error = FailedConditionError(condition, err)
       return error, None
+    finally:
+      self._stop_timer(timer, 'conditions', name)
+
+  def _start_timer(self):
+    """ Returns None if no timing is recorded for the current item. """
+    if self._current_timing is None:
+      return None
+    # [children wall time, children cpu time]
+    self._timer_stack.append([0.0, 0.0])
+    return time.perf_counter(), time.process_time()
+
+  def _stop_timer(self, timer, kind, name=None):
+    """ Add the time since timer was started to the current item timing.
+
+    Time spent in nested timers is not added, i.e. the time of a check
+    does not include the conditions that it evaluated lazily, and a
+    condition does not include the conditions it depends on.
+    """
+    if timer is None:
+      return
+    wall = time.perf_counter() - timer[0]
+    cpu = time.process_time() - timer[1]
+    children_wall, children_cpu = self._timer_stack.pop()
+    if self._timer_stack:
+      self._timer_stack[-1][0] += wall
+      self._timer_stack[-1][1] += cpu
+    target = self._current_timing.setdefault(kind, {})
+    if name is not None:
+      target = target.setdefault(name, {'wall': 0.0, 'cpu': 0.0})
+    target['wall'] += wall - children_wall
+    target['cpu'] += cpu - children_cpu
 
   def _filter_condition_used_iterargs(self, name, iterargs):
-    allArgs = set()
-    names = list(self._profile.conditions[name].args)
-    while(names):
-      name = names.pop()
-      if name in allArgs:
-        continue
-      allArgs.add(name)
-      if name in self._profile.conditions:
-        names += self._profile.conditions[name].args
+    allArgs = self._condition_iterarg_names.get(name)
+    if allArgs is None:
+      allArgs = set()
+      names = list(self._profile.conditions[name].args)
+      while(names):
+        arg = names.pop()
+        if arg in allArgs:
+          continue
+        allArgs.add(arg)
+        if arg in self._profile.conditions:
+          names += self._profile.conditions[arg].args
+      allArgs = self._condition_iterarg_names[name] = frozenset(
+                              arg for arg in allArgs if arg in self._iterargs)
     return tuple( (name, value) for name, value in iterargs
                                                   if name in allArgs)
 
-  def _get_condition(self, name, iterargs, path=None):
+  def _get_condition(self, name, iterargs, path=None, ahead=False):
+    """ Returns (error, value) of the condition.
+
+    ahead: the condition is started before it is used. The value of an
+    async condition, or of a prefetch condition that was started ahead,
+    is then a _PendingValue. It is waited for and cached when the
+    condition is used.
+    """
     # conditions are evaluated lazily
     usecache = True #False
     used_iterargs = self._filter_condition_used_iterargs(name, iterargs)
     key = (name, used_iterargs)
-    if not usecache or key not in self._cache['conditions']:
-      err, val = self._evaluate_condition(name, used_iterargs, path)
+    cache = self._cache['conditions']
+    if not usecache or key not in cache:
+      err, val = self._evaluate_condition(name, used_iterargs, path, ahead)
       if usecache:
-        self._cache['conditions'][key] = err, val
+        cache[key] = err, val
+        if self._max_cached_conditions is not None:
+          while len(cache) > self._max_cached_conditions:
+            cache.popitem(last=False)
     else:
-      err, val = self._cache['conditions'][key]
+      err, val = cache[key]
+      if self._max_cached_conditions is not None:
+        cache.move_to_end(key)
+    if not ahead and isinstance(val, _PendingValue):
+      err, val = self._wait_for_condition(name, val)
+      if key in cache:
+        cache[key] = err, val
     return err, val
 
+  def _wait_for_condition(self, name, pending):
+    # the time the runner waited is recorded, not the time the
+    # awaitable took.
+    timer = self._start_timer()
+    try:
+      return None, pending.future.result()
+    except Exception as err:
+      return FailedConditionError(pending.condition, err), None
+    finally:
+      self._stop_timer(timer, 'conditions', name)
+
+  def _collect_condition_keys(self, item, iterargs, keys):
+    """ Add to `keys` the keys of the conditions cache that are used when
+    `item`, a check or a condition, is executed with `iterargs`.
+
+    Mirrors how _get, _get_check_dependencies and _derive_iterable_condition
+    resolve names. Dependencies of conditions are included, that way a
+    value is never dropped while a condition that uses it may still be
+    evaluated.
+    """
+    names = list(item.args)
+    if hasattr(item, 'conditions'):
+      names += [name for _, name in map(is_negated, item.conditions)]
+    for name in names:
+      kind, target = self._get_resolution(name)
+      if kind == 'conditions':
+        name = target
+        all_iterargs = (iterargs, )
+      elif kind == 'derived_iterables':
+        name, _ = target
+        requirements = [(singular, self._iterargs[singular]) for singular
+                        in self._profile.get_iterargs(self._profile.conditions[name])]
+        all_iterargs = self._generate_iterargs(requirements)
+      else:
+        continue
+      for some_iterargs in all_iterargs:
+        used_iterargs = self._filter_condition_used_iterargs(name, some_iterargs)
+        key = (name, used_iterargs)
+        if key in keys:
+          continue
+        keys.add(key)
+        self._collect_condition_keys(self._profile.conditions[name]
+                                                    , used_iterargs, keys)
+
+  def _get_condition_evictions(self, order):
+    """ Returns a dict {position: [keys]}: after the execution of the
+    item at `position` in order, no later item uses the condition values
+    at `keys` anymore.
+    """
+    last_use = {}
+    for position, (_, check, iterargs) in enumerate(order):
+      keys = set()
+      self._collect_condition_keys(check, iterargs, keys)
+      for key in keys:
+        last_use[key] = position
+    evictions = {}
+    for key, position in last_use.items():
+      evictions.setdefault(position, []).append(key)
+    return evictions
+
+  def _get_deep_dependencies(self, check):
+    """ Names of all values, conditions and derived iterables check
+    depends on, with aliases resolved.
+    """
+    seen = set()
+    names = list(check.args) + [name for _, name
+                                      in map(is_negated, check.conditions)]
+    while names:
+      name = names.pop()
+      if name in self._values or name in seen:
+        seen.add(name)
+        continue
+      seen.add(name)
+      name = self._profile.resolve_alias(name)
+      seen.add(name)
+      nametype = self._profile.get_type(name, None)
+      if nametype == 'derived_iterables':
+        name, _ = self._profile.get(name)
+        seen.add(name)
+        nametype = 'conditions'
+      if nametype == 'conditions' and name in self._profile.conditions:
+        names += self._profile.conditions[name].args
+    return seen
+
+  def _get_sources(self, check):
+    """ The source code of check and of all conditions it depends on.
+
+    For wrapped callables, e.g. created by `check_log_override`, each
+    level is included, together with the plain data of its closure.
+    """
+    if check.id in self._check_sources:
+      return self._check_sources[check.id]
+
+    def get_source(func):
+      parts = []
+      while func is not None:
+        try:
+          parts.append(inspect.getsource(func))
+        except (OSError, TypeError):
+          parts.append(repr(func))
+        for cell in getattr(func, '__closure__', None) or ():
+          try:
+            content = cell.cell_contents
+          except ValueError: # empty cell
+            continue
+          if not callable(content):
+            parts.append(repr(content))
+        func = getattr(func, '__wrapped__', None)
+      return '\n'.join(parts)
+
+    sources = [get_source(check)]
+    for name in sorted(self._get_deep_dependencies(check)):
+      condition = self._profile.conditions.get(name, None)
+      if condition is not None:
+        sources.append(get_source(condition))
+    if self._profile.check_skip_filter:
+      sources.append(get_source(self._profile.check_skip_filter))
+    self._check_sources[check.id] = sources
+    return sources
+
+  def _get_result_cache_key(self, identity):
+    _, check, iterargs = identity
+    values = []
+    for name, index in iterargs:
+      values.append((name, self.get_iterarg(name, index)))
+    for name in sorted(self._get_deep_dependencies(check)):
+      if name in self._values:
+        values.append((name, self._values[name]))
+        continue
+      if self._profile.get_type(name, None) != 'derived_iterables':
+        continue
+      # all values of the iterargs of the derived iterable
+      condition_name, _ = self._profile.get(name)
+      condition = self._profile.conditions[condition_name]
+      for singular in self._profile.get_iterargs(condition):
+        plural = self._profile.iterargs[singular]
+        values.append((plural, self._values[plural]))
+    return self._result_cache.get_key(
+                          self._profile.serialize_identity(identity)
+                        , self._get_sources(check)
+                        , values)
+
+  def _run_check_cached(self, section, check, iterargs, prepared=None):
+    """ Like _run_check, but replays the events from self._result_cache
+    if they are in there and stores them otherwise.
+    """
+    key = self._get_result_cache_key((section, check, iterargs))
+    events = self._result_cache.get(key)
+    if events is not None:
+      if self._current_timing is not None:
+        self._current_timing['cached'] = True
+      for event in events:
+        yield event
+      return
+    events = []
+    for event in self._run_check(check, iterargs, prepared):
+      events.append(event)
+      yield event
+    self._result_cache.set(key, events)
+
+  def _uses_async(self, order):
+    return any(condition.is_async
+                          for condition in self._profile.conditions.values()) \
+        or any(check.is_async for _, check, _ in order)
+
+  def _is_waiting(self, keys):
+    """ True if one of the conditions at keys is an awaitable that is not
+    done yet.
+    """
+    cache = self._cache['conditions']
+    for key in keys:
+      _, value = cache.get(key, (None, None))
+      if isinstance(value, _PendingValue) and not value.future.done():
+        return True
+    return False
+
+  def _prepare_async(self, identity):
+    """ Returns the `prepared` argument of _run_check for an async check,
+    which is started on the event loop right away. None if the result
+    will be replayed from the result cache.
+    """
+    _, check, iterargs = identity
+    if self._result_cache is not None \
+        and self._result_cache.get(self._get_result_cache_key(identity)) is not None:
+      return None
+    skipped, args = self._get_skipped_or_args(check, iterargs)
+    future = None
+    if skipped is None:
+      future = self._track(self._event_loop.submit(
+                                    self._collect_check_results(check, args)))
+    return skipped, args, future
+
+  def _track(self, future):
+    """ Keep future, which runs in another thread, for _wait_for_running. """
+    self._running = [running for running in self._running
+                                          if not running.done()]
+    self._running.append(future)
+    return future
+
+  def _wait_for_running(self):
+    """ Wait until the checks and conditions that were started in other
+    threads are done, before something that is not thread_safe runs.
+    """
+    running, self._running = self._running, []
+    if running:
+      from concurrent.futures import wait
+      wait(running)
+
+  def _prefetch_conditions(self, order):
+    """ Start the prefetch conditions used by order in a pool of threads,
+    the ones they depend on first. Their other dependencies are evaluated
+    right away. The time it takes is recorded in the timing of the first
+    item that uses the condition.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    seen = set()
+    prefetches = []
+    for position, (_, check, iterargs) in enumerate(order):
+      keys = set()
+      self._collect_condition_keys(check, iterargs, keys)
+      for key in keys - seen:
+        condition = self._profile.conditions[key[0]]
+        if condition.prefetch and condition.thread_safe:
+          dependencies = set()
+          self._collect_condition_keys(condition, key[1], dependencies)
+          prefetches.append((len(dependencies), key, dependencies, position))
+      seen.update(keys)
+    if not prefetches:
+      return
+    if self._prefetch_executor is None:
+      self._prefetch_executor = ThreadPoolExecutor(
+                                          max_workers=self._prefetch_workers)
+    # a condition has more dependencies than each of its dependencies
+    prefetches.sort(key=lambda prefetch: prefetch[:2])
+    self._prefetches = OrderedDict((key, (dependencies, position))
+                        for _, key, dependencies, position in prefetches)
+    self._start_prefetches(order, 0)
+
+  def _start_prefetches(self, order, position):
+    """ Start the prefetch conditions that don't depend on a condition
+    that is still waiting for a result, before the item at position.
+    The others are started later, they would block the runner until
+    their dependencies are done.
+    """
+    cache = self._cache['conditions']
+    for key, (dependencies, first_position) in list(self._prefetches.items()):
+      if first_position < position or key in cache:
+        # evaluated when it was used
+        del self._prefetches[key]
+      elif not self._is_waiting(dependencies):
+        del self._prefetches[key]
+        with self._prepare_timing(order[first_position]):
+          self._get_condition(*key, ahead=True)
+
+  def _run_checks(self, order):
+    """ Yields the events of each item of order as returned by _run_check.
+
+    The events of an item must be consumed before requesting the next
+    item, because cached conditions are evicted in between.
+
+    The async conditions used by the next `async_lookahead` items are
+    started ahead, as are their async checks, as soon as none of their
+    conditions is waiting for an awaitable. The sync conditions these
+    depend on are evaluated when they are started.
+
+    With `prefetch_workers`, the prefetch conditions of the whole order
+    are started before the first item, or as soon as the prefetch
+    conditions they depend on are done.
+
+    Checks and conditions that are not `thread_safe` are not started
+    ahead, before they are executed the runner waits for all that it
+    started ahead.
+    """
+    evictions = self._get_condition_evictions(order) \
+                                      if self._evict_conditions else {}
+    cache = self._cache['conditions']
+    lookahead = self._async_lookahead if self._uses_async(order) else 0
+    # position: keys of the conditions of an async check that is
+    # not prepared yet
+    waiting = {}
+    # position: prepared argument of _run_check
+    prepared = {}
+    started = 0
+    try:
+      if self._prefetch_workers:
+        self._prefetch_conditions(order)
+      for position, (section, check, iterargs) in enumerate(order):
+        if self._prefetches:
+          self._start_prefetches(order, position)
+        if lookahead:
+          for ahead in range(started, min(len(order), position + lookahead + 1)):
+            identity = order[ahead]
+            _, ahead_check, ahead_iterargs = identity
+            keys = set()
+            self._collect_condition_keys(ahead_check, ahead_iterargs, keys)
+            with self._prepare_timing(identity):
+              for name, used_iterargs in sorted(keys):
+                condition = self._profile.conditions[name]
+                if condition.is_async and condition.thread_safe:
+                  self._get_condition(name, used_iterargs, ahead=True)
+            if ahead_check.is_async and ahead_check.thread_safe \
+                                    and ahead != position:
+              waiting[ahead] = keys
+            started = ahead + 1
+          # the current item is executed as usual
+          waiting.pop(position, None)
+          for ahead in sorted(waiting):
+            if not self._is_waiting(waiting[ahead]):
+              del waiting[ahead]
+              identity = order[ahead]
+              with self._prepare_timing(identity):
+                item_prepared = self._prepare_async(identity)
+              if item_prepared is not None:
+                prepared[ahead] = item_prepared
+
+        item_prepared = prepared.pop(position, None)
+        if not check.thread_safe:
+          self._wait_for_running()
+        if self._result_cache is not None:
+          events = self._run_check_cached(section, check, iterargs, item_prepared)
+        else:
+          events = self._run_check(check, iterargs, item_prepared)
+        if self._timings is not None:
+          events = self._timed_events((section, check, iterargs), events)
+        yield events
+        for key in evictions.get(position, ()):
+          cache.pop(key, None)
+    finally:
+      self._event_loop.close()
+      self._running = []
+      self._prefetches = OrderedDict()
+      if self._prefetch_executor is not None:
+        # the results of the conditions that are still running are
+        # not needed anymore
+        self._prefetch_executor.shutdown(wait=False)
+        self._prefetch_executor = None
+
+  def _new_timing(self):
+    return {
+      'wall': 0.0
+    , 'cpu': 0.0
+    , 'check': {'wall': 0.0, 'cpu': 0.0}
+    , 'conditions': {}
+    }
+
+  @contextmanager
+  def _prepare_timing(self, identity):
+    """ Records the time of the with block in the timing of identity,
+    which is executed later on. See _run_checks.
+    """
+    if self._timings is None:
+      yield
+      return
+    key = self._get_identity_key(identity)
+    timing = self._prepared_timings.get(key)
+    if timing is None:
+      timing = self._prepared_timings[key] = self._new_timing()
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    self._current_timing = timing
+    set_recorder(self._resource_recorder)
+    try:
+      yield
+    finally:
+      self._current_timing = None
+      set_recorder(None)
+      timing['wall'] += time.perf_counter() - start_wall
+      timing['cpu'] += time.process_time() - start_cpu
+
+  def _timed_events(self, identity, events):
+    """ Yields from events and records the time it takes to produce them.
+
+    Time spent by the consumer of the events is not recorded. The timing
+    is complete before ENDCHECK is yielded, that way reporters can pick it
+    up with get_timing when they receive ENDCHECK.
+    """
+    key = self._get_identity_key(identity)
+    timing = self._prepared_timings.pop(key, None)
+    if timing is None:
+      timing = self._new_timing()
+    self._timings[key] = timing
+    while True:
+      start_wall, start_cpu = time.perf_counter(), time.process_time()
+      self._current_timing = timing
+      set_recorder(self._resource_recorder)
+      try:
+        event = next(events)
+      except StopIteration:
+        return
+      finally:
+        self._current_timing = None
+        set_recorder(None)
+        timing['wall'] += time.perf_counter() - start_wall
+        timing['cpu'] += time.process_time() - start_cpu
+      yield event
+      status, _ = event
+      if status is ENDCHECK:
+        # The timing was reported with ENDCHECK, don't change it anymore,
+        # e.g. by the time it takes to store the result in the cache.
+        yield from events
+        return
+
+  def get_timing(self, identity):
+    """ Returns the timing of the execution of identity or None.
+
+    Only available if the runner was created with `timings=True`.
+    A timing is a dict:
+      {
+        'wall': seconds, 'cpu': seconds # all of the execution
+      , 'check': {'wall': seconds, 'cpu': seconds} # the check itself
+        # conditions that were evaluated for the first time, excluding
+        # the time of the conditions they depend on
+      , 'conditions': {name: {'wall': seconds, 'cpu': seconds}, ...}
+        # resources, recorded with fontbakery.timing.timed_resource and
+        # count_resource_use, e.g. 'tables' of fonts. 'uses' is only there if counted.
+      , KIND: {name: {'wall': seconds, 'cpu': seconds, 'uses': count}, ...}
+      }
+    The remaining time is spent in the check runner.
+    Replayed results of a result cache are marked with 'cached': True.
+    For async checks and conditions, the time the runner waited for their
+    result is recorded. Conditions and checks that are started ahead
+    (see _run_checks) are recorded in the timing of the item they were
+    started for.
+    """
+    if self._timings is None:
+      return None
+    return self._timings.get(self._get_identity_key(identity), None)
+
+  @property
+  def timings(self):
+    """ Yields (identity key, timing) in execution order. """
+    if self._timings is None:
+      return
+    for key, timing in self._timings.items():
+      yield key, timing
+
   def get(self, key, iterargs, *args):
     return self._get(key, iterargs, None, *args)
 
@@ -444,56 +1223,109 @@ class CheckRunner:
       else:
         yield (iterargs, value)
 
-  def _get(self, name, iterargs, path, *args):
-    iterargsDict = dict(iterargs)
-    has_fallback = bool(len(args))
-    if has_fallback:
-      fallback = args[0]
-
-    # try this once before resolving aliases and once after
-    if name in self._values:
-      return self._values[name]
+  def _get_resolution(self, name):
+    """ Returns a tuple (kind, target) describing how the value of name
+    is obtained, aliases are resolved already. Kinds:
+      'values': target is the value
+      'iterargs': target is (name, plural, missing message)
+      'conditions': target is the name of the condition
+      'derived_iterables': target is (condition name, simple)
+      'missing': target is the message of the MissingValueError
+
+    The result only depends on the profile and the values, which don't
+    change during the lifetime of the runner, hence it is compiled once.
+    """
+    resolution = self._resolutions.get(name, None)
+    if resolution is not None:
+      return resolution
 
     original_name = name
-    name = self._profile.resolve_alias(name)
-    if name != original_name and name in self._values:
-      return self._values[name]
-
-    nametype = self._profile.get_type(name, None)
-
+    # try this once before resolving aliases and once after
     if name in self._values:
-      return self._values[name]
-
-    if nametype == 'expected_values':
-      # No need to validate
-      expected_value = self._profile.get(name)
-      if expected_value.has_default:
-        # has no default: fallback or MissingValueError
-        return expected_value.default
-
-    if nametype == 'iterargs' and name in iterargsDict:
-      index = iterargsDict[name]
-      plural = self._profile.get(name)
-      return self._values[plural][index]
-
-    if nametype == 'conditions':
-      error, value = self._get_condition(name, iterargs, path)
+      resolution = ('values', self._values[name])
+    else:
+      name = self._profile.resolve_alias(name)
+      if original_name != name:
+        report_name = f'"{original_name}" as "{name}"'
+      else:
+        report_name = f'"{name}"'
+      missing = f'Value {report_name} is undefined.'
+      nametype = self._profile.get_type(name, None)
+      resolution = ('missing', missing)
+      if name in self._values:
+        resolution = ('values', self._values[name])
+      elif nametype == 'expected_values':
+        # No need to validate
+        expected_value = self._profile.get(name)
+        if expected_value.has_default:
+          # has no default: fallback or MissingValueError
+          resolution = ('values', expected_value.default)
+      elif nametype == 'iterargs':
+        resolution = ('iterargs', (name, self._profile.get(name), missing))
+      elif nametype == 'conditions':
+        resolution = ('conditions', name)
+      elif nametype == 'derived_iterables':
+        resolution = ('derived_iterables', self._profile.get(name))
+
+    self._resolutions[original_name] = resolution
+    return resolution
+
+  def _resolve(self, resolution, iterargs, path):
+    kind, target = resolution
+    if kind == 'values':
+      return target
+
+    if kind == 'conditions':
+      error, value = self._get_condition(target, iterargs, path)
       if error:
         raise error
       return value
 
-    if nametype == 'derived_iterables':
-      condition_name, simple = self._profile.get(name)
+    if kind == 'iterargs':
+      name, plural, missing = target
+      for iterarg_name, index in iterargs:
+        if iterarg_name == name:
+          return self._values[plural][index]
+      raise MissingValueError(missing)
+
+    if kind == 'derived_iterables':
+      condition_name, simple = target
       return self._derive_iterable_condition(condition_name, simple, path)
 
-    if has_fallback:
-      return fallback
+    raise MissingValueError(target)
 
-    if original_name != name:
-      report_name = f'"{original_name}" as "{name}"'
-    else:
-      report_name = f'"{name}"'
-    raise MissingValueError(f'Value {report_name} is undefined.')
+  def _get(self, name, iterargs, path, *args):
+    try:
+      return self._resolve(self._get_resolution(name), iterargs, path)
+    except MissingValueError:
+      if args:
+        # has fallback
+        return args[0]
+      raise
+
+  def _get_args_plan(self, item):
+    """ A tuple of (name, is optional, resolution) for each argument of
+    item, a check or a condition. See _get_resolution.
+    """
+    plan = self._args_plans.get(item, None)
+    if plan is None:
+      plan = self._args_plans[item] = tuple(
+                  (name, name in item.optionalArgs, self._get_resolution(name))
+                                    for name in OrderedDict.fromkeys(item.args))
+    return plan
+
+  def _get_conditions_plan(self, check):
+    """ A tuple of (condition, negate, name, is a value) for each of the
+    conditions of check.
+    """
+    plan = self._conditions_plans.get(check, None)
+    if plan is None:
+      plan = []
+      for condition in check.conditions:
+        negate, name = is_negated(condition)
+        plan.append((condition, negate, name, name in self._values))
+      plan = self._conditions_plans[check] = tuple(plan)
+    return plan
 
   def _get_args(self, item, iterargs, path=None):
     # iterargs can't be optional arguments yet, we wouldn't generate
@@ -501,21 +1333,18 @@ class CheckRunner:
     # feasible, so I don't add this complication for the sake of clarity.
     # If this is needed for anything useful, we'll have to figure this out.
     args = {}
-    for name in item.args:
-      if name in args:
-        continue
+    for name, optional, resolution in self._get_args_plan(item):
       try:
-        args[name] = self._get(name, iterargs, path)
+        args[name] = self._resolve(resolution, iterargs, path)
       except MissingValueError:
-        if name not in item.optionalArgs:
+        if not optional:
           raise
     return args
 
   def _get_check_dependencies(self, check, iterargs):
     unfulfilled_conditions = []
-    for condition in check.conditions:
-      negate, name = is_negated(condition)
-      if name in self._values:
+    for condition, negate, name, is_value in self._get_conditions_plan(check):
+      if is_value:
         # this is a handy way to set flags from the outside
         err, val = None, self._values[name]
       else:
@@ -539,16 +1368,9 @@ class CheckRunner:
       status = (ERROR, FailedDependenciesError(check, error))
       return (status, None)
 
-  def _run_check(self, check, iterargs):
-    summary_status = None
-    # A check is more than just a function, it carries
-    # a lot of meta-data for us, in this case we can use
-    # meta-data to learn how to call the check (via
-    # configuration or inprofiletion, where inprofiletion would be
-    # the default and configuration could be used to override
-    # inprofiletion results).
-
+  def _get_skipped_or_args(self, check, iterargs):
     skipped = None
+    args = None
     if self._profile.check_skip_filter:
       iterargsDict = {key:self.get_iterarg(key, index) for key, index in iterargs}
       accepted, message = self._profile.check_skip_filter(check.id, **iterargsDict)
@@ -557,6 +1379,25 @@ class CheckRunner:
 
     if not skipped:
       skipped, args = self._get_check_dependencies(check, iterargs)
+    return skipped, args
+
+  def _run_check(self, check, iterargs, prepared=None):
+    """ prepared: (skipped, args, future) of an async check that was
+    started ahead, see _prepare_async.
+    """
+    summary_status = None
+    # A check is more than just a function, it carries
+    # a lot of meta-data for us, in this case we can use
+    # meta-data to learn how to call the check (via
+    # configuration or inprofiletion, where inprofiletion would be
+    # the default and configuration could be used to override
+    # inprofiletion results).
+
+    if prepared is not None:
+      skipped, args, future = prepared
+    else:
+      skipped, args = self._get_skipped_or_args(check, iterargs)
+      future = None
 
     # FIXME: check is not a message
     # so, to use it as a message, it should have a "message-interface"
@@ -573,7 +1414,7 @@ class CheckRunner:
       # correctly.
       yield skipped
     else:
-      for sub_result in self._exec_check(check, args):
+      for sub_result in self._exec_check(check, args, future):
         status, _ = sub_result
         if summary_status is None or status >= summary_status:
           summary_status = status
@@ -618,15 +1459,144 @@ class CheckRunner:
       self._cache['order'] = order = tuple(order)
     return order
 
+  @staticmethod
+  def _get_order_key(section_name, check_id, iterargs):
+    # iterargs are sorted like in Profile.serialize_identity
+    return (section_name, check_id, tuple(sorted(iterargs)))
+
+  @property
+  def _order_index(self):
+    """ A dict {order key: identity} of all items of self.order,
+    see _get_order_key.
+    """
+    index = self._cache.get('order_index', None)
+    if index is None:
+      index = {}
+      for identity in self.order:
+        section, check, iterargs = identity
+        index[self._get_order_key(str(section), check.id, iterargs)] = identity
+      self._cache['order_index'] = index
+    return index
+
   def check_order(self, order):
     """
       order must be a subset of self.order
+
+      Returns a tuple of the equal items of self.order.
     """
-    own_order = self.order
+    index = self._order_index
+    result = []
     for item in order:
-      if item not in own_order:
+      section, check, iterargs = item
+      key = self._get_order_key(str(section), getattr(check, 'id', None)
+                                                        , iterargs)
+      if key not in index:
         raise ValueError(f'Order item {item} not found.')
-    return order
+      result.append(index[key])
+    return tuple(result)
+
+  def deserialize_order(self, serialized_order):
+    """ Like Profile.deserialize_order, but the items are looked up in
+    self.order directly, hence the result is a valid order for `run`.
+
+    Raises ValueError if an item is not in self.order.
+    """
+    index = self._order_index
+    result = []
+    for serialized in serialized_order:
+      item = json.loads(serialized)
+      key = self._get_order_key(item['section'], item['check']
+                              , (tuple(iterarg) for iterarg in item['iterargs']))
+      if key not in index:
+        raise ValueError(f'Order item {serialized} not found.')
+      result.append(index[key])
+    return tuple(result)
+
+  @staticmethod
+  def _get_identity_key(identity):
+    # sections are not hashable, but their string representation is
+    # unique within a profile, as are check ids.
+    section, check, iterargs = identity
+    return (str(section), check.id, iterargs)
+
+  def _get_shard(self, iterargs, position):
+    """ Items that share a value of the first iterarg (e.g. the same font)
+    go to the same shard, so that the conditions cached for that value are
+    computed in only one of the workers. Items without that iterarg are
+    distributed by their position in the order.
+    """
+    if self._iterargs:
+      first_iterarg = next(iter(self._iterargs))
+      for name, index in iterargs:
+        if name == first_iterarg:
+          return index % self._jobs
+    return position % self._jobs
+
+  def _run_checks_in_processes(self, order):
+    """ Yields the events of each item of order, like `_run_check` does,
+    but the items are executed by `self._jobs` forked worker processes.
+
+    Each worker owns a disjoint set of the values of the first iterarg.
+    Events of items that finished early are buffered until all items
+    before them have been yielded, so the event stream keeps its order.
+    """
+    import multiprocessing
+    import queue as queue_module
+    if 'fork' not in multiprocessing.get_all_start_methods():
+      logging.warning('Running checks in parallel requires the "fork" start '
+                      'method of multiprocessing, running serially instead.')
+      for events in self._run_checks(order):
+        yield events
+      return
+
+    # _run_shard uses indexes into self.order, that way no sections or
+    # checks have to be pickled.
+    own_indexes = {self._get_identity_key(identity): index
+                                  for index, identity in enumerate(self.order)}
+    indexes = [own_indexes[self._get_identity_key(identity)]
+                                                      for identity in order]
+    shards = [[] for _ in range(self._jobs)]
+    for position, index in enumerate(indexes):
+      _, _, iterargs = self.order[index]
+      shards[self._get_shard(iterargs, position)].append(index)
+
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    workers = {}
+    for shard_id, shard in enumerate(shards):
+      if not shard:
+        continue
+      worker = context.Process(target=_run_shard
+                             , args=(self, shard_id, shard, results)
+                             , daemon=True)
+      worker.start()
+      workers[shard_id] = worker
+
+    buffered = {}
+    try:
+      for index in indexes:
+        while index not in buffered:
+          try:
+            shard_id, result_index, events, timing = results.get(timeout=1)
+          except queue_module.Empty:
+            if not any(worker.is_alive() for worker in workers.values()):
+              raise WorkerError('All worker processes exited before the '
+                                f'item {self.order[index]} was executed.')
+            continue
+          if result_index is None:
+            if events is not None:
+              raise WorkerError(f'Worker process {shard_id} failed:\n{events}')
+            continue
+          buffered[result_index] = events, timing
+        events, timing = buffered.pop(index)
+        if timing is not None:
+          self._timings[self._get_identity_key(self.order[index])] = timing
+        yield events
+    finally:
+      for worker in workers.values():
+        if worker.is_alive():
+          worker.terminate()
+        worker.join()
 
   def run(self, order=None):
     checkrun_summary = Counter()
@@ -652,6 +1622,11 @@ class CheckRunner:
     if section is not None:
       section_orders.append((section, tuple(section_order)))
 
+    if self._jobs > 1:
+      check_events = self._run_checks_in_processes(order)
+    else:
+      check_events = self._run_checks(order)
+
     # run
     yield START, order, (None, None, None)
     section = None
@@ -659,7 +1634,7 @@ class CheckRunner:
       section_summary = Counter()
       yield STARTSECTION, section_order, (section, None, None)
       for check, iterargs in section_order:
-        for status, message in self._run_check(check, iterargs):
+        for status, message in next(check_events):
           yield status, message, (section, check, iterargs)
         # after _run_check the last status must be ENDCHECK
         assert status == ENDCHECK
@@ -667,6 +1642,8 @@ class CheckRunner:
         section_summary[message.name] += 1
       yield ENDSECTION, section_summary, (section, None, None)
       checkrun_summary.update(section_summary)
+    if self._result_cache is not None:
+      self._result_cache.evict()
     yield END, checkrun_summary, (None, None, None)
 
 def distribute_generator(gen, targets_callbacks):
@@ -5,6 +5,7 @@ import argparse
 import importlib.util
 import os
 import sys
+import time
 from collections import OrderedDict
 
 from fontbakery.checkrunner import (
@@ -39,6 +40,7 @@ DEFAULT_LOG_LEVEL = INFO
 from fontbakery.reporters.terminal import TerminalReporter
 from fontbakery.reporters.serialize import SerializeReporter
 from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
+from fontbakery.reporters.ndjson import NDJSONReporter
 from fontbakery.reporters.html import HTMLReporter
 
 def ArgumentParser(profile, profile_arg=True):
@@ -109,6 +111,85 @@ def ArgumentParser(profile, profile_arg=True):
         action='store_true',
         help='No colors for tty output.')
 
+  def positive_int(arg):
+    try:
+      value = int(arg)
+    except ValueError:
+      value = 0
+    if value < 1:
+      raise argparse.ArgumentTypeError(f'"{arg}" is not a positive integer.')
+    return value
+  argument_parser.add_argument('-j', '--jobs', default=1, type=positive_int,
+                      metavar='JOBS',
+                      help='Run the checks in JOBS worker processes.\n'
+                           'Each process checks a share of the fonts, the\n'
+                           'report is in the same order as a serial run.\n'
+                           '(default: 1)')
+
+  def non_negative_int(arg):
+    try:
+      value = int(arg)
+    except ValueError:
+      value = -1
+    if value < 0:
+      raise argparse.ArgumentTypeError(f'"{arg}" is not a non-negative integer.')
+    return value
+  argument_parser.add_argument('--prefetch-workers', default=0,
+                      type=non_negative_int, metavar='THREADS',
+                      help='Compute expensive conditions, e.g. downloads or\n'
+                           'external programs, in the background in THREADS\n'
+                           'threads, starting when the run starts.\n'
+                           '0 computes them when they are first used.\n'
+                           '(default: 0)')
+
+  argument_parser.add_argument('--max-cached-conditions', default=None,
+                      type=positive_int, metavar='COUNT',
+                      help='Keep at most COUNT condition results (e.g. parsed\n'
+                           'fonts) in memory. Results that are needed again\n'
+                           'are re-evaluated. Results no later check needs\n'
+                           'are always dropped.\n'
+                           '(default: unlimited)')
+
+  argument_parser.add_argument('--result-cache', default=None,
+                      metavar='CACHE_DIR',
+                      help='Store check results in CACHE_DIR and replay them\n'
+                           'when the same checks run again on unchanged files.\n'
+                           'Results of checks that use remote resources are\n'
+                           'replayed as well, use a new CACHE_DIR to re-query.')
+
+  argument_parser.add_argument('--result-cache-size', default=256,
+                      type=positive_int, metavar='MEGABYTES',
+                      help='Maximum size of the --result-cache, least recently\n'
+                           'used results are removed first.\n'
+                           '(default: 256)')
+
+  argument_parser.add_argument('--link-cache', default=None,
+                      metavar='CACHE_DIR',
+                      help='Store the responses of the checked hyperlinks in\n'
+                           'CACHE_DIR and reuse them for a day, instead of\n'
+                           'requesting the links again in each run.')
+
+  argument_parser.add_argument('--http-cache', default=None,
+                      metavar='CACHE_DIR',
+                      help='Store downloaded remote resources, e.g. the\n'
+                           'families hosted on Google Fonts, in CACHE_DIR.\n'
+                           'They are revalidated after a day.')
+
+  argument_parser.add_argument('--offline', default=False, action='store_true',
+                      help='Don\'t download remote resources, use only those\n'
+                           'stored in the --http-cache.')
+
+  def base_url(arg):
+    url, sep, mirror = arg.partition('=')
+    if not sep or not url or not mirror:
+      raise argparse.ArgumentTypeError(f'"{arg}" is not of the form URL=MIRROR.')
+    return url, mirror
+  argument_parser.add_argument('--base-url', dest='base_urls', default=[],
+                      type=base_url, action='append', metavar='URL=MIRROR',
+                      help='Download remote resources starting with URL from\n'
+                           'MIRROR instead, e.g. a local mirror of\n'
+                           'https://fonts.google.com/. Can be repeated.')
+
   argument_parser.add_argument('-S', '--show-sections', default=False, action='store_true',
                       help='Show section start and end info plus summary.')
 
@@ -135,6 +216,17 @@ def ArgumentParser(profile, profile_arg=True):
                       metavar= 'HTML_FILE',
                       help='Write a HTML report to HTML_FILE.')
 
+  argument_parser.add_argument('--ndjson', default=False, type=argparse.FileType('w'),
+                      metavar= 'NDJSON_FILE',
+                      help='Write each event as a line of JSON to NDJSON_FILE\n'
+                           'as soon as it happens.')
+
+  argument_parser.add_argument('--timings', default=False, type=argparse.FileType('w'),
+                      metavar= 'TIMINGS_FILE',
+                      help='Write the wall and cpu time spent in each check and\n'
+                           'condition to TIMINGS_FILE. The format is CSV if\n'
+                           'the file name ends with ".csv", JSON otherwise.')
+
   iterargs = sorted(profile.iterargs.keys())
 
   gather_by_choices = iterargs + ['*check']
@@ -173,6 +265,99 @@ def ArgumentParser(profile, profile_arg=True):
 class ArgumentParserError(Exception): pass
 
 
+def write_timings(runner, run_timing, timings_file):
+  """ Write the timings recorded by runner to timings_file, as CSV
+  if the file name ends with ".csv" otherwise as JSON.
+
+  run_timing: {'wall': seconds, 'cpu': seconds} of the whole run,
+  including the time spent in reporters.
+  """
+  items = []
+  conditions = {}
+  # e.g. 'tables': the resources recorded by fontbakery.timing.timed_resource
+  others = {}
+  checks_total = {'wall': 0.0, 'cpu': 0.0}
+  for (section, check_id, iterargs), timing in runner.timings:
+    items.append({
+        'section': section
+      , 'check': check_id
+      , 'iterargs': [[name, runner.get_iterarg(name, index), index]
+                                              for name, index in iterargs]
+      , 'timing': timing
+    })
+    for key in checks_total:
+      checks_total[key] += timing['check'][key]
+    for name, condition_timing in timing['conditions'].items():
+      total = conditions.setdefault(name, {'wall': 0.0, 'cpu': 0.0, 'count': 0})
+      total['wall'] += condition_timing['wall']
+      total['cpu'] += condition_timing['cpu']
+      total['count'] += 1
+    for kind, resources in timing.items():
+      if kind in ('wall', 'cpu', 'cached', 'check', 'conditions'):
+        continue
+      for name, resource_timing in resources.items():
+        total = others.setdefault(kind, {}).setdefault(name, {
+                              'wall': 0.0, 'cpu': 0.0, 'uses': 0, 'loads': 0})
+        total['wall'] += resource_timing['wall']
+        total['cpu'] += resource_timing['cpu']
+        total['uses'] += resource_timing.get('uses', 0)
+        # the resources that were only used have no time of their own
+        if resource_timing['wall'] or resource_timing['cpu']:
+          total['loads'] += 1
+
+  if timings_file.name.lower().endswith('.csv'):
+    import csv
+    writer = csv.writer(timings_file)
+    writer.writerow(['section', 'check', 'iterargs', 'part', 'name'
+                   , 'wall', 'cpu'])
+    for item in items:
+      iterargs = ' '.join(f'{name}={value}' for name, value, _ in item['iterargs'])
+      row = [item['section'], item['check'], iterargs]
+      timing = item['timing']
+      writer.writerow(row + ['total', '', timing['wall'], timing['cpu']])
+      writer.writerow(row + ['check', '', timing['check']['wall']
+                                        , timing['check']['cpu']])
+      for name, timing in timing['conditions'].items():
+        writer.writerow(row + ['condition', name, timing['wall'], timing['cpu']])
+      for kind in others:
+        for name, timing in item['timing'].get(kind, {}).items():
+          writer.writerow(row + [kind, name, timing['wall'], timing['cpu']])
+    return
+
+  import json
+  run_timing = dict(run_timing)
+  if runner.jobs == 1:
+    # Everything outside of the check executions, e.g. computing the
+    # order or reporters. With worker processes the items overlap.
+    run_timing['other'] = {
+        'wall': run_timing['wall'] - sum(item['timing']['wall'] for item in items)
+      , 'cpu': run_timing['cpu'] - sum(item['timing']['cpu'] for item in items)
+    }
+  report = {
+      'run': run_timing
+    , 'checks': checks_total
+    , 'conditions': conditions
+  }
+  report.update(others)
+  report['items'] = items
+  json.dump(report, timings_file, indent=2)
+
+
+def get_theme(args):
+  from fontbakery.constants import NO_COLORS_THEME, DARK_THEME, LIGHT_THEME
+  if args.no_colors:
+    return NO_COLORS_THEME
+  if args.light_theme:
+    return LIGHT_THEME
+  if args.dark_theme:
+    return DARK_THEME
+  if sys.platform == "darwin":
+    # The vast majority of MacOS users seem to use a light-background on the text terminal
+    return LIGHT_THEME
+  # For orther systems like GNU+Linux and Windows, a dark terminal seems to be more common.
+  return DARK_THEME
+
+
 def get_module_from_file(filename):
   # filename = 'my/path/to/file.py'
   # module_name = 'file_module.file_py'
@@ -233,21 +418,7 @@ def main(profile=None, values=None):
     args.no_progress = True
     args.no_colors = True
 
-  from fontbakery.constants import NO_COLORS_THEME, DARK_THEME, LIGHT_THEME
-  if args.no_colors:
-    theme = NO_COLORS_THEME
-  else:
-    if args.light_theme:
-      theme = LIGHT_THEME
-    elif args.dark_theme:
-      theme = DARK_THEME
-    elif sys.platform == "darwin":
-      # The vast majority of MacOS users seem to use a light-background on the text terminal
-      theme = LIGHT_THEME
-    else:
-      # For orther systems like GNU+Linux and Windows, a dark terminal seems to be more common.
-      theme = DARK_THEME
-
+  theme = get_theme(args)
 
   if args.list_checks:
     if args.loglevels == [PASS]: # if verbose:
@@ -273,12 +444,38 @@ def main(profile=None, values=None):
       if hasattr(args, key):
         values_[key] = getattr(args, key)
 
+  result_cache = None
+  if args.result_cache:
+    from fontbakery import __version__
+    from fontbakery.result_cache import ResultCache
+    result_cache = ResultCache(args.result_cache
+                             , version=__version__
+                             , max_size=args.result_cache_size * 1024 * 1024)
+
+  if args.offline and not args.http_cache:
+    argument_parser.error('--offline needs an --http-cache.')
+  if args.http_cache or args.base_urls:
+    from fontbakery.fetcher import Fetcher, set_fetcher
+    set_fetcher(Fetcher(cache_dir=args.http_cache
+                      , offline=args.offline
+                      , base_urls=dict(args.base_urls)))
+
+  if args.link_cache:
+    from fontbakery.link_checker import LinkChecker, set_link_checker
+    set_link_checker(LinkChecker(cache_dir=args.link_cache))
+
   try:
     runner = CheckRunner(profile
                         , values=values_
                         , custom_order=args.order
                         , explicit_checks=args.checkid
                         , exclude_checks=args.exclude_checkid
+                        , jobs=args.jobs
+                        , evict_conditions=True
+                        , max_cached_conditions=args.max_cached_conditions
+                        , result_cache=result_cache
+                        , timings=bool(args.timings)
+                        , prefetch_workers=args.prefetch_workers
                         )
   except ValueValidationError as e:
     print(e)
@@ -303,6 +500,10 @@ def main(profile=None, values=None):
     sr = SerializeReporter(runner=runner, collect_results_by=args.gather_by)
     reporters.append(sr.receive)
 
+  if args.ndjson:
+    ndr = NDJSONReporter(args.ndjson, runner=runner)
+    reporters.append(ndr.receive)
+
   if args.ghmarkdown:
     mdr = GHMarkdownReporter(loglevels=args.loglevels,
                              runner=runner,
@@ -315,7 +516,14 @@ def main(profile=None, values=None):
                       collect_results_by=args.gather_by)
     reporters.append(hr.receive)
 
+  run_start = time.perf_counter(), time.process_time()
   distribute_generator(runner.run(), reporters)
+  run_timing = {'wall': time.perf_counter() - run_start[0]
+              , 'cpu': time.process_time() - run_start[1]}
+
+  if args.timings:
+    write_timings(runner, run_timing, args.timings)
+    print(f"Timings of checks and conditions have been saved to '{args.timings.name}'")
 
   if args.json:
     import json
@@ -323,6 +531,9 @@ def main(profile=None, values=None):
     print("A report in JSON format has been"
           " saved to '{}'".format(args.json.name))
 
+  if args.ndjson:
+    print(f"The events in NDJSON format have been saved to '{args.ndjson.name}'")
+
   if args.ghmarkdown:
     args.ghmarkdown.write(mdr.get_markdown())
     print("A report in GitHub Markdown format which can be useful\n"
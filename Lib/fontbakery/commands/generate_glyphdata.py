@@ -1,4 +1,4 @@
-"""Generate FontBakery's desired_glyph_data.json file.
+"""Generate FontBakery's data/desired_glyph_data.json file.
 
 The desired_glyph_data.json file contains the 'recommended' countour count
 for encoded glyphs. The contour counts are derived from fonts which were
@@ -12,6 +12,9 @@ be 2 or 3 contours, depending on whether its double story or single story.
 However, a quotedbl should have 2 contours, unless the font belongs to a
 display family.
 
+The file has one [NAME, CODEPOINT, [CONTOUR_COUNT, ...]] row per line,
+it is read by fontbakery.glyphdata.
+
 In the future, additional glyph data can be included. A good addition would
 be the 'recommended' anchor counts for each glyph.
 """
@@ -23,15 +26,6 @@ from fontbakery.utils import download_file, get_font_glyph_data
 from fontTools.ttLib import TTFont
 
 
-class JsonSetEncoder(json.JSONEncoder):
-    """Serialise Set objects for json module."""
-
-    def default(self, obj):  # pylint: disable=arguments-differ,method-hidden
-        if isinstance(obj, set):
-            return list(obj)
-        return json.JSONEncoder.default(self, obj)
-
-
 def collate_fonts_data(fonts_data):
     """Collate individual fonts data into a single glyph data list."""
     glyphs = {}
@@ -46,6 +40,16 @@ def collate_fonts_data(fonts_data):
     return glyphs.values()
 
 
+def dump_glyph_data(glyph_data, glyph_file):
+    """Write the glyph data in the format read by fontbakery.glyphdata."""
+    rows = [json.dumps([glyph['name'],
+                        glyph['unicode'],
+                        sorted(glyph['contours'])],
+                       separators=(',', ':'))
+            for glyph in glyph_data]
+    glyph_file.write('[\n' + ',\n'.join(rows) + '\n]\n')
+
+
 def main():
     git_ofl_prefix = 'http://github.com/google/fonts/raw/master/ofl/'
     git_ufl_prefix = 'http://github.com/google/fonts/raw/master/ufl/'
@@ -89,11 +93,12 @@ def main():
     glyph_data = collate_fonts_data(fonts_data)
 
     script_path = os.path.dirname(__file__)
-    glyph_data_path = os.path.join(script_path, '..', 'desired_glyph_data.json')
+    glyph_data_path = os.path.join(script_path, '..', 'data',
+                                   'desired_glyph_data.json')
 
     print(f'Saving to {glyph_data_path}')
-    with open(glyph_data_path, 'w') as glyph_file:
-        json.dump(glyph_data, glyph_file, indent=4, cls=JsonSetEncoder)
+    with open(glyph_data_path, 'w', encoding='utf-8') as glyph_file:
+        dump_glyph_data(glyph_data, glyph_file)
     print('done')
 
 
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# usage:
+# $ fontbakery check-googlefonts --ndjson events.ndjson fonts/*.ttf
+# $ fontbakery replay events.ndjson --html report.html --ghmarkdown report.md
+import argparse
+import sys
+
+from fontbakery.checkrunner import (
+              distribute_generator
+            , PASS
+            , ERROR
+            , FAIL
+            , STARTSECTION
+            , ENDSECTION
+            )
+from fontbakery.commands.check_profile import (
+              log_levels
+            , DEFAULT_LOG_LEVEL
+            , get_theme
+            )
+from fontbakery.reporters.terminal import TerminalReporter
+from fontbakery.reporters.serialize import SerializeReporter
+from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
+from fontbakery.reporters.html import HTMLReporter
+from fontbakery.reporters.ndjson import RecordedRun
+
+
+def ArgumentParser():
+  argument_parser = argparse.ArgumentParser(description="Report the results"
+                                  " of a run that was recorded with --ndjson,"
+                                  " without running the checks again.",
+                                  formatter_class=argparse.RawTextHelpFormatter)
+
+  argument_parser.add_argument('log', type=argparse.FileType('r', encoding="utf-8"),
+                      metavar='LOG',
+                      help='A file written by the --ndjson option of a check command.')
+
+  def log_levels_get(key):
+    if key in log_levels:
+      return log_levels[key]
+    raise argparse.ArgumentTypeError('Key "{}" must be one of: {}.'.format(
+                                          key, ', '.join(log_levels.keys())))
+  argument_parser.add_argument('-v', '--verbose', dest='loglevels', const=PASS, action='append_const',
+                      help='Shortcut for `-l PASS`.\n')
+
+  argument_parser.add_argument('-l', '--loglevel', dest='loglevels', type=log_levels_get,
+                      action='append',
+                      metavar= 'LOGLEVEL',
+                      help='Report checks with a result of this status or higher.\n'
+                           'One of: {}.\n'
+                           '(default: {})'.format(', '.join(log_levels.keys())
+                                                   , DEFAULT_LOG_LEVEL.name))
+
+  argument_parser.add_argument('-m', '--loglevel-messages', default=None, type=log_levels_get,
+                      help=('Report log messages of this status or higher.\n'
+                            'Messages are all status lines within a check.\n'
+                            'One of: {}.\n'
+                            '(default: LOGLEVEL)'
+                            ).format(', '.join(log_levels.keys())))
+
+  argument_parser.add_argument('-n', '--no-progress', action='store_true',
+                      help='In a tty as stdout, don\'t render the progress indicators.')
+
+  argument_parser.add_argument('-C', '--no-colors', action='store_true',
+                      help='No colors for tty output.')
+
+  argument_parser.add_argument('-S', '--show-sections', default=False, action='store_true',
+                      help='Show section start and end info plus summary.')
+
+  argument_parser.add_argument('--dark-theme', default=False, action='store_true',
+                      help='Use a color theme with dark colors.')
+
+  argument_parser.add_argument('--light-theme', default=False, action='store_true',
+                      help='Use a color theme with light colors.')
+
+  argument_parser.add_argument('--json', default=False, type=argparse.FileType('w'),
+                      metavar= 'JSON_FILE',
+                      help='Write a json formatted report to JSON_FILE.')
+
+  argument_parser.add_argument('--ghmarkdown', default=False, type=argparse.FileType('w'),
+                      metavar= 'MD_FILE',
+                      help='Write a GitHub-Markdown formatted report to MD_FILE.')
+
+  argument_parser.add_argument('--html', default=False,
+                      type=argparse.FileType('w', encoding="utf-8"),
+                      metavar= 'HTML_FILE',
+                      help='Write a HTML report to HTML_FILE.')
+
+  argument_parser.add_argument('-g','--gather-by', default=None,
+                      metavar= 'ITERATED_ARG',
+                      help='Optional: collect results by ITERATED_ARG\n'
+                      'In terminal output: create a summary counter for each ITERATED_ARG.\n'
+                      'In json output: structure the document by ITERATED_ARG.\n'
+                      'One of the iterated arguments of the run or "*check".')
+  return argument_parser
+
+
+def main(args=None):
+  argument_parser = ArgumentParser()
+  args = argument_parser.parse_args(args)
+
+  if sys.platform == "win32":
+    args.no_progress = True
+    args.no_colors = True
+
+  try:
+    recorded = RecordedRun(args.log)
+  except (ValueError, KeyError, StopIteration) as e:
+    argument_parser.error(f'Can\'t read "{args.log.name}": {e!r}')
+
+  if args.gather_by not in (None, '*check') \
+                              and args.gather_by not in recorded.iterargs:
+    argument_parser.error('--gather-by must be one of: {}'.format(
+                          ', '.join(list(recorded.iterargs) + ['*check'])))
+
+  # the most verbose loglevel wins
+  loglevel = min(args.loglevels) if args.loglevels else DEFAULT_LOG_LEVEL
+  tr = TerminalReporter(runner=recorded, is_async=False
+                       , print_progress=not args.no_progress
+                       , check_threshold=loglevel
+                       , log_threshold=args.loglevel_messages or loglevel
+                       , theme=get_theme(args)
+                       , collect_results_by=args.gather_by
+                       , skip_status_report=None if args.show_sections\
+                                                      else (STARTSECTION, ENDSECTION)
+                       )
+  reporters = [tr.receive]
+
+  if args.json:
+    sr = SerializeReporter(runner=recorded, collect_results_by=args.gather_by)
+    reporters.append(sr.receive)
+
+  if args.ghmarkdown:
+    mdr = GHMarkdownReporter(loglevels=args.loglevels,
+                             runner=recorded,
+                             collect_results_by=args.gather_by)
+    reporters.append(mdr.receive)
+
+  if args.html:
+    hr = HTMLReporter(loglevels=args.loglevels,
+                      runner=recorded,
+                      collect_results_by=args.gather_by)
+    reporters.append(hr.receive)
+
+  distribute_generator(recorded.run(), reporters)
+
+  if args.json:
+    import json
+    json.dump(sr.getdoc(), args.json, sort_keys=True, indent=4)
+    print("A report in JSON format has been"
+          " saved to '{}'".format(args.json.name))
+
+  if args.ghmarkdown:
+    args.ghmarkdown.write(mdr.get_markdown())
+    print("A report in GitHub Markdown format which can be useful\n"
+          " for posting issues on a GitHub issue tracker has been\n"
+          " saved to '{}'".format(args.ghmarkdown.name))
+
+  if args.html:
+    args.html.write(hr.get_html())
+    print(f"A report in HTML format has been saved to '{args.html.name}'")
+
+  # Fail and error let the command fail
+  return 1 if tr.worst_check_status in (ERROR, FAIL) else 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
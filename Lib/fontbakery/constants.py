@@ -744,6 +744,7 @@ CJK_CODEPAGE_BITS = {
   "Chinese: Traditional chars—Taiwan and Hong Kong": 20,
   "Korean Johab": 21
 }
+CJK_CODEPAGE_MASK = sum(1 << bit for bit in CJK_CODEPAGE_BITS.values())
 
 
 # FIXME: This is a bit redundant with UNICODERANGE_DATA:
@@ -761,6 +762,9 @@ CJK_UNICODE_RANGE_BITS = {
   'CJK Strokes': 61,
   'Yi Syllables': 83
 }
+# The bits above as a mask of the UnicodeRange fields of the OS/2 table
+# combined into one integer (ulUnicodeRange1 are the lowest 32 bits).
+CJK_UNICODE_RANGE_MASK = sum(1 << bit for bit in CJK_UNICODE_RANGE_BITS.values())
 
 
 # FIXME: This is a bit redundant with UNICODERANGE_DATA:
@@ -0,0 +1,196 @@
+"""
+Font Bakery fetcher downloads remote resources, e.g. the families that
+are hosted on Google Fonts, through an optional on-disk HTTP cache.
+
+All conditions of a process share one Fetcher (see `get_fetcher`):
+  * with a `cache_dir`, responses are stored, one pair of files per URL,
+    and reused until they are older than `max_age`. Then they are
+    revalidated with their ETag or Last-Modified date, an unchanged
+    resource is not downloaded again. Server errors (5xx) are not
+    stored.
+  * `offline` serves only from the cache, regardless of the age of the
+    entries. A URL that is not in the cache raises OfflineError.
+  * `base_urls` maps URL prefixes to the prefixes of mirrors, e.g.
+    {'https://fonts.google.com/': 'http://localhost:8000/gfonts/'}, the
+    longest matching prefix is replaced.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+from collections import namedtuple
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_MAX_AGE = 24 * 60 * 60 # seconds
+DEFAULT_TIMEOUT = 60 # seconds
+
+
+class OfflineError(Exception):
+  """ A resource is requested offline and is not in the cache. """
+
+
+# status_code: of the final response, after redirects
+# content: bytes
+# headers: {lower case name: value} of the cached headers
+FetchResponse = namedtuple('FetchResponse', ['url', 'status_code'
+                                           , 'content', 'headers'])
+
+# the headers that are stored with a response
+_CACHED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+
+class Fetcher:
+  """
+  usage:
+  >> fetcher = Fetcher(cache_dir='~/.cache/fontbakery-http')
+  >> response = fetcher.fetch(url)
+  >> if response.status_code == 200: ...
+  """
+  def __init__(self, cache_dir=None, offline=False, base_urls=None
+             , max_age=DEFAULT_MAX_AGE, timeout=DEFAULT_TIMEOUT):
+    self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+    if self.cache_dir:
+      os.makedirs(self.cache_dir, exist_ok=True)
+    self.offline = offline
+    # longest prefix first
+    self.base_urls = sorted((base_urls or {}).items()
+                          , key=lambda item: len(item[0]), reverse=True)
+    self.max_age = max_age
+    self.timeout = timeout
+    # url: Lock, one download of a URL at a time
+    self._locks = {}
+    self._locks_lock = threading.Lock()
+
+  def resolve(self, url):
+    """ The URL that is requested for url, with base_urls applied. """
+    for prefix, mirror in self.base_urls:
+      if url.startswith(prefix):
+        return mirror + url[len(prefix):]
+    return url
+
+  def _paths(self, url):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    path = os.path.join(self.cache_dir, key)
+    return f'{path}.json', f'{path}.body'
+
+  def _load(self, url):
+    """ Returns (time, FetchResponse) or None. """
+    if not self.cache_dir:
+      return None
+    meta_path, body_path = self._paths(url)
+    try:
+      with open(meta_path, encoding='utf-8') as f:
+        meta = json.load(f)
+      with open(body_path, 'rb') as f:
+        content = f.read()
+    except (OSError, ValueError):
+      return None
+    if meta.get('url') != url:
+      return None
+    return meta['time'], FetchResponse(url, meta['status_code']
+                                     , content, meta['headers'])
+
+  def _write(self, path, data):
+    # write atomically, other processes may read or write the same URL.
+    fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+      os.replace(tmp_path, path)
+    except:
+      os.unlink(tmp_path)
+      raise
+
+  def _store(self, response, content_changed=True):
+    if not self.cache_dir or response.status_code >= 500:
+      return
+    meta_path, body_path = self._paths(response.url)
+    if content_changed:
+      self._write(body_path, response.content)
+    self._write(meta_path, json.dumps({'url': response.url
+                                     , 'status_code': response.status_code
+                                     , 'headers': response.headers
+                                     , 'time': time.time()}).encode('utf-8'))
+
+  def _request(self, url, cached=None):
+    from urllib.request import Request, urlopen
+    from urllib.error import HTTPError
+    request = Request(url)
+    if cached is not None:
+      if 'etag' in cached.headers:
+        request.add_header('If-None-Match', cached.headers['etag'])
+      if 'last-modified' in cached.headers:
+        request.add_header('If-Modified-Since', cached.headers['last-modified'])
+    try:
+      with urlopen(request, timeout=self.timeout) as response:
+        status_code, headers, content = response.status, response.headers \
+                                      , response.read()
+    except HTTPError as e:
+      status_code, headers, content = e.code, e.headers, e.read()
+    headers = {name: headers[name] for name in _CACHED_HEADERS
+                                   if name in headers}
+    return FetchResponse(url, status_code, content, headers)
+
+  def _lock(self, url):
+    with self._locks_lock:
+      return self._locks.setdefault(url, threading.Lock())
+
+  def fetch(self, url):
+    """ GET url, or its mirror, from the cache or from the network.
+
+    Returns a FetchResponse, also for HTTP error statuses. Network
+    errors raise urllib.error.URLError, a URL that is requested offline
+    and not cached raises OfflineError.
+    """
+    url = self.resolve(url)
+    with self._lock(url):
+      loaded = self._load(url)
+      if self.offline:
+        if loaded is None:
+          raise OfflineError(f'"{url}" is not in the HTTP cache'
+                             f' ({self.cache_dir}), it can\'t be'
+                             f' downloaded offline.')
+        return loaded[1]
+      if loaded is not None:
+        cached_time, cached = loaded
+        if time.time() - cached_time <= self.max_age:
+          return cached
+      else:
+        cached = None
+      response = self._request(url, cached)
+      if response.status_code == 304 and cached is not None:
+        self._store(cached, content_changed=False)
+        return cached
+      self._store(response)
+      return response
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher():
+  """ The Fetcher shared by all conditions of this process. """
+  global _fetcher
+  with _fetcher_lock:
+    if _fetcher is None:
+      _fetcher = Fetcher()
+    return _fetcher
+
+
+def set_fetcher(fetcher):
+  """ Replace the Fetcher returned by get_fetcher, e.g. to configure a
+  cache directory, offline mode or mirrors.
+  """
+  global _fetcher
+  with _fetcher_lock:
+    _fetcher = fetcher
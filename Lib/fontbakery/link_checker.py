@@ -0,0 +1,200 @@
+"""
+Font Bakery link checker tests whether hyperlinks are reachable.
+
+All checks of a process share one LinkChecker (see `get_link_checker`):
+  * each URL is requested only once, concurrent requests for the same
+    URL wait for the first one, the results are kept in memory.
+  * the URLs of a `check` call are requested concurrently, with a
+    pooled session that keeps the connections to a host alive.
+  * optionally, the responses are stored in a directory, one file per
+    URL, and reused by later runs until they are older than `max_age`.
+    Timeouts and connection errors are not stored, they are often
+    temporary.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+DEFAULT_TIMEOUT = 10 # seconds
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_AGE = 24 * 60 * 60 # seconds
+
+
+class LinkStatus(namedtuple('LinkStatus', ['url', 'status_code', 'error'])):
+  """ The result of requesting url.
+
+  status_code: the HTTP status code of the response after following the
+      redirects, None if there was no response.
+  error: None, 'timeout' or the description of another request error.
+  """
+  __slots__ = ()
+
+  @property
+  def ok(self):
+    return self.status_code == 200
+
+  @property
+  def timed_out(self):
+    return self.error == 'timeout'
+
+
+class LinkChecker:
+  """
+  usage:
+  >> checker = LinkChecker(cache_dir='~/.cache/fontbakery-links')
+  >> for url, status in checker.check(urls).items():
+  >>   if not status.ok: ...
+  """
+  def __init__(self, timeout=DEFAULT_TIMEOUT, max_workers=DEFAULT_MAX_WORKERS
+             , cache_dir=None, max_age=DEFAULT_MAX_AGE):
+    self.timeout = timeout
+    self.max_workers = max_workers
+    self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+    if self.cache_dir:
+      os.makedirs(self.cache_dir, exist_ok=True)
+    self.max_age = max_age
+    self._lock = threading.Lock()
+    # url: Future of LinkStatus
+    self._results = {}
+    self._session = None
+    self._session_pid = None
+
+  def _get_session(self):
+    # A session must not be shared with a forked process, the
+    # connections of its pool would be used by both.
+    with self._lock:
+      if self._session is None or self._session_pid != os.getpid():
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers
+                            , pool_maxsize=self.max_workers)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        self._session = session
+        self._session_pid = os.getpid()
+      return self._session
+
+  def _cache_path(self, url):
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return os.path.join(self.cache_dir, f'{key}.json')
+
+  def _load(self, url):
+    if not self.cache_dir:
+      return None
+    try:
+      with open(self._cache_path(url), encoding='utf-8') as f:
+        data = json.load(f)
+    except (OSError, ValueError):
+      return None
+    if data.get('url') != url \
+        or time.time() - data.get('time', 0) > self.max_age:
+      return None
+    return LinkStatus(url, data['status_code'], None)
+
+  def _store(self, status):
+    if not self.cache_dir or status.status_code is None:
+      return
+    serialized = json.dumps({'url': status.url
+                           , 'status_code': status.status_code
+                           , 'time': time.time()})
+    # write atomically, other processes may read or write the same URL.
+    fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(serialized)
+      os.replace(tmp_path, self._cache_path(status.url))
+    except:
+      os.unlink(tmp_path)
+      raise
+
+  def _request(self, url):
+    import requests
+    try:
+      response = self._get_session().head(url, allow_redirects=True
+                                        , timeout=self.timeout)
+    except requests.exceptions.Timeout:
+      return LinkStatus(url, None, 'timeout')
+    except requests.exceptions.RequestException as e:
+      return LinkStatus(url, None, f'{type(e).__name__}: {e}')
+    return LinkStatus(url, response.status_code, None)
+
+  def _fetch(self, url, future):
+    try:
+      status = self._load(url)
+      if status is None:
+        status = self._request(url)
+        self._store(status)
+    except Exception as e:
+      # not kept, the next check of url tries again
+      with self._lock:
+        self._results.pop(url, None)
+      future.set_exception(e)
+      return
+    future.set_result(status)
+
+  def check(self, urls):
+    """ Request all urls, at most max_workers at a time.
+
+    Returns {url: LinkStatus} for the distinct urls.
+    """
+    futures = {}
+    todo = []
+    with self._lock:
+      for url in urls:
+        if url in futures:
+          continue
+        future = self._results.get(url)
+        if future is None:
+          future = self._results[url] = Future()
+          todo.append(url)
+        futures[url] = future
+
+    if len(todo) == 1:
+      self._fetch(todo[0], futures[todo[0]])
+    elif todo:
+      with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        for url in todo:
+          executor.submit(self._fetch, url, futures[url])
+    return {url: future.result() for url, future in futures.items()}
+
+  def clear(self):
+    """ Forget the results kept in memory. """
+    with self._lock:
+      self._results = {url: future for url, future in self._results.items()
+                                   if not future.done()}
+
+
+_link_checker = None
+_link_checker_lock = threading.Lock()
+
+
+def get_link_checker():
+  """ The LinkChecker shared by all checks of this process. """
+  global _link_checker
+  with _link_checker_lock:
+    if _link_checker is None:
+      _link_checker = LinkChecker()
+    return _link_checker
+
+
+def set_link_checker(link_checker):
+  """ Replace the LinkChecker returned by get_link_checker, e.g. to
+  configure a cache directory.
+  """
+  global _link_checker
+  with _link_checker_lock:
+    _link_checker = link_checker
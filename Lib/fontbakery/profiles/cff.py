@@ -16,34 +16,78 @@ def _get_subr_bias(count):
     return bias
 
 
-def _traverse_subr_call_tree(info, program, depth):
-    global_subrs = info['global_subrs']
-    subrs = info['subrs']
-    gsubr_bias = info['gsubr_bias']
-    subr_bias = info['subr_bias']
+# The "Subr nesting, stack limit" of the charstring formats.
+MAX_CALL_DEPTH = 10
 
-    if depth > info['max_depth']:
-        info['max_depth'] = depth
 
-    # once we exceed the max depth we can stop going deeper
-    if depth > 10:
-        return
-
-    while program:
-        x = program.pop()
+def _subr_calls(program, global_subrs, gsubr_bias, subrs, subr_bias):
+    """The (subrs, index) called by a charstring program. Like the
+    interpreter, the subr number is the operand right before the call."""
+    i = len(program) - 1
+    while i >= 0:
+        x = program[i]
+        i -= 1
         if x == 'callgsubr':
-            y = int(program.pop()) + gsubr_bias
-            sub_program = global_subrs[y].program.copy()
-            _traverse_subr_call_tree(info, sub_program, depth + 1)
+            yield global_subrs, int(program[i]) + gsubr_bias
+            i -= 1
         elif x == 'callsubr':
-            y = int(program.pop()) + subr_bias
-            sub_program = subrs[y].program.copy()
-            _traverse_subr_call_tree(info, sub_program, depth + 1)
-
+            yield subrs, int(program[i]) + subr_bias
+            i -= 1
+
+
+class _SubrCallDepths:
+    """The call depth of the subrs of a font dict, each subr walked once.
+
+    The depth of a subr is 1 plus the deepest depth of the subrs it calls.
+    Depths are capped at MAX_CALL_DEPTH + 1, which is also the depth of
+    subrs that call themselves.
+    """
+    def __init__(self, global_subrs, gsubr_bias, subrs, subr_bias):
+        self._subrs = (global_subrs, gsubr_bias, subrs, subr_bias)
+        # (id(subrs), index): depth
+        self._depths = {}
+
+    def calls(self, program):
+        return _subr_calls(program, *self._subrs)
+
+    def max_depth(self, program):
+        """The deepest call depth of the subrs called by a charstring
+        program, 0 if it calls none."""
+        return max((self._depth(subrs, index)
+                    for subrs, index in self.calls(program)), default=0)
+
+    def _depth(self, subrs, index):
+        # an explicit stack, chains of subrs may be deeper than Python allows
+        cap = MAX_CALL_DEPTH + 1
+        key = (id(subrs), index)
+        if key in self._depths:
+            return self._depths[key]
+        in_progress = {key}
+        stack = [[key, self.calls(subrs[index].program), 1]]
+        while stack:
+            frame = stack[-1]
+            for callee_subrs, callee_index in frame[1]:
+                callee = (id(callee_subrs), callee_index)
+                if callee in self._depths:
+                    frame[2] = max(frame[2], 1 + self._depths[callee])
+                elif callee in in_progress:
+                    frame[2] = cap
+                else:
+                    in_progress.add(callee)
+                    stack.append([callee,
+                                  self.calls(callee_subrs[callee_index].program),
+                                  1])
+                    break
+            else:
+                stack.pop()
+                depth = self._depths[frame[0]] = min(frame[2], cap)
+                in_progress.discard(frame[0])
+                if stack:
+                    stack[-1][2] = max(stack[-1][2], 1 + depth)
+        return self._depths[key]
 
-def _check_call_depth(top_dict, private_dict, fd_index=0):
-    char_strings = top_dict.CharStrings
 
+def _get_subr_call_depths(top_dict, private_dict):
     global_subrs = top_dict.GlobalSubrs
     gsubr_bias = _get_subr_bias(len(global_subrs))
 
@@ -53,14 +97,31 @@ def _check_call_depth(top_dict, private_dict, fd_index=0):
     else:
         subrs = None
         subr_bias = None
+    return _SubrCallDepths(global_subrs, gsubr_bias, subrs, subr_bias)
 
-    char_list = char_strings.keys()
+
+def _get_glyphs_by_fd(top_dict):
+    """[[glyph_name, ...], ...] the glyphs of each font dict of the FDArray.
+    Glyphs without an FDSelect index are in all of them."""
+    char_strings = top_dict.CharStrings
+    glyphs_by_fd = [[] for _ in top_dict.FDArray]
+    for glyph_name in char_strings.keys():
+        _, fd_select_index = char_strings.getItemAndSelector(glyph_name)
+        if fd_select_index is None:
+            for glyph_names in glyphs_by_fd:
+                glyph_names.append(glyph_name)
+        elif fd_select_index < len(glyphs_by_fd):
+            glyphs_by_fd[fd_select_index].append(glyph_name)
+    return glyphs_by_fd
+
+
+def _check_call_depth(top_dict, private_dict, glyph_names):
+    char_strings = top_dict.CharStrings
+    # the depths of the subrs are shared by all glyphs of the font dict
+    call_depths = _get_subr_call_depths(top_dict, private_dict)
     failed = False
-    for glyph_name in char_list:
-        t2_char_string, fd_select_index = char_strings.getItemAndSelector(
-            glyph_name)
-        if fd_select_index is not None and fd_select_index != fd_index:
-            continue
+    for glyph_name in glyph_names:
+        t2_char_string = char_strings[glyph_name]
         try:
             t2_char_string.decompile()
         except RecursionError:
@@ -70,25 +131,30 @@ def _check_call_depth(top_dict, private_dict, fd_index=0):
                           f' glyph "{glyph_name}".')
             failed = True
             continue
-        info = dict()
-        info['subrs'] = subrs
-        info['global_subrs'] = global_subrs
-        info['gsubr_bias'] = gsubr_bias
-        info['subr_bias'] = subr_bias
-        info['max_depth'] = 0
-        depth = 0
-        program = t2_char_string.program.copy()
-        _traverse_subr_call_tree(info, program, depth)
-        max_depth = info['max_depth']
-        if max_depth > 10:
+        max_depth = call_depths.max_depth(t2_char_string.program)
+        if max_depth > MAX_CALL_DEPTH:
             yield FAIL,\
                   Message("max-depth",
                           f'Subroutine call depth exceeded'
-                          f' maximum of 10 for glyph "{glyph_name}".')
+                          f' maximum of {MAX_CALL_DEPTH} for glyph "{glyph_name}".')
             failed = True
     return failed
 
 
+def _check_font_dicts_call_depth(top_dict):
+    any_failures = False
+    for font_dict, glyph_names in zip(top_dict.FDArray,
+                                      _get_glyphs_by_fd(top_dict)):
+        if hasattr(font_dict, 'Private'):
+            private_dict = font_dict.Private
+        else:
+            private_dict = None
+        failed = yield from \
+            _check_call_depth(top_dict, private_dict, glyph_names)
+        any_failures = any_failures or failed
+    return any_failures
+
+
 @check(
   id = 'com.adobe.fonts/check/cff_call_depth',
   conditions = ['is_cff'],
@@ -103,21 +169,16 @@ def com_adobe_fonts_check_cff_call_depth(ttFont):
 
     for top_dict in cff.topDictIndex:
         if hasattr(top_dict, 'FDArray'):
-            for fd_index, font_dict in enumerate(top_dict.FDArray):
-                if hasattr(font_dict, 'Private'):
-                    private_dict = font_dict.Private
-                else:
-                    private_dict = None
-                failed = yield from \
-                    _check_call_depth(top_dict, private_dict, fd_index)
-                any_failures = any_failures or failed
+            failed = yield from _check_font_dicts_call_depth(top_dict)
         else:
             if hasattr(top_dict, 'Private'):
                 private_dict = top_dict.Private
             else:
                 private_dict = None
-            failed = yield from _check_call_depth(top_dict, private_dict)
-            any_failures = any_failures or failed
+            failed = yield from \
+                _check_call_depth(top_dict, private_dict,
+                                  top_dict.CharStrings.keys())
+        any_failures = any_failures or failed
 
     if not any_failures:
         yield PASS, 'Maximum call depth not exceeded.'
@@ -136,14 +197,8 @@ def com_adobe_fonts_check_cff2_call_depth(ttFont):
     cff = ttFont['CFF2'].cff
 
     for top_dict in cff.topDictIndex:
-        for fd_index, font_dict in enumerate(top_dict.FDArray):
-            if hasattr(font_dict, 'Private'):
-                private_dict = font_dict.Private
-            else:
-                private_dict = None
-            failed = yield from \
-                _check_call_depth(top_dict, private_dict, fd_index)
-            any_failures = any_failures or failed
+        failed = yield from _check_font_dicts_call_depth(top_dict)
+        any_failures = any_failures or failed
 
     if not any_failures:
         yield PASS, 'Maximum call depth not exceeded.'
@@ -88,33 +88,10 @@ def com_google_fonts_check_fontvalidator(font):
     "The device table's DeltaFormat value is invalid"
   ]
 
-  from fontTools.ttLib import TTFont
-  if is_variable_font(TTFont(font)):
+  from fontbakery.utils import get_shared_ttFont
+  if is_variable_font(get_shared_ttFont(font)):
     disabled_fval_checks.extend(VARFONT_disabled_fval_checks)
 
-  try:
-    import subprocess
-    fval_cmd = [
-        "FontValidator", "-file", font, "-all-tables",
-        "-report-in-font-dir", "-no-raster-tests"
-    ]
-    subprocess.check_output(fval_cmd, stderr=subprocess.STDOUT)
-  except subprocess.CalledProcessError as e:
-    filtered_msgs = ""
-    for line in e.output.decode().split("\n"):
-      disable_it = False
-      for substring in disabled_fval_checks:
-        if substring in line:
-          disable_it = True
-      if not disable_it:
-        filtered_msgs += line + "\n"
-    yield INFO, ("Microsoft Font Validator returned an error code."
-                 " Output follows :\n\n{}\n").format(filtered_msgs)
-  except (OSError, IOError) as error:
-    yield ERROR, ("Mono runtime and/or "
-                  "Microsoft Font Validator are not available!")
-    raise error
-
   def report_message(msg, details):
     if details:
       if isinstance(details, list) and len(details) > 1:
@@ -137,43 +114,60 @@ def com_google_fonts_check_fontvalidator(font):
     else:
       return f"MS-FonVal: {msg}"
 
-  xml_report_file = f"{font}.report.xml"
-  html_report_file = f"{font}.report.html"
-  fval_file = os.path.join(os.path.dirname(font), 'fval.xsl')
-
-  grouped_msgs = {}
-  with open(xml_report_file, "rb") as xml_report:
-    from lxml import etree
-    doc = etree.fromstring(xml_report.read())
-    for report in doc.iterfind('.//Report'):
-      msg = report.get("Message")
-      details = report.get("Details")
-
-      disable_it = False
-      for substring in disabled_fval_checks:
-        if substring in msg:
-          disable_it = True
-      if disable_it:
-        continue
-
-      if msg not in grouped_msgs:
-        grouped_msgs[msg] = {"errortype": report.get("ErrorType"),
-                             "details": [details]}
-      else:
-        if details not in grouped_msgs[msg]["details"]:
-          # avoid cluttering the output with tons of identical reports
-          # yield INFO, 'grouped_msgs[msg]["details"]: {}'.format(grouped_msgs[msg]["details"])
-          grouped_msgs[msg]["details"].append(details)
-
-  # ---------------------------
-  # Clean-up generated files...
-  os.remove(xml_report_file)
-  # FontVal internal detail: HTML report generated only on non-Windows due to
-  # Mono or the used HTML renderer not being able to render XML with a
-  # stylesheet directly. https://github.com/googlefonts/fontbakery/issues/1747
-  if os.path.exists(html_report_file):
-    os.remove(html_report_file)
-  os.remove(fval_file)
+  # The reports are written to a directory of our own, which is removed
+  # afterwards: the directory of the font may be read-only, and other
+  # checks may run FontValidator on the same font at the same time.
+  import tempfile
+  with tempfile.TemporaryDirectory() as report_dir:
+    try:
+      import subprocess
+      fval_cmd = [
+          "FontValidator", "-file", font, "-all-tables",
+          "-report-dir", report_dir, "-no-raster-tests"
+      ]
+      subprocess.check_output(fval_cmd, stderr=subprocess.STDOUT)
+    except subprocess.CalledProcessError as e:
+      filtered_msgs = ""
+      for line in e.output.decode().split("\n"):
+        disable_it = False
+        for substring in disabled_fval_checks:
+          if substring in line:
+            disable_it = True
+        if not disable_it:
+          filtered_msgs += line + "\n"
+      yield INFO, ("Microsoft Font Validator returned an error code."
+                   " Output follows :\n\n{}\n").format(filtered_msgs)
+    except (OSError, IOError) as error:
+      yield ERROR, ("Mono runtime and/or "
+                    "Microsoft Font Validator are not available!")
+      raise error
+
+    xml_report_file = os.path.join(report_dir,
+                                   f"{os.path.basename(font)}.report.xml")
+
+    grouped_msgs = {}
+    with open(xml_report_file, "rb") as xml_report:
+      from lxml import etree
+      doc = etree.fromstring(xml_report.read())
+      for report in doc.iterfind('.//Report'):
+        msg = report.get("Message")
+        details = report.get("Details")
+
+        disable_it = False
+        for substring in disabled_fval_checks:
+          if substring in msg:
+            disable_it = True
+        if disable_it:
+          continue
+
+        if msg not in grouped_msgs:
+          grouped_msgs[msg] = {"errortype": report.get("ErrorType"),
+                               "details": [details]}
+        else:
+          if details not in grouped_msgs[msg]["details"]:
+            # avoid cluttering the output with tons of identical reports
+            # yield INFO, 'grouped_msgs[msg]["details"]: {}'.format(grouped_msgs[msg]["details"])
+            grouped_msgs[msg]["details"].append(details)
 
   # ---------------------------
   # Here we start emitting the grouped log messages
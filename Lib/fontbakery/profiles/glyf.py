@@ -49,17 +49,29 @@ def com_google_fonts_check_glyf_unused_data(ttFont):
   misc_metadata = {
     'request': 'https://github.com/googlefonts/fontbakery/issues/735'
   })
-def com_google_fonts_check_points_out_of_bounds(ttFont):
+def com_google_fonts_check_points_out_of_bounds(ttFont, glyph_outlines):
   """Check for points out of bounds."""
   from fontbakery.utils import pretty_print_list
   failed = False
   out_of_bounds = []
-  for glyphName in ttFont['glyf'].keys():
-    glyph = ttFont['glyf'][glyphName]
-    coords = glyph.getCoordinates(ttFont['glyf'])[0]
-    for x, y in coords:
-      if round(x) < glyph.xMin or round(x) > glyph.xMax or \
-         round(y) < glyph.yMin or round(y) > glyph.yMax or \
+  for glyphName in glyph_outlines.glyph_names:
+    outline = glyph_outlines[glyphName]
+    if not outline.coordinates:
+      continue
+    xMin, yMin, xMax, yMax = outline.bounds
+    xs = outline.coordinates[0::2]
+    ys = outline.coordinates[1::2]
+    # round() is monotonic: if the extremes are within the bounds,
+    # all points are.
+    x_low, x_high, y_low, y_high = min(xs), max(xs), min(ys), max(ys)
+    if round(x_low) >= xMin and round(x_high) <= xMax and \
+       round(y_low) >= yMin and round(y_high) <= yMax and \
+       max(-x_low, x_high, -y_low, y_high) <= 32766:
+      continue
+
+    for x, y in glyph_outlines.points(glyphName):
+      if round(x) < xMin or round(x) > xMax or \
+         round(y) < yMin or round(y) > yMax or \
          abs(x) > 32766 or abs(y) > 32766:
         failed = True
         out_of_bounds.append((glyphName, x, y))
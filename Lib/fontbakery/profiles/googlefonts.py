@@ -174,10 +174,9 @@ GOOGLEFONTS_PROFILE_CHECKS = \
 )
 def com_google_fonts_check_canonical_filename(font):
   """Checking file is named canonically."""
-  from fontTools.ttLib import TTFont
   from .shared_conditions import is_variable_font
   from .googlefonts_conditions import canonical_stylename
-  from fontbakery.utils import suffix
+  from fontbakery.utils import suffix, get_shared_ttFont
   from fontbakery.constants import (STATIC_STYLE_NAMES,
                                     MacStyle)
 
@@ -205,7 +204,7 @@ def com_google_fonts_check_canonical_filename(font):
                   f' It must not contain underscore characters!')
     return
 
-  ttFont = TTFont(font)
+  ttFont = get_shared_ttFont(font)
   if is_variable_font(ttFont):
     if suffix(font) in STATIC_STYLE_NAMES:
       failed = True
@@ -246,34 +245,35 @@ def com_google_fonts_check_canonical_filename(font):
     The snippet of HTML in the DESCRIPTION.en_us.html file is added to the font family webpage on the Google Fonts website. For that reason, all hyperlinks in it must be properly working. 
   """
 )
-def com_google_fonts_check_description_broken_links(description):
+def com_google_fonts_check_description_broken_links(description, link_checker):
   """Does DESCRIPTION file contain broken links?"""
-  import requests
   from lxml import etree
   doc = etree.fromstring("<html>" + description + "</html>")
+  links = [a_href.get("href") for a_href in doc.iterfind('.//a[@href]')]
+  emails = [link for link in links
+                 if link.startswith("mailto:") and \
+                    "@" in link and \
+                    "." in link.split("@")[1]]
+  statuses = link_checker.check([link for link in links
+                                      if link not in emails])
   broken_links = []
-  for a_href in doc.iterfind('.//a[@href]'):
-    link = a_href.get("href")
-    if link.startswith("mailto:") and \
-       "@" in link and \
-       "." in link.split("@")[1]:
+  for link in links:
+    if link in emails:
       yield INFO,\
             Message("email",
                     f"Found an email address: {link}")
       continue
 
-    try:
-      response = requests.head(link, allow_redirects=True, timeout=10)
-      code = response.status_code
-      if code != requests.codes.ok:
-        broken_links.append(f"{link} (status code: {code})")
-    except requests.exceptions.Timeout:
+    status = statuses[link]
+    if status.timed_out:
       yield WARN,\
             Message("timeout",
                     f"Timedout while attempting to access: '{link}'."
                     f" Please verify if that's a broken link.")
-    except requests.exceptions.RequestException:
+    elif status.status_code is None:
       broken_links.append(link)
+    elif not status.ok:
+      broken_links.append(f"{link} (status code: {status.status_code})")
 
   if len(broken_links) > 0:
     broken_links_list = '\n\t'.join(broken_links)
@@ -457,16 +457,14 @@ def com_google_fonts_check_metadata_designer_values(family_metadata):
   id = 'com.google.fonts/check/metadata/broken_links',
   conditions = ['family_metadata']
 )
-def com_google_fonts_check_metadata_broken_links(family_metadata):
+def com_google_fonts_check_metadata_broken_links(family_metadata, link_checker):
   """Does METADATA.pb copyright field contain broken links?"""
-  import requests
-  broken_links = []
+  # a link or an email address per font
+  links = []
   for font_metadata in family_metadata.fonts:
     copyright = font_metadata.copyright
     if "mailto:" in copyright:
-      yield INFO,\
-            Message("email",
-                    f"Found an email address: {copyright}")
+      links.append((None, copyright))
       continue
 
     if "http" in copyright:
@@ -475,19 +473,27 @@ def com_google_fonts_check_metadata_broken_links(family_metadata):
       for endchar in [' ', ')']:
         if endchar in link:
           link = link.split(endchar)[0]
+      links.append((link, None))
 
-      try:
-        response = requests.head(link, allow_redirects=True, timeout=10)
-        code = response.status_code
-        if code != requests.codes.ok:
-          broken_links.append(("{} (status code: {})").format(link, code))
-      except requests.exceptions.Timeout:
-        yield WARN,\
-              Message("timeout",
-                      f"Timed out while attempting to access: '{link}'."
-                      f" Please verify if that's a broken link.")
-      except requests.exceptions.RequestException:
-        broken_links.append(link)
+  statuses = link_checker.check([link for link, _ in links if link])
+  broken_links = []
+  for link, email in links:
+    if email:
+      yield INFO,\
+            Message("email",
+                    f"Found an email address: {email}")
+      continue
+
+    status = statuses[link]
+    if status.timed_out:
+      yield WARN,\
+            Message("timeout",
+                    f"Timed out while attempting to access: '{link}'."
+                    f" Please verify if that's a broken link.")
+    elif status.status_code is None:
+      broken_links.append(link)
+    elif not status.ok:
+      broken_links.append(("{} (status code: {})").format(link, status.status_code))
 
   if len(broken_links) > 0:
     broken_links_list = '\n\t'.join(broken_links)
@@ -1480,15 +1486,17 @@ def com_google_fonts_check_metadata_profiles_csv(family_metadata):
                   'Found "Multiple Designers" at METADATA.pb, which'
                   ' is OK, so we won\'t look for it at profiles.csv')
   else:
-    from urllib import request
+    from fontbakery.utils import download_file
     import csv
+    import io
     try:
-      handle = request.urlopen(PROFILES_RAW_URL)
+      handle = io.TextIOWrapper(download_file(PROFILES_RAW_URL),
+                                encoding="utf-8")
       designers = []
       for row in csv.reader(handle):
         if not row:
           continue
-        designers.append(row[0].decode("utf-8"))
+        designers.append(row[0])
       if family_metadata.designer not in designers:
         yield WARN,\
               Message("not-listed",
@@ -1496,7 +1504,7 @@ def com_google_fonts_check_metadata_profiles_csv(family_metadata):
                       f' Designer "{family_metadata.designer}" is'
                       f' not listed in CSV file at {PROFILES_GIT_URL}')
       else:
-        yield PASS, ('Found designer "{family_metadata.designer}"'
+        yield PASS, (f'Found designer "{family_metadata.designer}"'
                      ' at profiles.csv')
     except:
       yield WARN,\
@@ -1697,15 +1705,17 @@ def com_google_fonts_check_metadata_regular_is_400(family_metadata):
   id = 'com.google.fonts/check/metadata/nameid/family_name',
   conditions=['font_metadata']
 )
-def com_google_fonts_check_metadata_nameid_family_name(ttFont, font_metadata):
+def com_google_fonts_check_metadata_nameid_family_name(ttFont, font_metadata, name_index):
   """Checks METADATA.pb font.name field matches
      family name declared on the name table.
   """
   from fontbakery.utils import get_name_entry_strings
 
-  familynames = get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME)
+  familynames = get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME,
+                                       name_index=name_index)
   if not familynames:
-      familynames = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME)
+      familynames = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME,
+                                           name_index=name_index)
   if len(familynames) == 0:
     yield FAIL,\
           Message("missing",
@@ -1790,7 +1800,7 @@ def com_google_fonts_check_metadata_nameid_full_name(ttFont, font_metadata):
   id = 'com.google.fonts/check/metadata/nameid/font_name',
   conditions=['font_metadata', 'style']
 )
-def com_google_fonts_check_metadata_nameid_font_name(ttFont, style, font_metadata):
+def com_google_fonts_check_metadata_nameid_font_name(ttFont, style, font_metadata, name_index):
   """METADATA.pb font.name value should be same as
      the family name declared on the name table.
   """
@@ -1798,10 +1808,12 @@ def com_google_fonts_check_metadata_nameid_font_name(ttFont, style, font_metadat
   from fontbakery.constants import RIBBI_STYLE_NAMES
 
   if style in RIBBI_STYLE_NAMES:
-    font_familynames = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME)
+    font_familynames = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME,
+                                              name_index=name_index)
     nameid = NameID.FONT_FAMILY_NAME
   else:
-    font_familynames = get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME)
+    font_familynames = get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME,
+                                              name_index=name_index)
     nameid = NameID.TYPOGRAPHIC_FAMILY_NAME
 
   if len(font_familynames) == 0:
@@ -1986,14 +1998,14 @@ def com_google_fonts_check_metadata_valid_post_script_name_values(font_metadata,
   id = 'com.google.fonts/check/metadata/valid_copyright',
   conditions = ['font_metadata'],
   rationale = """
-  The expected pattern for the copyright string adheres to the following rules:
-  * It must say "Copyright" followed by a 4 digit year
-  * Then it must say "The <familyname> Project Authors"
-  * And within parentheses, a URL for a git repository must be provided
-  * The check is case insensitive and does not validate whether the familyname is correct, even though we'd expect it is (and we may soon update the check to validate that aspect as well!)
-
-  Here is an example of a valid copyright string:
-  "Copyright 2017 The Archivo Black Project Authors (https://github.com/Omnibus-Type/ArchivoBlack)"
+    The expected pattern for the copyright string adheres to the following rules:
+    * It must say "Copyright" followed by a 4 digit year
+    * Then it must say "The <familyname> Project Authors"
+    * And within parentheses, a URL for a git repository must be provided
+    * The check is case insensitive and does not validate whether the familyname is correct, even though we'd expect it is (and we may soon update the check to validate that aspect as well!)
+
+    Here is an example of a valid copyright string:
+    "Copyright 2017 The Archivo Black Project Authors (https://github.com/Omnibus-Type/ArchivoBlack)"
   """
 )
 def com_google_fonts_check_metadata_valid_copyright(font_metadata):
@@ -2160,7 +2172,7 @@ def com_google_fonts_check_metadata_italic_style(ttFont, font_metadata):
   id = 'com.google.fonts/check/metadata/normal_style',
   conditions = ['font_metadata']
 )
-def com_google_fonts_check_metadata_normal_style(ttFont, font_metadata):
+def com_google_fonts_check_metadata_normal_style(ttFont, font_metadata, name_index):
   """METADATA.pb font.style "normal" matches font internals?"""
   from fontbakery.utils import get_name_entry_strings
   from fontbakery.constants import MacStyle
@@ -2169,8 +2181,10 @@ def com_google_fonts_check_metadata_normal_style(ttFont, font_metadata):
     yield SKIP, "This check only applies to normal fonts."
     # FIXME: declare a common condition called "normal_style"
   else:
-    font_familyname = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME)
-    font_fullname = get_name_entry_strings(ttFont, NameID.FULL_FONT_NAME)
+    font_familyname = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME,
+                                             name_index=name_index)
+    font_fullname = get_name_entry_strings(ttFont, NameID.FULL_FONT_NAME,
+                                           name_index=name_index)
     if len(font_familyname) == 0 or len(font_fullname) == 0:
       yield SKIP, ("Font lacks familyname and/or"
                    " fullname entries in name table.")
@@ -2208,18 +2222,21 @@ def com_google_fonts_check_metadata_normal_style(ttFont, font_metadata):
   id = 'com.google.fonts/check/metadata/nameid/family_and_full_names',
   conditions = ['font_metadata']
 )
-def com_google_fonts_check_metadata_nameid_family_and_full_names(ttFont, font_metadata):
+def com_google_fonts_check_metadata_nameid_family_and_full_names(ttFont, font_metadata, name_index):
   """METADATA.pb font.name and font.full_name fields match
      the values declared on the name table?
   """
   from fontbakery.utils import get_name_entry_strings
 
-  font_familynames = get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME)
+  font_familynames = get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME,
+                                            name_index=name_index)
   if font_familynames:
       font_familyname = font_familynames[0]
   else:
-      font_familyname = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME)[0]
-  font_fullname = get_name_entry_strings(ttFont, NameID.FULL_FONT_NAME)[0]
+      font_familyname = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME,
+                                               name_index=name_index)[0]
+  font_fullname = get_name_entry_strings(ttFont, NameID.FULL_FONT_NAME,
+                                         name_index=name_index)[0]
   # FIXME: common condition/name-id check as in the two previous checks.
 
   if font_fullname != font_metadata.full_name:
@@ -2515,18 +2532,27 @@ def com_google_fonts_check_version_bump(ttFont,
   id = 'com.google.fonts/check/production_glyphs_similarity',
   conditions = ['api_gfonts_ttFont']
 )
-def com_google_fonts_check_production_glyphs_similarity(ttFont, api_gfonts_ttFont):
+def com_google_fonts_check_production_glyphs_similarity(ttFont, api_gfonts_ttFont, glyph_outlines):
   """Glyphs are similiar to Google Fonts version?"""
+  from fontbakery.utils import GlyphOutlines
 
-  def glyphs_surface_area(ttFont):
+  def glyphs_surface_area(ttFont, glyph_outlines):
     """Calculate the surface area of a glyph's ink"""
     from fontTools.pens.areaPen import AreaPen
     glyphs = {}
-    glyph_set = ttFont.getGlyphSet()
-    area_pen = AreaPen(glyph_set)
+    if glyph_outlines is not None:
+      # TrueType: draw the decoded outlines, composites are flattened.
+      area_pen = AreaPen()
+      draw = glyph_outlines.draw
+      glyph_names = glyph_outlines.glyph_names
+    else:
+      glyph_set = ttFont.getGlyphSet()
+      area_pen = AreaPen(glyph_set)
+      draw = lambda glyph, pen: glyph_set[glyph].draw(pen)
+      glyph_names = glyph_set.keys()
 
-    for glyph in glyph_set.keys():
-      glyph_set[glyph].draw(area_pen)
+    for glyph in glyph_names:
+      draw(glyph, area_pen)
 
       area = area_pen.value
       area_pen.value = 0
@@ -2534,8 +2560,10 @@ def com_google_fonts_check_production_glyphs_similarity(ttFont, api_gfonts_ttFon
     return glyphs
 
   bad_glyphs = []
-  these_glyphs = glyphs_surface_area(ttFont)
-  gfonts_glyphs = glyphs_surface_area(api_gfonts_ttFont)
+  these_glyphs = glyphs_surface_area(ttFont, glyph_outlines)
+  gfonts_glyphs = glyphs_surface_area(api_gfonts_ttFont,
+                                      GlyphOutlines(api_gfonts_ttFont)
+                                      if 'glyf' in api_gfonts_ttFont else None)
 
   shared_glyphs = set(these_glyphs) & set(gfonts_glyphs)
 
@@ -2693,7 +2721,7 @@ def com_google_fonts_check_mac_style(ttFont, style):
     This check currently does not cover variable fonts because there's plenty of alternative ways of constructing glyphs with multiple outlines for each feature in a VarFont. The expected contour count data for this check is currently optimized for the typical construction of glyphs in static fonts.
   """
 )
-def com_google_fonts_check_contour_count(ttFont):
+def com_google_fonts_check_contour_count(ttFont, glyph_outlines):
   """Check if each glyph has the recommended amount of contours.
 
   This check is useful to assure glyphs aren't incorrectly constructed.
@@ -2705,40 +2733,18 @@ def com_google_fonts_check_contour_count(ttFont):
   In the future, additional glyph data can be included. A good addition would
   be the 'recommended' anchor counts for each glyph.
   """
-  from fontbakery.glyphdata import desired_glyph_data as glyph_data
+  from fontbakery import glyphdata
   from fontbakery.utils import (get_font_glyph_data,
                                 pretty_print_list)
 
-  def in_PUA_range(codepoint):
-    """
-      In Unicode, a Private Use Area (PUA) is a range of code points that,
-      by definition, will not be assigned characters by the Unicode Consortium.
-      Three private use areas are defined:
-        one in the Basic Multilingual Plane (U+E000–U+F8FF),
-        and one each in, and nearly covering, planes 15 and 16
-        (U+F0000–U+FFFFD, U+100000–U+10FFFD).
-    """
-    return (codepoint >= 0xE000 and codepoint <= 0xF8FF) or \
-           (codepoint >= 0xF0000 and codepoint <= 0xFFFFD) or \
-           (codepoint >= 0x100000 and codepoint <= 0x10FFFD)
-
-  # rearrange data structure:
-  desired_glyph_data_by_codepoint = {}
-  desired_glyph_data_by_glyphname = {}
-  for glyph in glyph_data:
-    desired_glyph_data_by_glyphname[glyph['name']] = glyph
-    # since the glyph in PUA ranges have unspecified meaning,
-    # it doesnt make sense for us to have an expected contour cont for them
-    if not in_PUA_range(glyph['unicode']):
-      desired_glyph_data_by_codepoint[glyph['unicode']] = glyph
-
   bad_glyphs = []
-  desired_glyph_contours_by_codepoint = {f: desired_glyph_data_by_codepoint[f]['contours']
-                                         for f in desired_glyph_data_by_codepoint}
-  desired_glyph_contours_by_glyphname = {f: desired_glyph_data_by_glyphname[f]['contours']
-                                         for f in desired_glyph_data_by_glyphname}
+  # These are built once per process and shared by all fonts.
+  # Glyphs in PUA ranges are not in the codepoint map: they have
+  # unspecified meaning, hence no expected contour count.
+  desired_glyph_contours_by_codepoint = glyphdata.desired_glyph_contours_by_codepoint()
+  desired_glyph_contours_by_glyphname = glyphdata.desired_glyph_contours_by_glyphname()
 
-  font_glyph_data = get_font_glyph_data(ttFont)
+  font_glyph_data = get_font_glyph_data(ttFont, glyph_outlines)
 
   if font_glyph_data is None:
     yield FAIL,\
@@ -3332,6 +3338,9 @@ def com_google_fonts_check_negative_advance_width(ttFont):
     - width = 75
   """,
   conditions = ['is_variable_font'],
+  # mutator saves ttFont, which recalculates e.g. the bounding boxes and
+  # the modification date of the font that is shared with other checks
+  thread_safe = False,
   misc_metadata = {
     'request': 'https://github.com/googlefonts/fontbakery/issues/1727'
   })
@@ -3736,19 +3745,9 @@ def com_google_fonts_check_ligature_carets(ttFont, ligature_glyphs):
   misc_metadata = {
     'request': 'https://github.com/googlefonts/fontbakery/issues/1145'
   })
-def com_google_fonts_check_kerning_for_non_ligated_sequences(ttFont, ligatures, has_kerning_info):
+def com_google_fonts_check_kerning_for_non_ligated_sequences(layout_index, ligatures, has_kerning_info):
   """Is there kerning info for non-ligated sequences?"""
 
-  def look_for_nonligated_kern_info(table):
-    for pairpos in table.SubTable:
-      for i, glyph in enumerate(pairpos.Coverage.glyphs):
-        if not hasattr(pairpos, 'PairSet'):
-          continue
-        for pairvalue in pairpos.PairSet[i].PairValueRecord:
-          kern_pair = (glyph, pairvalue.SecondGlyph)
-          if kern_pair in ligature_pairs:
-            ligature_pairs.remove(kern_pair)
-
   def ligatures_str(pairs):
     result = [f"\t- {first} + {second}" for first, second in pairs]
     return "\n".join(result)
@@ -3761,22 +3760,16 @@ def com_google_fonts_check_kerning_for_non_ligated_sequences(ttFont, ligatures,
                   " For more info, read:"
                   " https://github.com/googlefonts/fontbakery/issues/1596")
   else:
-    ligature_pairs = []
+    ligature_pairs = {}
     for first, comp in ligatures.items():
       for components in comp:
-        while components:
-          pair = (first, components[0])
-          if pair not in ligature_pairs:
-            ligature_pairs.append(pair)
-          first = components[0]
-          components.pop(0)
-
-    for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-      if record.FeatureTag == 'kern':
-        for index in record.Feature.LookupListIndex:
-          lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-          look_for_nonligated_kern_info(lookup)
+        previous = first
+        for component in components:
+          ligature_pairs[(previous, component)] = None
+          previous = component
 
+    ligature_pairs = [pair for pair in ligature_pairs
+                           if not layout_index.is_kerned(*pair)]
     if ligature_pairs:
       yield WARN,\
             Message("lacks-kern-info",
@@ -3805,19 +3798,21 @@ def com_google_fonts_check_kerning_for_non_ligated_sequences(ttFont, ligatures,
     'request': 'https://github.com/googlefonts/fontbakery/issues/1488',
   }
 )
-def com_google_fonts_check_name_family_and_style_max_length(ttFont):
+def com_google_fonts_check_name_family_and_style_max_length(ttFont, name_index):
   """Combined length of family and style must not exceed 27 characters."""
   from fontbakery.utils import (get_name_entries,
                                 get_name_entry_strings)
   failed = False
   for familyname in get_name_entries(ttFont,
-                                     NameID.FONT_FAMILY_NAME):
+                                     NameID.FONT_FAMILY_NAME,
+                                     name_index=name_index):
     # we'll only match family/style name entries with the same platform ID:
     plat = familyname.platformID
     familyname_str = familyname.string.decode(familyname.getEncoding())
     for stylename_str in get_name_entry_strings(ttFont,
                                                 NameID.FONT_SUBFAMILY_NAME,
-                                                platformID=plat):
+                                                platformID=plat,
+                                                name_index=name_index):
       if len(familyname_str + stylename_str) > 27:
         failed = True
         yield WARN,\
@@ -3924,10 +3919,10 @@ def com_google_fonts_check_repo_dirname_match_nameid_1(fonts,
                                                        gfonts_repo_structure):
   """Directory name in GFonts repo structure must
      match NameID 1 of the regular."""
-  from fontTools.ttLib import TTFont
   from fontbakery.utils import (get_name_entry_strings,
                                 get_absolute_path,
-                                get_regular)
+                                get_regular,
+                                get_shared_ttFont)
   regular = get_regular(fonts)
   if not regular:
     yield FAIL,\
@@ -3935,7 +3930,8 @@ def com_google_fonts_check_repo_dirname_match_nameid_1(fonts,
                   "The font seems to lack a regular.")
     return
 
-  entry = get_name_entry_strings(TTFont(regular), NameID.FONT_FAMILY_NAME)[0]
+  entry = get_name_entry_strings(get_shared_ttFont(regular),
+                                 NameID.FONT_FAMILY_NAME)[0]
   expected = entry.lower()
   expected = "".join(expected.split(' '))
   expected = "".join(expected.split('-'))
@@ -70,18 +70,18 @@ def superfamily(sibling_directories):
 
 @condition
 def superfamily_ttFonts(superfamily):
-  from fontTools.ttLib import TTFont
+  from fontbakery.utils import get_shared_ttFont
   result = []
   for family in superfamily:
-    result.append([TTFont(f) for f in family])
+    result.append([get_shared_ttFont(f) for f in family])
   return result
 
 
 @condition
 def RIBBI_ttFonts(fonts):
-  from fontTools.ttLib import TTFont
+  from fontbakery.utils import get_shared_ttFont
   from fontbakery.constants import RIBBI_STYLE_NAMES
-  return [TTFont(f)
+  return [get_shared_ttFont(f)
           for f in fonts
           if style(f) in RIBBI_STYLE_NAMES]
 
@@ -162,7 +162,7 @@ def canonical_stylename(font):
   from fontbakery.constants import (STATIC_STYLE_NAMES,
                                     VARFONT_SUFFIXES)
   from .shared_conditions import is_variable_font
-  from fontTools.ttLib import TTFont
+  from fontbakery.utils import get_shared_ttFont
 
   # remove spaces in style names
   valid_style_suffixes = [name.replace(' ', '') for name in STATIC_STYLE_NAMES]
@@ -170,7 +170,7 @@ def canonical_stylename(font):
   filename = os.path.basename(font)
   basename = os.path.splitext(filename)[0]
   s = suffix(font)
-  varfont = os.path.exists(font) and is_variable_font(TTFont(font))
+  varfont = os.path.exists(font) and is_variable_font(get_shared_ttFont(font))
   if ('-' in basename and
       (s in VARFONT_SUFFIXES and varfont)
       or (s in valid_style_suffixes and not varfont)):
@@ -207,6 +207,13 @@ def description(descfile):
 
 
 @condition
+def link_checker():
+  """The LinkChecker shared by the checks of broken links."""
+  from fontbakery.link_checker import get_link_checker
+  return get_link_checker()
+
+
+@condition(prefetch=True)
 def family_metadata(family_directory):
   from google.protobuf import text_format
   from fontbakery.utils import get_FamilyProto_Message
@@ -220,7 +227,7 @@ def family_metadata(family_directory):
       return None
 
 
-@condition
+@condition(prefetch=True)
 def registered_vendor_ids():
   """Get a list of vendor IDs from Microsoft's website."""
   from bs4 import BeautifulSoup
@@ -268,25 +275,25 @@ def git_rootdir(family_dir):
   if not family_dir:
     return None
 
-  original_dir = os.getcwd()
   root_dir = None
   try:
     import subprocess
-    os.chdir(family_dir)
     git_cmd = [
         "git", "rev-parse", "--show-toplevel"
     ]
-    git_output = subprocess.check_output(git_cmd, stderr=subprocess.STDOUT)
+    # with cwd instead of os.chdir, the working directory of the
+    # process doesn't change, which would affect other threads.
+    git_output = subprocess.check_output(git_cmd, cwd=family_dir,
+                                         stderr=subprocess.STDOUT)
     root_dir = git_output.decode("utf-8").strip()
 
   except (OSError, IOError, subprocess.CalledProcessError):
     pass # Not a git repo, or git is not installed.
 
-  os.chdir(original_dir)
   return root_dir
 
 
-@condition
+@condition(prefetch=True)
 def licenses(family_directory):
   """Get a list of paths for every license
      file found in a font project."""
@@ -327,17 +334,19 @@ def familyname(font):
     return filename_base.split('-')[0]
 
 
-@condition
+@condition(prefetch=True)
 def ttfautohint_stats(font):
   from ttfautohint import ttfautohint, libttfautohint
   from io import BytesIO
   from fontTools.ttLib import TTFont
   from fontbakery.profiles.shared_conditions import is_ttf
+  from fontbakery.utils import get_shared_ttFont
 
-  if not is_ttf(TTFont(font)):
+  if not is_ttf(get_shared_ttFont(font)):
     return None
 
   original_buffer = BytesIO()
+  # a private copy, saving recalculates e.g. the bounding boxes
   TTFont(font).save(original_buffer)
   dehinted_buffer = ttfautohint(in_buffer=original_buffer.getvalue(),
                                 dehint=True)
@@ -348,16 +357,15 @@ def ttfautohint_stats(font):
   }
 
 
-@condition
+@condition(prefetch=True)
 def listed_on_gfonts_api(familyname):
   if not familyname:
     return False
 
-  import requests
+  from fontbakery.fetcher import get_fetcher
   url = ('http://fonts.googleapis.com'
          '/css?family={}').format(familyname.replace(' ', '+'))
-  r = requests.get(url)
-  return r.status_code == 200
+  return get_fetcher().fetch(url).status_code == 200
 
 
 @condition
@@ -380,15 +388,16 @@ def font_metadata(family_metadata, font):
 
 
 @condition
-def font_familynames(ttFont):
+def font_familynames(ttFont, name_index):
   from fontbakery.utils import get_name_entry_strings
-  return get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME)
+  return get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME, name_index=name_index)
 
 
 @condition
-def typographic_familynames(ttFont):
+def typographic_familynames(ttFont, name_index):
   from fontbakery.utils import get_name_entry_strings
-  return get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME)
+  return get_name_entry_strings(ttFont, NameID.TYPOGRAPHIC_FAMILY_NAME,
+                                name_index=name_index)
 
 
 @condition
@@ -418,7 +427,7 @@ def whitelist_camelcased_familyname(font):
       return True
 
 
-@condition
+@condition(prefetch=True)
 def remote_styles(familyname_with_spaces):
   """Get a dictionary of TTFont objects of all font files of
      a given family as currently hosted at Google Fonts.
@@ -468,7 +477,7 @@ def api_gfonts_ttFont(style, remote_styles):
     return remote_styles[style]
 
 
-@condition
+@condition(prefetch=True)
 def github_gfonts_ttFont(ttFont, license):
   """Get a TTFont object of a font downloaded
      from Google Fonts git repository.
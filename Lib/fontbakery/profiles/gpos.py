@@ -6,32 +6,24 @@ from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 
+profile_imports = [
+    ('.shared_conditions', ('layout_index', ))
+]
+
 @condition
-def has_kerning_info(ttFont):
+def has_kerning_info(layout_index):
   """A font has kerning info if it has a GPOS table containing at least one
   Pair Adjustment lookup (eigther directly or through an extension
   subtable)."""
-  if "GPOS" not in ttFont:
-    return False
-
-  if not ttFont["GPOS"].table.LookupList:
-    return False
-
-  for lookup in ttFont["GPOS"].table.LookupList.Lookup:
-    if lookup.LookupType == 2:  # type 2 = Pair Adjustment
-      return True
-    elif lookup.LookupType == 9:  # type 9 = Extension subtable
-      for ext in lookup.SubTable:
-        if ext.ExtensionLookupType == 2:  # type 2 = Pair Adjustment
-          return True
+  return layout_index.has_pair_positioning
 
 
 @check(
   id = 'com.google.fonts/check/gpos_kerning_info'
 )
-def com_google_fonts_check_gpos_kerning_info(ttFont):
+def com_google_fonts_check_gpos_kerning_info(has_kerning_info):
   """Does GPOS table have kerning information?"""
-  if not has_kerning_info(ttFont):
+  if not has_kerning_info:
     yield WARN,\
           Message("lacks-kern-info",
                   "GPOS table lacks kerning information.")
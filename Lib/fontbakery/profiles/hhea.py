@@ -5,7 +5,7 @@ from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 profile_imports = [
-    ('.shared_conditions', ('glyph_metrics_stats', 'is_ttf'))
+    ('.shared_conditions', ('glyph_metrics_stats', 'glyph_metrics', 'is_ttf'))
 ]
 
 @check(
@@ -28,15 +28,12 @@ def com_google_fonts_check_linegaps(ttFont):
 @check(
   id = 'com.google.fonts/check/maxadvancewidth'
 )
-def com_google_fonts_check_maxadvancewidth(ttFont):
+def com_google_fonts_check_maxadvancewidth(ttFont, glyph_metrics):
   """MaxAdvanceWidth is consistent with values in the Hmtx and Hhea tables?"""
   hhea_advance_width_max = ttFont['hhea'].advanceWidthMax
   hmtx_advance_width_max = None
-  for g in ttFont['hmtx'].metrics.values():
-    if hmtx_advance_width_max is None:
-      hmtx_advance_width_max = max(0, g[0])
-    else:
-      hmtx_advance_width_max = max(g[0], hmtx_advance_width_max)
+  if glyph_metrics.advances:
+    hmtx_advance_width_max = max(0, max(glyph_metrics.advances))
 
   if hmtx_advance_width_max != hhea_advance_width_max:
     yield FAIL,\
@@ -10,7 +10,7 @@ from fontbakery.constants import (PriorityLevel,
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 profile_imports = [
-    ('.shared_conditions', ('glyph_metrics_stats', ))
+    ('.shared_conditions', ('glyph_metrics_stats', 'glyph_metrics', 'name_index'))
 ]
 
 
@@ -94,7 +94,7 @@ def com_google_fonts_check_name_no_copyright_on_description(ttFont):
     Thomas Phinney told us that a few years ago (as of December 2019), if you gave a font a monospace flag in Panose, Microsoft Word would ignore the actual advance widths and treat it as monospaced. Source: https://typedrawers.com/discussion/comment/45140/#Comment_45140
   """
 )
-def com_google_fonts_check_monospace(ttFont, glyph_metrics_stats):
+def com_google_fonts_check_monospace(ttFont, glyph_metrics_stats, glyph_metrics):
   """Checking correctness of monospaced metadata."""
   from fontbakery.constants import (IsFixedWidth,
                                     PANOSE_Proportion)
@@ -132,11 +132,10 @@ def com_google_fonts_check_monospace(ttFont, glyph_metrics_stats):
                     f" (proportion: monospaced),"
                     f" but got {ttFont['OS/2'].panose.bProportion} instead.")
 
-    num_glyphs = len(ttFont['glyf'].glyphs)
+    num_glyphs = len(glyph_metrics)
     unusually_spaced_glyphs = [
-        g for g in ttFont['glyf'].glyphs
-        if g not in ['.notdef', '.null', 'NULL'] and
-        ttFont['hmtx'].metrics[g][0] != most_common_width
+        g for g, width in zip(glyph_metrics.glyph_names, glyph_metrics.advances)
+        if width != most_common_width and g not in ['.notdef', '.null', 'NULL']
     ]
     outliers_ratio = float(len(unusually_spaced_glyphs)) / num_glyphs
     if outliers_ratio > 0:
@@ -204,11 +203,13 @@ def com_google_fonts_check_name_line_breaks(ttFont):
 @check(
   id = 'com.google.fonts/check/name/match_familyname_fullfont'
 )
-def com_google_fonts_check_name_match_familyname_fullfont(ttFont):
+def com_google_fonts_check_name_match_familyname_fullfont(ttFont, name_index):
   """Does full font name begin with the font family name?"""
   from fontbakery.utils import get_name_entry_strings
-  familyname = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME)
-  fullfontname = get_name_entry_strings(ttFont, NameID.FULL_FONT_NAME)
+  familyname = get_name_entry_strings(ttFont, NameID.FONT_FAMILY_NAME,
+                                      name_index=name_index)
+  fullfontname = get_name_entry_strings(ttFont, NameID.FULL_FONT_NAME,
+                                        name_index=name_index)
 
   if len(familyname) == 0:
     yield FAIL,\
@@ -244,7 +245,7 @@ def com_google_fonts_check_name_match_familyname_fullfont(ttFont):
 @check(
   id = 'com.google.fonts/check/family_naming_recommendations'
 )
-def com_google_fonts_check_family_naming_recommendations(ttFont):
+def com_google_fonts_check_family_naming_recommendations(ttFont, name_index):
   """Font follows the family naming recommendations?"""
   # See http://forum.fontlab.com/index.php?topic=313.0
   import re
@@ -255,7 +256,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
   # and one hyphen
   bad_psname = re.compile("[^A-Za-z0-9-]")
   for string in get_name_entry_strings(ttFont,
-                                       NameID.POSTSCRIPT_NAME):
+                                       NameID.POSTSCRIPT_NAME,
+                                       name_index=name_index):
     if bad_psname.search(string):
       bad_entries.append({
           'field':
@@ -274,7 +276,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
       })
 
   for string in get_name_entry_strings(ttFont,
-                                       NameID.FULL_FONT_NAME):
+                                       NameID.FULL_FONT_NAME,
+                                       name_index=name_index):
     if len(string) >= 64:
       bad_entries.append({
           'field': 'Full Font Name',
@@ -283,7 +286,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
       })
 
   for string in get_name_entry_strings(ttFont,
-                                       NameID.POSTSCRIPT_NAME):
+                                       NameID.POSTSCRIPT_NAME,
+                                       name_index=name_index):
     if len(string) >= 64:
       bad_entries.append({
           'field': 'PostScript Name',
@@ -292,7 +296,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
       })
 
   for string in get_name_entry_strings(ttFont,
-                                       NameID.FONT_FAMILY_NAME):
+                                       NameID.FONT_FAMILY_NAME,
+                                       name_index=name_index):
     if len(string) >= 32:
       bad_entries.append({
           'field': 'Family Name',
@@ -301,7 +306,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
       })
 
   for string in get_name_entry_strings(ttFont,
-                                       NameID.FONT_SUBFAMILY_NAME):
+                                       NameID.FONT_SUBFAMILY_NAME,
+                                       name_index=name_index):
     if len(string) >= 32:
       bad_entries.append({
           'field': 'Style Name',
@@ -310,7 +316,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
       })
 
   for string in get_name_entry_strings(ttFont,
-                                       NameID.TYPOGRAPHIC_FAMILY_NAME):
+                                       NameID.TYPOGRAPHIC_FAMILY_NAME,
+                                       name_index=name_index):
     if len(string) >= 32:
       bad_entries.append({
           'field': 'OT Family Name',
@@ -319,7 +326,8 @@ def com_google_fonts_check_family_naming_recommendations(ttFont):
       })
 
   for string in get_name_entry_strings(ttFont,
-                                       NameID.TYPOGRAPHIC_SUBFAMILY_NAME):
+                                       NameID.TYPOGRAPHIC_SUBFAMILY_NAME,
+                                       name_index=name_index):
     if len(string) >= 32:
       bad_entries.append({
           'field': 'OT Style Name',
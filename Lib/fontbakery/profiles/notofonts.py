@@ -100,7 +100,8 @@ def com_google_fonts_check_unicode_range_bits(ttFont, unicoderange, preferred_cm
   from fontbakery.constants import UNICODERANGE_DATA
   from fontbakery.utils import (compute_unicoderange_bits,
                                 unicoderange_bit_name,
-                                chars_in_range)
+                                unicoderange_char_counts)
+  char_counts = unicoderange_char_counts(preferred_cmap)
   expected_unicoderange = compute_unicoderange_bits(ttFont)
   difference = unicoderange ^ expected_unicoderange
   if not difference:
@@ -109,7 +110,7 @@ def com_google_fonts_check_unicode_range_bits(ttFont, unicoderange, preferred_cm
     for bit in range(128):
       if difference & (1 << bit):
         range_name = unicoderange_bit_name(bit)
-        num_chars = len(chars_in_range(ttFont, bit))
+        num_chars = char_counts[bit]
         range_size = sum(entry[3] - entry[2] + 1 for entry in UNICODERANGE_DATA[bit])
         set_unset = "1"
         if num_chars == 0:
@@ -5,7 +5,7 @@ from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unused-import
 
 profile_imports = [
-    ('.shared_conditions', ('vmetrics', )),
+    ('.shared_conditions', ('vmetrics', 'glyph_metrics')),
     ('.googlefonts_conditions', ('RIBBI_ttFonts', ))
 ]
 
@@ -61,7 +61,7 @@ def com_google_fonts_check_family_panose_familytype(ttFonts):
   id = 'com.google.fonts/check/xavgcharwidth',
   conditions = ['is_ttf']
 )
-def com_google_fonts_check_xavgcharwidth(ttFont):
+def com_google_fonts_check_xavgcharwidth(ttFont, glyph_metrics):
   """Check if OS/2 xAvgCharWidth is correct."""
   current_value = ttFont['OS/2'].xAvgCharWidth
   ACCEPTABLE_ERROR = 10  # Width deviation tolerance in font units
@@ -75,15 +75,12 @@ def com_google_fonts_check_xavgcharwidth(ttFont):
                     "CRITICAL: Found no glyph width data in the hmtx table!")
       return
 
-    width_sum = 0
-    count = 0
-    for glyph_id in ttFont['glyf'].glyphs:  # At least .notdef must be present.
-      width = ttFont['hmtx'].metrics[glyph_id][0]
-      # The OpenType spec doesn't exclude negative widths, but only positive
-      # widths seems to be the assumption in the wild?
-      if width > 0:
-        count += 1
-        width_sum += width
+    # At least .notdef must be present.
+    # The OpenType spec doesn't exclude negative widths, but only positive
+    # widths seems to be the assumption in the wild?
+    widths = [width for width in glyph_metrics.advances if width > 0]
+    width_sum = sum(widths)
+    count = len(widths)
 
     expected_value = int(round(width_sum / count))
   else:  # Version 2 and below only consider lowercase latin glyphs and space.
@@ -128,7 +125,7 @@ def com_google_fonts_check_xavgcharwidth(ttFont):
 
     width_sum = 0
     for glyph_id in weightFactors:
-      width = ttFont['hmtx'].metrics[glyph_id][0]
+      width = glyph_metrics.advance(glyph_id)
       width_sum += (width * weightFactors[glyph_id])
 
     expected_value = int(width_sum / 1000.0 + 0.5)  # round to closest int
@@ -8,8 +8,8 @@ from fontbakery.fonts_profile import profile_factory # NOQA pylint: disable=unus
 
 @condition
 def ttFont(font):
-  from fontTools.ttLib import TTFont
-  return TTFont(font)
+  from fontbakery.utils import get_shared_ttFont
+  return get_shared_ttFont(font)
 
 
 @condition
@@ -35,62 +35,82 @@ def is_cff2(ttFont):
   return 'CFF2' in ttFont
 
 @condition
-def ligatures(ttFont):
-  all_ligatures = {}
+def name_index(ttFont):
+  """The records of the name table grouped by their IDs, with their
+  decoded strings, see fontbakery.utils.NameIndex."""
+  from fontbakery.utils import NameIndex
+  return NameIndex(ttFont)
+
+
+@condition
+def layout_index(ttFont):
+  """The lookups of the GSUB and GPOS features, the ligatures and the
+  kerning pairs, compiled once per font, see fontbakery.utils.LayoutIndex."""
+  from fontbakery.utils import LayoutIndex
+  return LayoutIndex(ttFont)
+
+
+@condition
+def ligatures(layout_index):
   try:
-    if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-      for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-        if record.FeatureTag == 'liga':
-          for index in record.Feature.LookupListIndex:
-            lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-            for subtable in lookup.SubTable:
-              for firstGlyph in subtable.ligatures.keys():
-                all_ligatures[firstGlyph] = []
-                for lig in subtable.ligatures[firstGlyph]:
-                  if lig.Component not in all_ligatures[firstGlyph]:
-                    all_ligatures[firstGlyph].append(lig.Component)
-    return all_ligatures
+    return layout_index.ligatures
   except:
     return -1 # Indicate fontTools-related crash...
 
 
 @condition
-def ligature_glyphs(ttFont):
-  all_ligature_glyphs = []
+def ligature_glyphs(layout_index):
   try:
-    if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-      for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-        if record.FeatureTag == 'liga':
-          for index in record.Feature.LookupListIndex:
-            lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-            for subtable in lookup.SubTable:
-              for firstGlyph in subtable.ligatures.keys():
-                for lig in subtable.ligatures[firstGlyph]:
-                  if lig.LigGlyph not in all_ligature_glyphs:
-                    all_ligature_glyphs.append(lig.LigGlyph)
-    return all_ligature_glyphs
+    return layout_index.ligature_glyphs
   except:
     return -1  # Indicate fontTools-related crash...
 
 
 @condition
-def glyph_metrics_stats(ttFont):
+def glyph_metrics(ttFont):
+  """The advance widths, left side bearings and bounding boxes of all
+  glyphs as arrays, see fontbakery.utils.GlyphMetrics."""
+  from fontbakery.utils import GlyphMetrics
+  return GlyphMetrics(ttFont)
+
+
+@condition
+def glyph_outlines(ttFont):
+  """The decoded outlines of the glyphs of a TrueType font,
+  see fontbakery.utils.GlyphOutlines. None if it has no glyf table."""
+  from fontbakery.utils import GlyphOutlines
+  if 'glyf' in ttFont:
+    return GlyphOutlines(ttFont)
+
+
+@condition
+def ink_map(ttFont):
+  """{glyph name: whether the glyph has ink}, computed once per glyph,
+  see fontbakery.utils.InkMap."""
+  from fontbakery.utils import InkMap
+  return InkMap(ttFont)
+
+
+@condition
+def glyph_metrics_stats(ttFont, glyph_metrics):
   """Returns a dict containing whether the font seems_monospaced,
   what's the maximum glyph width and what's the most common width.
 
   For a font to be considered monospaced, at least 80% of
   the ascii glyphs must have the same width."""
-  glyph_metrics = ttFont['hmtx'].metrics
-  ascii_glyph_names = [ttFont.getBestCmap()[c] for c in range(32, 128)
-                       if c in ttFont.getBestCmap()]
-  ascii_widths = [adv for name, (adv, lsb) in glyph_metrics.items()
-                  if name in ascii_glyph_names]
+  cmap = ttFont.getBestCmap()
+  index = glyph_metrics.index
+  ascii_glyph_names = {cmap[c] for c in range(32, 128) if c in cmap}
+  ascii_widths = [glyph_metrics.advances[index[name]]
+                  for name in ascii_glyph_names if name in index]
   ascii_width_count = Counter(ascii_widths)
   ascii_most_common_width = ascii_width_count.most_common(1)[0][1]
   seems_monospaced = ascii_most_common_width >= len(ascii_widths) * 0.8
 
-  width_max = max([adv for k, (adv, lsb) in glyph_metrics.items()])
-  most_common_width = Counter(glyph_metrics.values()).most_common(1)[0][0][0]
+  width_max = max(glyph_metrics.advances)
+  # the advance of the most common (advance, lsb) pair
+  most_common_width = Counter(zip(glyph_metrics.advances,
+                                  glyph_metrics.lsbs)).most_common(1)[0][0][0]
   return {
       "seems_monospaced": seems_monospaced,
       "width_max": width_max,
@@ -215,36 +235,29 @@ def is_cjk_font(ttFont):
        2. The font has a CJK Unicode range bit set in the OS/2 table
        3. The font has any CJK Unicode code points defined in the cmap table
   """
-  from fontbakery.constants import (CJK_CODEPAGE_BITS,
-                                    CJK_UNICODE_RANGE_BITS,
+  from bisect import bisect_left
+  from fontbakery.constants import (CJK_CODEPAGE_MASK,
+                                    CJK_UNICODE_RANGE_MASK,
                                     CJK_UNICODE_RANGES)
   os2 = ttFont["OS/2"]
 
   # OS/2 code page checks
-  for _, bit in CJK_CODEPAGE_BITS.items():
-    if os2.ulCodePageRange1 & (1 << bit):
-      return True
+  if os2.ulCodePageRange1 & CJK_CODEPAGE_MASK:
+    return True
 
   # OS/2 Unicode range checks
-  for _, bit in CJK_UNICODE_RANGE_BITS.items():
-    if bit in range(0, 32):
-      if os2.ulUnicodeRange1 & (1 << bit):
-        return True
-
-    elif bit in range(32, 64):
-      if os2.ulUnicodeRange2 & (1 << (bit-32)):
-        return True
-
-    elif bit in range(64, 96):
-      if os2.ulUnicodeRange3 & (1 << (bit-64)):
-        return True
+  if (os2.ulUnicodeRange1 |
+      os2.ulUnicodeRange2 << 32 |
+      os2.ulUnicodeRange3 << 64) & CJK_UNICODE_RANGE_MASK:
+    return True
 
   # defined CJK Unicode code point in cmap table checks
-  cmap = ttFont.getBestCmap()
-  for unicode_range in CJK_UNICODE_RANGES:
-    for x in range(unicode_range[0], unicode_range[1]+1):
-      if int(x) in cmap:
-        return True
+  codepoints = sorted(ttFont.getBestCmap())
+  for first, last in CJK_UNICODE_RANGES:
+    # the first codepoint of the font which is not below the range
+    i = bisect_left(codepoints, first)
+    if i < len(codepoints) and codepoints[i] <= last:
+      return True
 
   # default, return False if the above checks did not identify a CJK font
   return False
@@ -6,6 +6,11 @@ from fontbakery.constants import PriorityLevel
 from fontbakery.message import Message
 from fontbakery.fonts_profile import profile_factory
 from fontbakery.profiles.opentype import OPENTYPE_PROFILE_CHECKS
+# used by com.google.fonts/check/superfamily/vertical_metrics
+from fontbakery.profiles.googlefonts_conditions import (family_directory, # pylint: disable=unused-import
+                                                        sibling_directories,
+                                                        superfamily,
+                                                        superfamily_ttFonts)
 
 profile_imports = ('fontbakery.profiles.opentype',)
 profile = profile_factory(default_section=Section("Universal"))
@@ -340,14 +345,12 @@ def com_google_fonts_check_fontbakery_version():
     Pre-v1.8, it was recommended that a font should also contain a .null, CR and space glyph. This might have been relevant for applications on MacOS 9.
   """
 )
-def com_google_fonts_check_mandatory_glyphs(ttFont):
+def com_google_fonts_check_mandatory_glyphs(ttFont, ink_map):
   """Font contains .notdef as first glyph?"""
-  from fontbakery.utils import glyph_has_ink
-
   if (
     ttFont.getGlyphOrder()[0] == ".notdef"
     and ".notdef" not in ttFont.getBestCmap().values()
-    and glyph_has_ink(ttFont, ".notdef")
+    and ink_map[".notdef"]
   ):
     yield PASS, (
       "Font contains the .notdef glyph as the first glyph, it does "
@@ -425,9 +428,9 @@ def com_google_fonts_check_whitespace_glyphnames(ttFont):
 @check(
   id = 'com.google.fonts/check/whitespace_ink'
 )
-def com_google_fonts_check_whitespace_ink(ttFont):
+def com_google_fonts_check_whitespace_ink(ttFont, ink_map):
   """Whitespace glyphs have ink?"""
-  from fontbakery.utils import get_glyph_name, glyph_has_ink
+  from fontbakery.utils import get_glyph_name
 
   # code-points for all "whitespace" chars:
   WHITESPACE_CHARACTERS = [
@@ -439,7 +442,7 @@ def com_google_fonts_check_whitespace_ink(ttFont):
   failed = False
   for codepoint in WHITESPACE_CHARACTERS:
     g = get_glyph_name(ttFont, codepoint)
-    if g is not None and glyph_has_ink(ttFont, g):
+    if g is not None and ink_map[g]:
       failed = True
       yield FAIL, ("Glyph \"{}\" has ink."
                    " It needs to be replaced by"
@@ -653,54 +656,73 @@ def com_google_fonts_check_glyphnames_max_length(ttFont):
 def com_google_fonts_check_ttx_roundtrip(font):
   """Checking with fontTools.ttx"""
   from fontTools import ttx
-  import sys
+  from io import BytesIO
+  import logging
+  import threading
+  # Not the shared TTFont: the messages logged while parsing
+  # the tables are part of the result of this check.
   ttFont = ttx.TTFont(font)
   failed = False
 
-  class TTXLogger:
-    msgs = []
-
+  class TTXLogger(logging.Handler):
+    """ Collects the messages fontTools logs in the thread of this
+    check, other checks may run at the same time.
+    """
     def __init__(self):
-      self.original_stderr = sys.stderr
-      self.original_stdout = sys.stdout
-      sys.stderr = self
-      sys.stdout = self
-
-    def write(self, data):
-      if data not in self.msgs:
-        self.msgs.append(data)
+      super().__init__(logging.WARNING)
+      self.msgs = []
+      self.thread = threading.get_ident()
 
-    def restore(self):
-      sys.stderr = self.original_stderr
-      sys.stdout = self.original_stdout
+    def emit(self, record):
+      if record.thread != self.thread:
+        return
+      msg = self.format(record)
+      if msg not in self.msgs:
+        self.msgs.append(msg)
 
   from xml.parsers.expat import ExpatError
+  export_error_msgs = []
+  import_error_msgs = []
+  parse_error = None
+  recursion_error = None
+  # in memory, the directory of the font may be read-only or in use
+  xml_file = BytesIO()
+  fonttools_log = logging.getLogger("fontTools")
+  logger = TTXLogger()
+  fonttools_log.addHandler(logger)
   try:
-    logger = TTXLogger()
-    xml_file = font + ".xml"
     ttFont.saveXML(xml_file)
-    export_error_msgs = logger.msgs
-
-    if len(export_error_msgs):
-      failed = True
-      yield INFO, ("While converting TTF into an XML file,"
-                   " ttx emited the messages listed below.")
-      for msg in export_error_msgs:
-        yield FAIL, msg.strip()
+    export_error_msgs = list(logger.msgs)
 
+    xml_file.seek(0)
     f = ttx.TTFont()
-    f.importXML(font + ".xml")
+    f.importXML(xml_file)
     import_error_msgs = [msg for msg in logger.msgs if msg not in export_error_msgs]
-
-    if len(import_error_msgs):
-      failed = True
-      yield INFO, ("While importing an XML file and converting"
-                   " it back to TTF, ttx emited the messages"
-                   " listed below.")
-      for msg in import_error_msgs:
-        yield FAIL, msg.strip()
-    logger.restore()
   except ExpatError as e:
+    parse_error = e
+  except RecursionError as e:
+    # charstrings with subroutines that call themselves
+    recursion_error = e
+  finally:
+    # don't capture the messages of others, e.g. if ttx raised another error
+    fonttools_log.removeHandler(logger)
+
+  if len(export_error_msgs):
+    failed = True
+    yield INFO, ("While converting TTF into an XML file,"
+                 " ttx emited the messages listed below.")
+    for msg in export_error_msgs:
+      yield FAIL, msg.strip()
+
+  if len(import_error_msgs):
+    failed = True
+    yield INFO, ("While importing an XML file and converting"
+                 " it back to TTF, ttx emited the messages"
+                 " listed below.")
+    for msg in import_error_msgs:
+      yield FAIL, msg.strip()
+
+  if parse_error is not None:
     failed = True
     yield FAIL, ("TTX had some problem parsing the generated XML file."
                  " This most likely mean there's some problem in the font."
@@ -712,15 +734,20 @@ def com_google_fonts_check_ttx_roundtrip(font):
                  " So, check the entries of the name table and remove any"
                  " control chars that you find there."
 		 " The full ttx error message was:\n"
-		 "======\n{}\n======".format(e))
+		 "======\n{}\n======".format(parse_error))
+
+  if recursion_error is not None:
+    failed = True
+    yield FAIL, ("TTX did not finish converting the font into an XML file"
+                 " and back, it recursed too deeply. This most likely"
+                 " means that some subroutines of the font call"
+                 " themselves, directly or through other subroutines."
+                 " The full ttx error message was:\n"
+                 "======\n{}\n======".format(recursion_error))
 
   if not failed:
     yield PASS, "Hey! It all looks good!"
 
-  # and then we need to cleanup our mess...
-  if os.path.exists(xml_file):
-    os.remove(xml_file)
-
 
 @check(
   id = 'com.google.fonts/check/superfamily/vertical_metrics',
@@ -0,0 +1,231 @@
+"""
+Font Bakery reporters/ndjson writes the events of the Font Bakery
+CheckRunner Protocol as newline delimited JSON, one line per event,
+as soon as the event is received.
+
+Unlike SerializeReporter, which keeps every result until END, only the
+logs of the checks that are currently running are kept. Each line is
+flushed, hence the output can be consumed while the checks still run,
+e.g. by another process.
+
+The lines are objects with an "event" entry:
+
+  {"event": "START", "order": [IDENTITY, ...], "iterargs": {NAME: [VALUE, ...]},
+   "checks": {CHECK_ID: {"description": DESCRIPTION, "rationale": RATIONALE}}}
+  {"event": "ENDCHECK", IDENTITY, "result": STATUS, "logs": [LOG, ...]}
+  {"event": "ENDSECTION", "section": SECTION, "result": {STATUS: COUNT}}
+  {"event": "END", "result": {STATUS: COUNT}}
+
+  IDENTITY: "section": SECTION, "check": CHECK_ID, "iterargs": [[NAME, INDEX], ...]
+  LOG: {"status": STATUS, "message": MESSAGE}
+
+STATUS is the name of a Status. MESSAGE is the result of
+`fontbakery.checkrunner.message_to_data`, `message_from_data` restores it.
+ENDCHECK lines also have the "description" of the check and its "timing"
+if the runner recorded timings. The values of the iterargs in START are
+strings, if they are not JSON serializable.
+
+RecordedRun reads these lines and replays the events to other reporters.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import json
+from collections import Counter
+
+from fontbakery.checkrunner import (
+              Section
+            , Status
+            , DEBUG
+            , STARTCHECK
+            , ENDCHECK
+            , STARTSECTION
+            , ENDSECTION
+            , START
+            , END
+            , message_to_data
+            , message_from_data
+            )
+from fontbakery.reporters import FontbakeryReporter
+
+
+def identity_to_data(identity):
+  section, check, iterargs = identity
+  return {'section': section.name if section else None
+        , 'check': check.id if check else None
+        , 'iterargs': [list(iterarg) for iterarg in iterargs or ()]
+        }
+
+
+class NDJSONReporter(FontbakeryReporter):
+  """
+  usage:
+  >> with open('report.ndjson', 'w') as outFile:
+  >>   reporter = NDJSONReporter(outFile, runner=runner)
+  >>   reporter.run()
+  """
+  def __init__(self, outFile, **kwd):
+    super(NDJSONReporter, self).__init__(**kwd)
+    self._outFile = outFile
+    # logs of the checks that have not ended yet
+    self._logs = {}
+
+  def _write(self, data):
+    self._outFile.write(json.dumps(data, separators=(',', ':'), default=str))
+    self._outFile.write('\n')
+    self._outFile.flush()
+
+  def _register(self, event):
+    super(NDJSONReporter, self)._register(event)
+    status, message, identity = event
+    if status == START:
+      checks = {}
+      for _, check, _ in message:
+        if check.id not in checks:
+          checks[check.id] = {'description': check.description
+                            , 'rationale': check.rationale}
+      data = {'event': status.name
+            , 'order': [identity_to_data(item) for item in message]
+            , 'checks': checks}
+      if self.runner:
+        data['iterargs'] = {name: list(values) for name, values
+                                              in self.runner.iterargs.items()}
+      self._write(data)
+    elif status >= DEBUG:
+      self._logs.setdefault(self._get_key(identity), []).append({
+          'status': status.name
+        , 'message': message_to_data(message)
+      })
+    elif status == ENDCHECK:
+      _, check, _ = identity
+      data = {'event': status.name}
+      data.update(identity_to_data(identity))
+      data.update(result=message.name
+                , description=check.description
+                , logs=self._logs.pop(self._get_key(identity), []))
+      timing = self.runner.get_timing(identity) if self.runner else None
+      if timing is not None:
+        data['timing'] = timing
+      self._write(data)
+    elif status == ENDSECTION:
+      section, _, _ = identity
+      self._write({'event': status.name
+                 , 'section': section.name
+                 , 'result': dict(message)})
+    elif status == END:
+      self._write({'event': status.name, 'result': dict(message)})
+
+
+class RecordedCheck:
+  """ Stands in for a check of a recorded run. """
+  def __init__(self, id, description=None, rationale=None):
+    self.id = id
+    self.description = description
+    self.rationale = rationale
+
+  def __repr__(self):
+    # like FontbakeryCallable, reporters use it as a key
+    return f'<FontBakeryCheck:{self.id}>'
+
+
+class RecordedRun:
+  """ Stands in for the CheckRunner of a run recorded by NDJSONReporter,
+  e.g. to render another report format without running the checks again.
+
+  usage:
+  >> with open('report.ndjson') as f:
+  >>   recorded = RecordedRun(f)
+  >>   sr = SerializeReporter(runner=recorded)
+  >>   sr.run()
+  """
+  def __init__(self, lines):
+    self._lines = iter(lines)
+    start = json.loads(next(self._lines))
+    if start.get('event') != START.name:
+      raise ValueError('A recorded run must begin with a START line.')
+    self._sections = {}
+    self._checks = {name: RecordedCheck(name, **metadata)
+                          for name, metadata in start.get('checks', {}).items()}
+    self._iterargs = {name: tuple(values)
+                          for name, values in start.get('iterargs', {}).items()}
+    self._order = tuple(map(self._get_identity, start['order']))
+    self._timings = {}
+
+  def _get_section(self, name):
+    if name not in self._sections:
+      self._sections[name] = Section(name)
+    return self._sections[name]
+
+  def _get_check(self, check_id):
+    if check_id not in self._checks:
+      self._checks[check_id] = RecordedCheck(check_id)
+    return self._checks[check_id]
+
+  def _get_identity(self, data):
+    return (self._get_section(data['section'])
+          , self._get_check(data['check'])
+          , tuple(tuple(iterarg) for iterarg in data['iterargs']))
+
+  @staticmethod
+  def _get_key(identity):
+    section, check, iterargs = identity
+    return (section.name, check.id, iterargs)
+
+  @property
+  def order(self):
+    return self._order
+
+  @property
+  def iterargs(self):
+    return dict(self._iterargs)
+
+  def get_iterarg(self, name, index):
+    return self._iterargs[name][index]
+
+  def get_timing(self, identity):
+    return self._timings.get(self._get_key(identity), None)
+
+  def run(self, order=None):
+    """ Yields the events of the recorded run, like CheckRunner.run.
+
+    This can be done only once, the lines are read while running.
+    """
+    if order is not None:
+      raise ValueError('The order of a recorded run can\'t be changed.')
+
+    # the order of each section, for the STARTSECTION message
+    section_orders = {}
+    for section, check, iterargs in self._order:
+      section_orders.setdefault(section.name, []).append((check, iterargs))
+
+    yield START, self._order, (None, None, None)
+    current_section = None
+    for line in self._lines:
+      if not line.strip():
+        continue
+      data = json.loads(line)
+      event = data['event']
+      if event == ENDCHECK.name:
+        identity = self._get_identity(data)
+        section, _, _ = identity
+        if current_section is not section:
+          current_section = section
+          yield (STARTSECTION, tuple(section_orders.get(section.name, ()))
+                             , (section, None, None))
+        yield STARTCHECK, None, identity
+        for log in data['logs']:
+          yield Status(log['status']), message_from_data(log['message']), identity
+        if 'timing' in data:
+          self._timings[self._get_key(identity)] = data['timing']
+        yield ENDCHECK, Status(data['result']), identity
+      elif event == ENDSECTION.name:
+        section = self._get_section(data['section'])
+        current_section = None
+        yield ENDSECTION, Counter(data['result']), (section, None, None)
+      elif event == END.name:
+        yield END, Counter(data['result']), (None, None, None)
@@ -107,6 +107,9 @@ class SerializeReporter(FontbakeryReporter):
       item['result'] = message # is a Counter
     if status == ENDCHECK:
       item['result'] = message.name # is a Status
+      timing = self.runner.get_timing(identity) if self.runner else None
+      if timing is not None:
+        item['timing'] = timing
     if status >= DEBUG:
       item['logs'].append(dict(
                           status= status.name
@@ -0,0 +1,195 @@
+"""
+Font Bakery result cache stores the events of executed checks on disk,
+so that the CheckRunner can replay them in a later run instead of
+executing the checks again.
+
+Entries are content addressed, the key is a hash over:
+  * the version of fontbakery (or whatever the caller passes as `version`)
+  * the serialized identity of the check execution (section, check id
+    and iterargs)
+  * the source code of the check and of all conditions it depends on
+  * the values the check depends on. If a value is the path of a file,
+    the contents of that file and of all files in its directory are
+    hashed as well. That way, changes to e.g. a `METADATA.pb` next to a
+    font invalidate the results of the font.
+
+Results of checks that consult remote resources are replayed as well,
+use a fresh cache directory to query these again.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+Domain specific knowledge should be encoded only in the Profile (Checks,
+Conditions) and MAYBE in *customized* reporters e.g. subclasses.
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+from fontbakery.checkrunner import (
+              Status
+            , ERROR
+            , message_to_data
+            , message_from_data
+            )
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024 # bytes
+
+
+class ResultCache:
+  """
+  usage:
+  >> cache = ResultCache('~/.cache/fontbakery', version=fontbakery.__version__)
+  >> runner = CheckRunner(profile, values, result_cache=cache)
+  """
+  def __init__(self, directory, version=None, max_size=DEFAULT_MAX_SIZE):
+    self.directory = os.path.expanduser(directory)
+    os.makedirs(self.directory, exist_ok=True)
+    self.version = version
+    self.max_size = max_size
+    self._file_hashes = {}
+    self._directory_hashes = {}
+
+  def _hash_file(self, path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in self._file_hashes:
+      digest = hashlib.sha256()
+      with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+          digest.update(chunk)
+      self._file_hashes[key] = digest.hexdigest()
+    return self._file_hashes[key]
+
+  def _hash_directory(self, directory):
+    """ Hash of the names of all entries of directory and of the
+    contents of its files, not recursive.
+    """
+    directory = os.path.abspath(directory)
+    if directory not in self._directory_hashes:
+      digest = hashlib.sha256()
+      for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        digest.update(name.encode('utf-8'))
+        if os.path.isfile(path):
+          digest.update(self._hash_file(path).encode('ascii'))
+      self._directory_hashes[directory] = digest.hexdigest()
+    return self._directory_hashes[directory]
+
+  def hash_value(self, value):
+    """ A string describing value, for files including their contents. """
+    if isinstance(value, (list, tuple)):
+      return '[{}]'.format(', '.join(map(self.hash_value, value)))
+    description = repr(value)
+    if isinstance(value, str) and os.path.isfile(value):
+      directory = os.path.dirname(value) or '.'
+      description = '{} {} {}'.format(description, self._hash_file(value)
+                                     , self._hash_directory(directory))
+    return description
+
+  def get_key(self, serialized_identity, sources, values):
+    """
+    serialized_identity: see Profile.serialize_identity
+    sources: an iterable of strings, the source code of the check and
+        its dependencies.
+    values: an iterable of (name, value) tuples that are used by the
+        check, hashed with `hash_value`.
+    """
+    digest = hashlib.sha256()
+    for part in [str(self.version), serialized_identity, *sources]:
+      digest.update(part.encode('utf-8'))
+      digest.update(b'\0')
+    for name, value in values:
+      digest.update('{}={}'.format(name, self.hash_value(value)).encode('utf-8'))
+      digest.update(b'\0')
+    return digest.hexdigest()
+
+  def _path(self, key):
+    return os.path.join(self.directory, f'{key}.json')
+
+  def get(self, key):
+    """ Return the list of (status, message) events stored at key or None. """
+    path = self._path(key)
+    try:
+      with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    except (OSError, ValueError):
+      return None
+    # mark as recently used
+    try:
+      os.utime(path)
+    except OSError:
+      pass
+    events = []
+    for status_name, status_weight, message in data:
+      status = Status(status_name, status_weight)
+      if isinstance(message, list):
+        # the message of ENDCHECK is a status
+        message = Status(*message)
+      else:
+        message = message_from_data(message)
+      events.append((status, message))
+    return events
+
+  def set(self, key, events):
+    """ Store the (status, message) events of a check execution at key.
+
+    Executions that resulted in an ERROR are not stored, an error is
+    usually something that should be fixed or that is temporary, like
+    a network problem.
+    """
+    data = []
+    for status, message in events:
+      if status == ERROR:
+        return False
+      if isinstance(message, Status):
+        message = [message.name, message.weight]
+      else:
+        message = message_to_data(message)
+      data.append((status.name, status.weight, message))
+    try:
+      serialized = json.dumps(data, separators=(',', ':'))
+    except (TypeError, ValueError):
+      # a message that is not JSON serializable
+      return False
+    # write atomically, other processes may read or write the same key.
+    fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+    try:
+      with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(serialized)
+      os.replace(tmp_path, self._path(key))
+    except:
+      os.unlink(tmp_path)
+      raise
+    return True
+
+  def evict(self):
+    """ Remove least recently used entries until the size of all entries
+    is not bigger than self.max_size.
+    """
+    if self.max_size is None:
+      return
+    entries = []
+    total = 0
+    with os.scandir(self.directory) as it:
+      for entry in it:
+        if not entry.name.endswith('.json'):
+          continue
+        try:
+          stat = entry.stat()
+        except OSError:
+          continue
+        entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total += stat.st_size
+    entries.sort()
+    for _, size, path in entries:
+      if total <= self.max_size:
+        break
+      try:
+        os.unlink(path)
+      except OSError:
+        continue
+      total -= size
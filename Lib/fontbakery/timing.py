@@ -0,0 +1,72 @@
+"""
+Font Bakery timing records the resources that checks and conditions load
+and use, e.g. the tables of a font, in the timing of the item that is
+executed in the current thread.
+
+The CheckRunner registers a recorder with set_recorder while it executes
+an item with timings. This module doesn't import the runner, hence
+low-level modules like fontbakery.utils can record their resources
+without depending on it.
+
+Separation of Concerns Disclaimer:
+While created specifically for checking fonts and font-families this
+module has no domain knowledge about fonts. It can be used for any kind
+of (document) checking. Please keep it so. It will be valuable for other
+domains as well.
+"""
+import threading
+from contextlib import contextmanager
+
+# .recorder: records the timing of the item that is executed in the
+# current thread, see set_recorder
+_timing_context = threading.local()
+
+
+def set_recorder(recorder):
+  """ Record the resources used in the current thread with recorder,
+  None stops recording.
+
+  A recorder has the methods:
+    records() -> True if it records the timing of the current item
+    start_timer() -> a timer, None if it records no timing
+    stop_timer(timer, kind, name): record the time since start_timer
+    count_use(kind, name): count a use of a resource
+  """
+  _timing_context.recorder = recorder
+
+
+@contextmanager
+def timed_resource(kind, name):
+  """ Record the time of the with block as the loading of a resource,
+  e.g. a part of a document that is parsed when it is first used, in the
+  timing of the current item as `timing[kind][name]`.
+
+  Like the time of nested conditions, it is not added to the condition
+  or check that needed the resource. Does nothing unless the runner
+  records timings.
+  """
+  recorder = getattr(_timing_context, 'recorder', None)
+  timer = recorder.start_timer() if recorder is not None else None
+  try:
+    yield
+  finally:
+    if timer is not None:
+      recorder.stop_timer(timer, kind, name)
+
+
+def records_timings():
+  """ True if the runner records the timing of the current item, in this
+  thread. See timed_resource and count_resource_use.
+  """
+  recorder = getattr(_timing_context, 'recorder', None)
+  return recorder is not None and recorder.records()
+
+
+def count_resource_use(kind, name):
+  """ Count a use of a resource in the timing of the current item,
+  as `timing[kind][name]['uses']`. Does nothing unless the runner records
+  timings.
+  """
+  recorder = getattr(_timing_context, 'recorder', None)
+  if recorder is not None:
+    recorder.count_use(kind, name)
@@ -14,10 +14,30 @@
 # limitations under the License.
 #
 import os
-
+import struct
+import threading
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, namedtuple
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain, compress
+
+from fontTools.misc.textTools import Tag
 from fontTools.ttLib import TTFont
+from fontTools.ttLib.tables._g_l_y_f import (Glyph,
+                                             GlyphCoordinates,
+                                             SCALED_COMPONENT_OFFSET,
+                                             UNSCALED_COMPONENT_OFFSET,
+                                             SCALE_COMPONENT_OFFSET_DEFAULT)
 from typing import Text, Optional
 
+from fontbakery.timing import (count_resource_use,
+                               records_timings,
+                               timed_resource)
+
+
 def text_flow(content, width=80, indent=0, left_margin=0,
               space_padding=False, text_color="{}".format):
   result = ""
@@ -103,28 +123,349 @@ def get_absolute_path(p):
   return abspath
 
 
+class TrackedTTFont(TTFont):
+  """ A TTFont that records the use of its tables.
+
+  Like any TTFont, a table is decompiled when it is first used. With
+  timings, the runner records the time it takes to decompile each table
+  and the number of uses of each table as `timing['tables'][tag]` of the
+  check that used it (see fontbakery.timing.timed_resource).
+  Without timings, the tables are looked up like in any TTFont.
+
+  Tables are loaded under a lock, hence the font can be read from
+  several threads.
+
+  table_uses: {tag: number of uses} while timings were recorded
+  """
+  def __init__(self, *args, **kwds):
+    super().__init__(*args, **kwds)
+    self.table_uses = Counter()
+    # reentrant, decompiling a table may load other tables
+    self._tables_lock = threading.RLock()
+    # a table is in self.tables before it is decompiled completely
+    self._loading = set()
+
+  def __getitem__(self, tag):
+    if not records_timings():
+      table = self.tables.get(tag)
+      if table is not None and tag not in self._loading:
+        return table
+    with self._tables_lock:
+      tag = Tag(tag)
+      if records_timings():
+        self.table_uses[tag] += 1
+        count_resource_use('tables', tag)
+      if tag in self.tables:
+        return super().__getitem__(tag)
+      self._loading.add(tag)
+      try:
+        # the tables it uses are recorded on their own
+        with timed_resource('tables', tag):
+          return super().__getitem__(tag)
+      finally:
+        self._loading.discard(tag)
+
+
+# (absolute path, mtime, size): TTFont, as long as anybody uses the font
+_shared_ttFonts = weakref.WeakValueDictionary()
+_shared_ttFonts_lock = threading.Lock()
+
+
+def get_shared_ttFont(path):
+  """ The parsed font of a file, shared within the process.
+
+  As long as a TTFont of the file is in use, e.g. as the result of the
+  `ttFont` condition, the same object is returned for the same path, so
+  the tables are not parsed again. A file that changed on disk is parsed
+  again.
+
+  The TTFont must not be modified: use `TTFont(path)` for a private copy.
+  """
+  abspath = os.path.abspath(path)
+  stat = os.stat(abspath)
+  key = (abspath, stat.st_mtime_ns, stat.st_size)
+  with _shared_ttFonts_lock:
+    ttFont = _shared_ttFonts.get(key)
+    if ttFont is None:
+      ttFont = _shared_ttFonts[key] = TrackedTTFont(path)
+    return ttFont
+
+
 def get_bounding_box(font):
     """ Returns max and min bbox of given truetype font """
-    ymin = 0
-    ymax = 0
     if font.sfntVersion == 'OTTO':
-        ymin = font['head'].yMin
-        ymax = font['head'].yMax
+        return font['head'].yMin, font['head'].yMax
+    return GlyphMetrics(font).y_bounds()
+
+
+class GlyphMetrics:
+  """ The metrics of all glyphs of a font as arrays, which are indexed
+  like glyph_names, the glyphs of the 'hmtx' table:
+
+    advances, lsbs: from 'hmtx'.
+    xMin, yMin, xMax, yMax: the bounding boxes from 'glyf', 0 for glyphs
+                            without outlines (see has_bbox).
+    has_bbox: 1 for glyphs with a bounding box, 0 otherwise. This is
+              empty if the font has no 'glyf' table.
+
+  The bounding boxes are read from the glyph headers; glyphs that were
+  not decompiled yet stay that way.
+  Use the `glyph_metrics` condition to share it among checks.
+  """
+  _glyph_header = struct.Struct('>hhhhh')
+
+  def __init__(self, ttFont):
+    metrics = ttFont['hmtx'].metrics if 'hmtx' in ttFont else {}
+    self.glyph_names = tuple(metrics)
+    self.advances = array('l', (advance for advance, _ in metrics.values()))
+    self.lsbs = array('l', (lsb for _, lsb in metrics.values()))
+
+    self.has_bbox = bytearray()
+    self.xMin, self.yMin, self.xMax, self.yMax = (array('l') for _ in range(4))
+    if 'glyf' in ttFont:
+      self._read_bboxes(ttFont['glyf'].glyphs)
+    self._index = None
+
+  def _read_bboxes(self, glyphs):
+    unpack = self._glyph_header.unpack_from
+    bboxes = []
+    has_bbox = self.has_bbox
+    for name in self.glyph_names:
+      glyph = glyphs.get(name, None)
+      data = getattr(glyph, 'data', None)
+      if data:
+        bboxes.append(unpack(data)[1:])
+        has_bbox.append(1)
+      elif hasattr(glyph, 'yMin'):
+        bboxes.append((glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax))
+        has_bbox.append(1)
+      else:
+        bboxes.append((0, 0, 0, 0))
+        has_bbox.append(0)
+    if bboxes:
+      for target, values in zip((self.xMin, self.yMin, self.xMax, self.yMax),
+                                zip(*bboxes)):
+        target.extend(values)
+
+  def __len__(self):
+    return len(self.glyph_names)
+
+  @property
+  def index(self):
+    """ {glyph name: index} """
+    if self._index is None:
+      self._index = {name: i for i, name in enumerate(self.glyph_names)}
+    return self._index
+
+  def advance(self, glyph_name):
+    return self.advances[self.index[glyph_name]]
+
+  def y_bounds(self):
+    """ (min yMin, max yMax) of all glyphs with a bounding box and 0. """
+    return (min(0, min(compress(self.yMin, self.has_bbox), default=0))
+          , max(0, max(compress(self.yMax, self.has_bbox), default=0)))
+
+
+GlyphOutline = namedtuple('GlyphOutline',
+                          'coordinates end_points flags components bounds')
+GlyphOutline.__doc__ = """ The decoded outline of a TrueType glyph.
+
+  coordinates: array('d') of x, y, x, y, ... with the components of
+               composite glyphs flattened, like Glyph.getCoordinates.
+  end_points: tuple, the indexes of the last point of each contour.
+  flags: bytes, the point flags.
+  components: tuple, the names of the direct components.
+  bounds: (xMin, yMin, xMax, yMax) of the glyph header or None if
+          the glyph is empty.
+"""
+
+
+class GlyphOutlines:
+  """ The decoded outlines of the glyphs of a TrueType font.
+
+  Each glyph is decoded once, when it is first needed. Composite glyphs
+  are flattened from the memoized outlines of their components.
+  Use the `glyph_outlines` condition to share it among checks.
+  """
+  def __init__(self, ttFont):
+    self._glyf = ttFont['glyf']
+    self._outlines = {}
+    self._resolving = set()
+    self._contour_counts = {}
+
+  @property
+  def glyph_names(self):
+    return self._glyf.keys()
+
+  def __contains__(self, glyph_name):
+    return glyph_name in self._glyf.glyphs
+
+  def __getitem__(self, glyph_name):
+    outline = self._outlines.get(glyph_name, None)
+    if outline is None:
+      if glyph_name in self._resolving:
+        from fontTools.ttLib import TTLibError
+        raise TTLibError(f"glyph '{glyph_name}' contains"
+                         f" a recursive component reference")
+      self._resolving.add(glyph_name)
+      try:
+        outline = self._outlines[glyph_name] = self._decode(glyph_name)
+      finally:
+        self._resolving.discard(glyph_name)
+    return outline
+
+  def _decode(self, glyph_name):
+    glyph = self._glyf[glyph_name]  # expands the glyph
+    bounds = (glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax) \
+                                      if hasattr(glyph, 'xMin') else None
+    if not glyph.isComposite():
+      if glyph.numberOfContours > 0:
+        coordinates, end_points, flags = glyph.getCoordinates(self._glyf)
+      else:
+        coordinates, end_points, flags = (), (), b''
+      return GlyphOutline(_flat_coordinates(coordinates)
+                        , tuple(end_points), bytes(flags), (), bounds)
+
+    all_coordinates = GlyphCoordinates()
+    all_end_points = []
+    all_flags = bytearray()
+    for component in glyph.components:
+      outline = self[component.glyphName]
+      coordinates = _glyph_coordinates(outline.coordinates)
+      _transform_component(component, coordinates, all_coordinates)
+      offset = len(all_coordinates)
+      all_end_points.extend(end + offset for end in outline.end_points)
+      all_coordinates.extend(coordinates)
+      all_flags.extend(outline.flags)
+    return GlyphOutline(_flat_coordinates(all_coordinates)
+                      , tuple(all_end_points), bytes(all_flags)
+                      , tuple(c.glyphName for c in glyph.components), bounds)
+
+  def points(self, glyph_name):
+    """ The (x, y) points of the glyph, like iterating over the
+    coordinates of Glyph.getCoordinates. """
+    coordinates = self[glyph_name].coordinates
+    return [(int(x) if x.is_integer() else x, int(y) if y.is_integer() else y)
+            for x, y in zip(coordinates[0::2], coordinates[1::2])]
+
+  def contour_count(self, glyph_name):
+    """ The number of contours, including those of the components
+    (except .ttfautohint). """
+    count = self._contour_counts.get(glyph_name, None)
+    if count is None:
+      glyph = self._glyf[glyph_name]
+      if glyph.isComposite():
+        count = sum(self.contour_count(component.glyphName)
+                    for component in glyph.components
+                    if component.glyphName != '.ttfautohint')
+      else:
+        count = glyph.numberOfContours
+      self._contour_counts[glyph_name] = count
+    return count
+
+  def draw(self, glyph_name, pen):
+    """ Draw the flattened outline of the glyph with pen. """
+    outline = self[glyph_name]
+    glyph = Glyph()
+    glyph.numberOfContours = len(outline.end_points)
+    glyph.coordinates = _glyph_coordinates(outline.coordinates)
+    glyph.endPtsOfContours = list(outline.end_points)
+    glyph.flags = bytearray(outline.flags)
+    glyph.draw(pen, self._glyf)
+
+
+def _flat_coordinates(coordinates):
+  """ GlyphCoordinates as array('d') of x, y, x, y, ... """
+  if hasattr(coordinates, 'array'):
+    # fontTools keeps them like that
+    return array('d', coordinates.array)
+  return array('d', chain.from_iterable(coordinates))
+
+
+def _glyph_coordinates(flat):
+  """ array('d') of x, y, x, y, ... as GlyphCoordinates """
+  coordinates = GlyphCoordinates()
+  target = getattr(coordinates, 'array', None)
+  if isinstance(target, array) and target.typecode == 'd':
+    target.extend(flat)
+  else:
+    coordinates.extend(zip(flat[0::2], flat[1::2]))
+  return coordinates
+
+
+def _transform_component(component, coordinates, base_coordinates):
+  """ Place the coordinates of a component like Glyph.getCoordinates. """
+  if hasattr(component, 'firstPt'):
+    # the component is aligned by a point of the base glyph
+    if hasattr(component, 'transform'):
+      coordinates.transform(component.transform)
+    x1, y1 = base_coordinates[component.firstPt]
+    x2, y2 = coordinates[component.secondPt]
+    coordinates.translate((x1 - x2, y1 - y2))
+  elif not hasattr(component, 'transform'):
+    coordinates.translate((component.x, component.y))
+  else:
+    apple_way = component.flags & SCALED_COMPONENT_OFFSET
+    ms_way = component.flags & UNSCALED_COMPONENT_OFFSET
+    if apple_way or (not ms_way and SCALE_COMPONENT_OFFSET_DEFAULT):
+      # first move, then scale (ie. scale the component offset)
+      coordinates.translate((component.x, component.y))
+      coordinates.transform(component.transform)
     else:
-        for g in font['glyf'].glyphs:
-            char = font['glyf'][g]
-            if hasattr(char, 'yMin') and ymin > char.yMin:
-                ymin = char.yMin
-            if hasattr(char, 'yMax') and ymax < char.yMax:
-                ymax = char.yMax
-    return ymin, ymax
+      # first scale, then move
+      coordinates.transform(component.transform)
+      coordinates.translate((component.x, component.y))
+
+
+class NameIndex:
+  """ The records of the name table of a font, grouped by
+  (nameID, platformID, platEncID, langID), and their decoded strings.
+
+  It is a snapshot of the name table, built with a single pass over it.
+  Use the `name_index` condition to share it among checks.
+  """
+  def __init__(self, ttFont):
+    self._by_key = {}
+    self._by_name_id = {}
+    for entry in ttFont['name'].names:
+      key = (entry.nameID, entry.platformID, entry.platEncID, entry.langID)
+      self._by_key.setdefault(key, []).append(entry)
+      self._by_name_id.setdefault(entry.nameID, []).append(entry)
+    self._strings = {}
+
+  def entries(self, nameID, platformID=None, encodingID=None, langID=None):
+    """ The records matching the given IDs, in the order of the table.
+    None matches any ID. """
+    if None not in (platformID, encodingID, langID):
+      return list(self._by_key.get((nameID, platformID, encodingID, langID), ()))
+    return [entry for entry in self._by_name_id.get(nameID, ())
+                  if (platformID is None or entry.platformID == platformID) and
+                     (encodingID is None or entry.platEncID == encodingID) and
+                     (langID is None or entry.langID == langID)]
+
+  def string(self, entry):
+    """ The decoded string of a record, decoded once. """
+    key = id(entry)
+    if key not in self._strings:
+      self._strings[key] = entry.string.decode(entry.getEncoding())
+    return self._strings[key]
+
+  def strings(self, nameID, platformID=None, encodingID=None, langID=None):
+    return [self.string(entry) for entry
+                 in self.entries(nameID, platformID, encodingID, langID)]
 
 
 def get_name_entries(font,
                      nameID,
                      platformID=None,
                      encodingID=None,
-                     langID=None):
+                     langID=None,
+                     name_index=None):
+  """ name_index: the NameIndex of font, if it is known already.
+  Without it the name table is scanned, building an index for a
+  single lookup would take longer. """
+  if name_index is not None:
+    return name_index.entries(nameID, platformID, encodingID, langID)
   results = []
   for entry in font['name'].names:
     if entry.nameID == nameID and \
@@ -139,7 +480,11 @@ def get_name_entry_strings(font,
                            nameID,
                            platformID=None,
                            encodingID=None,
-                           langID=None):
+                           langID=None,
+                           name_index=None):
+  """ name_index: the NameIndex of font, if it is known already. """
+  if name_index is not None:
+    return name_index.strings(nameID, platformID, encodingID, langID)
   entries = get_name_entries(font, nameID, platformID, encodingID, langID)
   return list(map(lambda e: e.string.decode(e.getEncoding()), entries))
 
@@ -162,27 +507,23 @@ def get_glyph_name(font: TTFont, codepoint: int) -> Optional[str]:
   return None
 
 
-def glyph_contour_count(font, name):
+def glyph_contour_count(font, name, outlines=None):
     """Contour count for specified glyph.
     This implementation will also return contour count for
     composite glyphs.
+
+    outlines: a GlyphOutlines of font, to share the decoded glyphs.
+    """
+    if outlines is None:
+        outlines = GlyphOutlines(font)
+    return outlines.contour_count(name)
+
+
+def get_font_glyph_data(font, outlines=None):
+    """Return information for each glyph in a font
+
+    outlines: a GlyphOutlines of font, to share the decoded glyphs.
     """
-    contour_count = 0
-    items = [font['glyf'][name]]
-
-    while items:
-        g = items.pop(0)
-        if g.isComposite():
-            for comp in g.components:
-                if comp.glyphName != ".ttfautohint":
-                    items.append(font['glyf'][comp.glyphName])
-        if g.numberOfContours != -1:
-            contour_count += g.numberOfContours
-    return contour_count
-
-
-def get_font_glyph_data(font):
-    """Return information for each glyph in a font"""
     from fontbakery.constants import (PlatformID,
                                       WindowsEncodingID)
     font_data = []
@@ -200,11 +541,13 @@ def get_font_glyph_data(font):
         return None
 
     cmap_reversed = dict(zip(cmap.values(), cmap.keys()))
+    if outlines is None:
+        outlines = GlyphOutlines(font)
 
     for glyph_name in font.getGlyphSet().keys():
         if glyph_name in cmap_reversed:
             uni_glyph = cmap_reversed[glyph_name]
-            contours = glyph_contour_count(font, glyph_name)
+            contours = glyph_contour_count(font, glyph_name, outlines)
             font_data.append({
                 'unicode': uni_glyph,
                 'name': glyph_name,
@@ -243,11 +586,17 @@ class BadCertificateSetupException(Exception):
 
 
 def download_file(url):
-  from urllib.request import urlopen
+  """ The contents of url as a BytesIO or None if the server responded
+  with an error status. Downloaded through the shared Fetcher, see
+  fontbakery.fetcher.
+  """
   from urllib.error import URLError
   from io import BytesIO
+  from fontbakery.fetcher import get_fetcher
   try:
-    return BytesIO(urlopen(url).read())
+    response = get_fetcher().fetch(url)
+    if response.status_code < 400:
+      return BytesIO(response.content)
   except URLError as e:
     if "CERTIFICATE_VERIFY_FAILED" in str(e.reason):
       raise BadCertificateSetupException("You probably installed official"
@@ -259,36 +608,236 @@ def download_file(url):
 
 
 def cff_glyph_has_ink(font: TTFont, glyph_name: Text) -> bool:
-  if 'CFF2' in font:
-    top_dict = font['CFF2'].cff.topDictIndex[0]
-  else:
-    top_dict = font['CFF '].cff.topDictIndex[0]
-  char_strings = top_dict.CharStrings
-  char_string = char_strings[glyph_name]
-  bounds = char_string.calcBounds(char_strings)
-  if bounds is not None:
-    return True
-
-  return False
+  return InkMap(font)[glyph_name]
 
 
 def ttf_glyph_has_ink(font: TTFont, name: Text) -> bool:
-  glyph = font['glyf'].glyphs[name]
-  glyph.expand(font['glyf'])
+  return InkMap(font)[name]
+
+
+class _InkFound(Exception):
+  pass
 
-  if not glyph.isComposite():
+
+class _InkPen:
+  """ Stops drawing a CFF charstring at its first segment. """
+  def __init__(self, ink_map):
+    self._ink_map = ink_map
+
+  def moveTo(self, pt):
+    raise _InkFound()
+
+  lineTo = curveTo = qCurveTo = moveTo
+
+  def closePath(self):
+    pass
+
+  endPath = closePath
+
+  def addComponent(self, glyphName, transformation):
+    # seac
+    if self._ink_map[glyphName]:
+      raise _InkFound()
+
+
+class InkMap(Mapping):
+  """ {glyph name: whether the glyph has ink}, for all glyphs of a font.
+
+  A glyph has ink if it has a contour of at least 3 points ('glyf') or
+  if its charstring draws anything ('CFF ', 'CFF2'). Composites have ink
+  if any of their components has ink.
+
+  Each glyph is looked at once, when it is first needed, and only as
+  far as necessary: TrueType glyphs are not decompiled, CFF charstrings
+  are executed up to their first segment.
+  Use the `ink_map` condition to share it among checks.
+  """
+  def __init__(self, ttFont):
+    self._ttFont = ttFont
+    self._ink = {}
+    if 'glyf' in ttFont:
+      self._glyf = ttFont['glyf']
+      self._has_ink = self._glyf_has_ink
+    elif ('CFF ' in ttFont) or ('CFF2' in ttFont):
+      cff = ttFont['CFF2' if 'CFF2' in ttFont else 'CFF ']
+      self._char_strings = cff.cff.topDictIndex[0].CharStrings
+      self._has_ink = self._cff_has_ink
+    else:
+      raise Exception("Could not find 'glyf', 'CFF ', or 'CFF2' table.")
+
+  def __getitem__(self, glyph_name):
+    ink = self._ink.get(glyph_name, None)
+    if ink is None:
+      ink = self._ink[glyph_name] = self._has_ink(glyph_name)
+    return ink
+
+  def __iter__(self):
+    return iter(self._ttFont.getGlyphOrder())
+
+  def __len__(self):
+    return len(self._ttFont.getGlyphOrder())
+
+  def _glyf_has_ink(self, glyph_name):
+    glyph = self._glyf.glyphs[glyph_name]
+    data = getattr(glyph, 'data', None)
+    if data is not None:
+      # not decompiled yet, read it from the binary
+      if not data:
+        return False
+      number_of_contours, = struct.unpack_from('>h', data)
+      if number_of_contours < 0:
+        return any(self[name] for name in glyph.getComponentNames(self._glyf))
+      if number_of_contours == 0:
+        return False
+      last_point, = struct.unpack_from('>H', data, 10 + 2 * (number_of_contours - 1))
+      # you need at least 3 points to draw
+      return last_point + 1 > 2
+
+    if glyph.isComposite():
+      return any(self[component.glyphName] for component in glyph.components)
     if glyph.numberOfContours == 0:
       return False
-    (coords, _, _) = glyph.getCoordinates(font['glyf'])
     # you need at least 3 points to draw
-    return len(coords) > 2
+    return len(glyph.coordinates) > 2
 
-  # Check for ink in each sub-component.
-  for glyph_name in glyph.getComponentNames(glyph.components):
-    if glyph_has_ink(font, glyph_name):
+  def _cff_has_ink(self, glyph_name):
+    try:
+      self._char_strings[glyph_name].draw(_InkPen(self))
+    except _InkFound:
       return True
+    return False
+
+
+# The lookup types of extension lookups, which wrap a subtable of another type.
+_EXTENSION_LOOKUP_TYPE = {'GSUB': 7, 'GPOS': 9}
 
-  return False
+
+class LayoutIndex:
+  """ The GSUB and GPOS tables of a font, compiled once into the lookups
+  of each feature, the ligatures and the pair positioning (kerning)
+  subtables. Extension subtables are replaced by the subtables they wrap.
+
+  A table is compiled when it is first needed.
+  Use the `layout_index` condition to share it among checks.
+  """
+  def __init__(self, ttFont):
+    self._ttFont = ttFont
+    self._lookups = {}
+    self._features = {}
+    self._ligatures = None
+    self._ligature_glyphs = None
+    self._pair_positioning = {}
+
+  def lookups(self, table_tag):
+    """ [[(LookupType, subtable), ...], ...] in the order of the LookupList
+    of 'GSUB' or 'GPOS', empty if the font lacks the table. """
+    if table_tag not in self._lookups:
+      lookups = []
+      if table_tag in self._ttFont and self._ttFont[table_tag].table.LookupList:
+        extension_type = _EXTENSION_LOOKUP_TYPE[table_tag]
+        for lookup in self._ttFont[table_tag].table.LookupList.Lookup:
+          subtables = []
+          for subtable in lookup.SubTable:
+            if lookup.LookupType == extension_type:
+              subtables.append((subtable.ExtensionLookupType,
+                                subtable.ExtSubTable))
+            else:
+              subtables.append((lookup.LookupType, subtable))
+          lookups.append(subtables)
+      self._lookups[table_tag] = lookups
+    return self._lookups[table_tag]
+
+  def features(self, table_tag):
+    """ {feature tag: (lookup index, ...)}, the lookups of all the feature
+    records of a tag, in the order they are first referenced. """
+    if table_tag not in self._features:
+      features = {}
+      if self.lookups(table_tag):
+        for record in self._ttFont[table_tag].table.FeatureList.FeatureRecord:
+          indices = features.setdefault(record.FeatureTag, {})
+          indices.update(dict.fromkeys(record.Feature.LookupListIndex))
+      self._features[table_tag] = {tag: tuple(indices)
+                                   for tag, indices in features.items()}
+    return self._features[table_tag]
+
+  def feature_subtables(self, table_tag, feature_tag, lookup_type):
+    """ The subtables of a lookup type in the lookups of a feature. """
+    lookups = self.lookups(table_tag)
+    for index in self.features(table_tag).get(feature_tag, ()):
+      for subtable_type, subtable in lookups[index]:
+        if subtable_type == lookup_type:
+          yield subtable
+
+  def _compile_ligatures(self):
+    components = {}
+    ligature_glyphs = {}
+    for subtable in self.feature_subtables('GSUB', 'liga', 4):
+      for first, ligatures in subtable.ligatures.items():
+        first_components = components.setdefault(first, {})
+        for ligature in ligatures:
+          first_components[tuple(ligature.Component)] = None
+          ligature_glyphs[ligature.LigGlyph] = None
+    self._ligatures = {first: list(first_components)
+                       for first, first_components in components.items()}
+    self._ligature_glyphs = list(ligature_glyphs)
+
+  @property
+  def ligatures(self):
+    """ {first glyph: [(component, ...), ...]} of the ligature
+    substitutions of the 'liga' feature. """
+    if self._ligatures is None:
+      self._compile_ligatures()
+    return self._ligatures
+
+  @property
+  def ligature_glyphs(self):
+    """ [ligature glyph, ...] of the 'liga' feature. """
+    if self._ligatures is None:
+      self._compile_ligatures()
+    return self._ligature_glyphs
+
+  @property
+  def has_pair_positioning(self):
+    """ Whether 'GPOS' has any pair adjustment subtable. """
+    return any(subtable_type == 2
+               for lookup in self.lookups('GPOS')
+               for subtable_type, _ in lookup)
+
+  def _compile_pair_positioning(self, feature_tag):
+    pair_sets = {}
+    class_pairs = []
+    for subtable in self.feature_subtables('GPOS', feature_tag, 2):
+      if subtable.Format == 1:
+        for first, pair_set in zip(subtable.Coverage.glyphs, subtable.PairSet):
+          pair_sets.setdefault(first, set()).update(
+            record.SecondGlyph for record in pair_set.PairValueRecord)
+      elif subtable.Format == 2:
+        class_pairs.append((set(subtable.Coverage.glyphs),
+                            subtable.ClassDef1.classDefs,
+                            subtable.ClassDef2.classDefs,
+                            subtable.Class1Record))
+    return pair_sets, class_pairs
+
+  def is_kerned(self, first, second, feature_tag='kern'):
+    """ Whether the pair adjustments of a feature have a record for the
+    glyph pair: a format 1 pair set, or a format 2 class pair with a
+    non-zero value. """
+    if feature_tag not in self._pair_positioning:
+      self._pair_positioning[feature_tag] = \
+        self._compile_pair_positioning(feature_tag)
+    pair_sets, class_pairs = self._pair_positioning[feature_tag]
+    if second in pair_sets.get(first, ()):
+      return True
+    for coverage, class_def1, class_def2, class1_records in class_pairs:
+      if first not in coverage:
+        continue
+      record = class1_records[class_def1.get(first, 0)] \
+                 .Class2Record[class_def2.get(second, 0)]
+      for value in (getattr(record, 'Value1', None),
+                    getattr(record, 'Value2', None)):
+        if value is not None and any(vars(value).values()):
+          return True
+    return False
 
 
 def unicoderange_bit_name(bit):
@@ -311,27 +860,71 @@ def get_preferred_cmap(ttFont):
     return None
 
 
+@lru_cache(maxsize=None)
+def _unicoderange_index():
+  """ The ranges of UNICODERANGE_DATA as sorted, non-overlapping segments.
+
+  Returns (starts, covering): the codepoints from starts[i] up to
+  starts[i + 1] - 1 are in the ranges of covering[i], which may be empty,
+  a tuple of (UNICODERANGE_DATA position, UnicodeRange bit) of each range.
+  A position may hold the ranges of several bits.
+  """
+  from fontbakery.constants import UNICODERANGE_DATA
+  boundaries = set()
+  for entries in UNICODERANGE_DATA:
+    for _, _, first, last in entries:
+      boundaries.update((first, last + 1))
+  starts = sorted(boundaries)
+  covering = [[] for _ in starts]
+  for position, entries in enumerate(UNICODERANGE_DATA):
+    for bit, _, first, last in entries:
+      for i in range(bisect_left(starts, first), bisect_left(starts, last + 1)):
+        covering[i].append((position, bit))
+  return tuple(starts), tuple(map(tuple, covering))
+
+
+def _unicoderange_segments(codepoints):
+  """ Yields (covering, count) for the segments of _unicoderange_index
+  that hold count > 0 of the codepoints, from a single pass over the
+  sorted codepoints. """
+  starts, covering = _unicoderange_index()
+  codepoints = sorted(codepoints)
+  lo = bisect_left(codepoints, starts[0])
+  for i in range(len(starts) - 1):
+    if lo == len(codepoints):
+      break
+    hi = bisect_left(codepoints, starts[i + 1], lo)
+    if hi > lo:
+      yield covering[i], hi - lo
+    lo = hi
+
+
+def unicoderange_char_counts(codepoints):
+  """ A list with the number of codepoints in the ranges of each
+  UNICODERANGE_DATA position. """
+  from fontbakery.constants import UNICODERANGE_DATA
+  counts = [0] * len(UNICODERANGE_DATA)
+  for ranges, count in _unicoderange_segments(codepoints):
+    for position, _ in ranges:
+      counts[position] += count
+  return counts
+
+
 def chars_in_range(ttFont, bit):
   from fontbakery.constants import UNICODERANGE_DATA
-  cmap = get_preferred_cmap(ttFont)
+  codepoints = sorted(get_preferred_cmap(ttFont))
   chars = []
-  for c in sorted(cmap):
-    for entry in UNICODERANGE_DATA[bit]:
-      if c >= entry[2] and c <= entry[3]:
-        chars.append(c)
-  return chars
+  for _, _, first, last in UNICODERANGE_DATA[bit]:
+    chars.extend(codepoints[bisect_left(codepoints, first):
+                            bisect_right(codepoints, last)])
+  return sorted(chars)
 
 
 def compute_unicoderange_bits(ttFont):
-  from fontbakery.constants import UNICODERANGE_DATA
-  cmap = get_preferred_cmap(ttFont)
   result = 0
-  for c in sorted(cmap):
-    for bit in range(len(UNICODERANGE_DATA)):
-      for entry in UNICODERANGE_DATA[bit]:
-        bit = entry[0]
-        if c >= entry[2] and c <= entry[3]:
-          result |= (1 << bit)
+  for ranges, _ in _unicoderange_segments(get_preferred_cmap(ttFont)):
+    for _, bit in ranges:
+      result |= (1 << bit)
   return result
 
 
@@ -346,12 +939,7 @@ def glyph_has_ink(font: TTFont, name: Text) -> bool:
   Returns:
       True if the font has at least one contour associated with it.
   """
-  if 'glyf' in font:
-    return ttf_glyph_has_ink(font, name)
-  elif ('CFF ' in font) or ('CFF2' in font):
-    return cff_glyph_has_ink(font, name)
-  else:
-    raise Exception("Could not find 'glyf', 'CFF ', or 'CFF2' table.")
+  return InkMap(font)[name]
 
 
 def assert_results_contain(check_results, expected_status, expected_msgcode=None):
@@ -45,7 +45,7 @@ setup(
               'fontbakery.commands',
               'fontbakery.sphinx_extensions'
               ],
-    package_data={'fontbakery': ['data/*.cache']},
+    package_data={'fontbakery': ['data/*.cache', 'data/*.json']},
     classifiers=[
         'Environment :: Console',
         'Intended Audience :: Developers',
@@ -0,0 +1,44 @@
+import json
+import os
+
+import pytest
+
+from run_benchmarks import main, get_families, PROFILES
+
+
+def test_get_families():
+  families = get_families()
+  assert 'montserrat' in families
+  assert all(path.endswith(('.ttf', '.otf'))
+             for fonts in families.values() for path in fonts)
+  assert list(get_families('cabin*')) == ['cabin', 'cabinvfbeta']
+
+
+def test_benchmarks_json_output(tmp_path):
+  output = tmp_path / 'results.json'
+  main(['-f', 'slabo', '-k', 'r*', '-o', str(output)])
+  with open(output) as f:
+    doc = json.load(f)
+  assert doc['families'] == ['slabo']
+  benchmarks = doc['benchmarks']
+  assert set(benchmarks) == {'runner/overhead', 'runner/execution_order'
+                           , 'runner/deserialize_order'
+                           , 'reporter/terminal', 'reporter/serialize'
+                           , 'reporter/ndjson'
+                           , 'reporter/ghmarkdown', 'reporter/html'}
+  for result in benchmarks.values():
+    assert len(result['wall']['all']) == 1
+    assert result['wall']['min'] >= 0 and result['cpu']['min'] >= 0
+  assert benchmarks['runner/overhead']['info']['results'] == {'PASS': 20000}
+  assert benchmarks['runner/deserialize_order']['info']['items'] == 100000
+  assert benchmarks['reporter/html']['info']['length'] > 0
+
+
+@pytest.mark.skipif(not os.environ.get('FONTBAKERY_BENCHMARKS')
+                  , reason='set FONTBAKERY_BENCHMARKS=1 to run all profiles')
+@pytest.mark.parametrize('profile', PROFILES)
+def test_profile_benchmarks(profile):
+  results = main(['-f', 'slabo', '-k', f'profile/{profile}'])
+  info = results[f'profile/{profile}']['info']
+  assert not info['errors']
+  assert sum(info['results'].values()) > 0
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Font Bakery, to quantify the effect of performance work.
+
+  * profile/<name>: full runs of the opentype, universal, googlefonts,
+    notofonts and adobefonts profiles over the font families in data/test,
+    each family directory is checked in a run of its own.
+    Network dependent conditions are replaced by values and all other
+    network access fails immediately, so that the results don't depend
+    on the network. Checks that run external programs which go online
+    are excluded, see EXCLUDED_CHECKS.
+  * runner/overhead: a synthetic Profile with trivial checks, so that
+    mainly the CheckRunner itself is measured.
+  * runner/execution_order: generation of the execution order of the
+    googlefonts profile over all fonts in data/test.
+  * runner/deserialize_order: deserialization and validation of an order
+    of 100k identities.
+  * reporter/<name>: feeding the recorded events of a googlefonts run to
+    a reporter and rendering its document.
+
+usage:
+
+  python tests/benchmarks/run_benchmarks.py -o results.json
+  python tests/benchmarks/run_benchmarks.py -k profile/opentype -r 5
+  python tests/benchmarks/run_benchmarks.py -o new.json --compare old.json
+
+The JSON document written with -o/--output contains per benchmark the
+wall and cpu times of all repetitions, their minimum, median and mean and
+some information about what was done (e.g. the count of executed items).
+"""
+import argparse
+import fnmatch
+import importlib
+import io
+import json
+import os
+import platform
+import socket
+import statistics
+import sys
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+from fontbakery.callable import (check,
+                                 condition,
+                                 FontBakeryExpectedValue as ExpectedValue)
+from fontbakery.checkrunner import (
+              CheckRunner
+            , Profile
+            , Section
+            , SetupError
+            , INFO
+            , PASS
+            , ENDCHECK
+            , STARTSECTION
+            , ENDSECTION
+            )
+
+TEST_DATA = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                         'data', 'test')
+
+PROFILES = ('opentype', 'universal', 'googlefonts', 'notofonts', 'adobefonts')
+
+# The results of these conditions are downloaded. Values override
+# conditions of the same name, see CheckRunner.
+OFFLINE_VALUES = {
+  'listed_on_gfonts_api': False
+, 'remote_styles': None
+, 'api_gfonts_ttFont': None
+, 'github_gfonts_ttFont': None
+}
+
+EXCLUDED_CHECKS = [
+  # runs "pip search", which goes online and may take a while
+  'com.google.fonts/check/fontbakery_version',
+]
+
+
+def get_families(pattern='*'):
+  """ Return an OrderedDict {directory: [font paths]} of all directories
+  in data/test that contain fonts and match pattern.
+  """
+  families = OrderedDict()
+  for root, dirs, files in sorted(os.walk(os.path.normpath(TEST_DATA))):
+    dirs.sort()
+    fonts = [os.path.join(root, name) for name in sorted(files)
+                              if os.path.splitext(name)[1] in ('.ttf', '.otf')]
+    if not fonts:
+      continue
+    relative = os.path.relpath(root, TEST_DATA)
+    if fnmatch.fnmatch(relative, pattern):
+      families[relative] = fonts
+  return families
+
+
+@contextmanager
+def offline():
+  """ Let all attempts to connect to the network fail immediately. """
+  def refuse(*args, **kwds):
+    raise OSError('Network access is disabled in benchmarks.')
+  originals = socket.getaddrinfo, socket.create_connection, socket.socket.connect
+  socket.getaddrinfo = socket.create_connection = socket.socket.connect = refuse
+  try:
+    yield
+  finally:
+    socket.getaddrinfo, socket.create_connection, socket.socket.connect = originals
+
+
+def drain(runner, receivers=()):
+  """ Run runner and return a Counter of the check results. """
+  counter = Counter()
+  for event in runner.run():
+    for receive in receivers:
+      receive(event)
+    status, message, _ = event
+    if status is ENDCHECK:
+      counter[message.name] += 1
+  return counter
+
+
+class Benchmark:
+  """ setup() is called once and not measured, the result of it is
+  passed to run(state) which is called `repeat` times and measured.
+  run returns a dict with information about what was done, which is
+  added to the results.
+  """
+  def __init__(self, name, setup, run):
+    self.name = name
+    self.setup = setup
+    self.run = run
+
+
+def profile_benchmark(profile_name, families):
+  def setup():
+    module = importlib.import_module(f'fontbakery.profiles.{profile_name}')
+    return module.profile
+
+  def run(profile):
+    info = {'families': len(families), 'fonts': 0, 'results': Counter()
+          , 'errors': {}}
+    for family, fonts in families.items():
+      values = dict(OFFLINE_VALUES, fonts=fonts)
+      try:
+        runner = CheckRunner(profile, values, exclude_checks=EXCLUDED_CHECKS)
+      except SetupError as e:
+        # The profile is broken, measure the other families though.
+        info['errors'][family] = f'{type(e).__name__}: {e}'
+        continue
+      info['fonts'] += len(fonts)
+      with offline():
+        info['results'] += drain(runner)
+    return info
+  return Benchmark(f'profile/{profile_name}', setup, run)
+
+
+# A synthetic profile for the runner overhead, the checks are as cheap as
+# possible and share one condition per item.
+@condition
+def thing_length(thing):
+  return len(thing)
+
+
+def _overhead(thing, thing_length):
+  """Overhead"""
+  yield PASS, 'ok'
+
+
+def make_overhead_profile(checks):
+  sections = []
+  for section_index in range(10):
+    # check ids must be unique, hence a check per position
+    section_checks = [
+        check(id=f'com.example/check/overhead/{section_index}/{index}')(_overhead)
+        for index in range(checks // 10)]
+    sections.append(Section(f'Section {section_index}', checks=section_checks))
+  return Profile(sections=sections
+               , iterargs={'thing': 'things'}
+               , conditions={thing_length.name: thing_length}
+               , expected_values={'things': ExpectedValue('things', default=[])})
+
+
+def runner_overhead_benchmark(checks=100, things=200):
+  def setup():
+    return make_overhead_profile(checks)
+
+  def run(profile):
+    values = {'things': [f'thing {index}' for index in range(things)]}
+    runner = CheckRunner(profile, values)
+    return {'results': drain(runner)}
+  return Benchmark('runner/overhead', setup, run)
+
+
+def deserialize_order_benchmark(checks=100, things=1000):
+  """ A sub-order of checks * things identities, as passed e.g. by a
+  distributed worker, is deserialized and validated by the runner.
+  """
+  def setup():
+    profile = make_overhead_profile(checks)
+    values = {'things': [f'thing {index}' for index in range(things)]}
+    runner = CheckRunner(profile, values)
+    serialized = list(profile.serialize_order(runner.order))
+    return profile, values, serialized
+
+  def run(state):
+    profile, values, serialized = state
+    runner = CheckRunner(profile, values)
+    order = runner.check_order(runner.deserialize_order(serialized))
+    return {'items': len(order)}
+  return Benchmark('runner/deserialize_order', setup, run)
+
+
+def execution_order_benchmark(families):
+  fonts = [font for family_fonts in families.values() for font in family_fonts]
+  def setup():
+    from fontbakery.profiles.googlefonts import profile
+    return profile
+
+  def run(profile):
+    values = dict(OFFLINE_VALUES, fonts=fonts)
+    runner = CheckRunner(profile, values)
+    return {'fonts': len(fonts), 'items': len(runner.order)}
+  return Benchmark('runner/execution_order', setup, run)
+
+
+def _record_events(families):
+  from fontbakery.profiles.googlefonts import profile
+  events = []
+  for fonts in families.values():
+    values = dict(OFFLINE_VALUES, fonts=fonts)
+    runner = CheckRunner(profile, values, exclude_checks=EXCLUDED_CHECKS)
+    with offline():
+      events.append((runner, list(runner.run())))
+  return events
+
+
+def reporter_benchmark(name, record_events):
+  def make_reporter(runner):
+    if name == 'terminal':
+      from fontbakery.reporters.terminal import TerminalReporter
+      return TerminalReporter(runner=runner, is_async=False
+                            , print_progress=False, stdout=io.StringIO()
+                            , check_threshold=INFO, log_threshold=INFO
+                            , skip_status_report=(STARTSECTION, ENDSECTION))
+    if name == 'serialize':
+      from fontbakery.reporters.serialize import SerializeReporter
+      return SerializeReporter(runner=runner)
+    if name == 'ndjson':
+      from fontbakery.reporters.ndjson import NDJSONReporter
+      return NDJSONReporter(io.StringIO(), runner=runner)
+    if name == 'ghmarkdown':
+      from fontbakery.reporters.ghmarkdown import GHMarkdownReporter
+      return GHMarkdownReporter(loglevels=None, runner=runner)
+    if name == 'html':
+      from fontbakery.reporters.html import HTMLReporter
+      return HTMLReporter(loglevels=None, runner=runner)
+    raise ValueError(f'Unknown reporter "{name}".')
+
+  def render(reporter):
+    if name == 'serialize':
+      return json.dumps(reporter.getdoc())
+    if name == 'ghmarkdown':
+      return reporter.get_markdown()
+    if name == 'html':
+      return reporter.get_html()
+    if name == 'ndjson':
+      return reporter._outFile.getvalue()
+    return reporter.stdout.getvalue()
+
+  def run(recorded):
+    info = {'events': 0, 'length': 0}
+    for runner, events in recorded:
+      reporter = make_reporter(runner)
+      for event in events:
+        reporter.receive(event)
+      info['events'] += len(events)
+      info['length'] += len(render(reporter))
+    return info
+  return Benchmark(f'reporter/{name}', record_events, run)
+
+
+def get_benchmarks(families):
+  benchmarks = [profile_benchmark(name, families) for name in PROFILES]
+  benchmarks.append(runner_overhead_benchmark())
+  benchmarks.append(execution_order_benchmark(families))
+  benchmarks.append(deserialize_order_benchmark())
+  recorded = []
+  def record_events():
+    # shared by all reporter benchmarks
+    if not recorded:
+      recorded.extend(_record_events(families))
+    return recorded
+  benchmarks += [reporter_benchmark(name, record_events)
+                  for name in ('terminal', 'serialize', 'ndjson', 'ghmarkdown'
+                             , 'html')]
+  return benchmarks
+
+
+def _summarize(values):
+  return {'min': min(values)
+        , 'median': statistics.median(values)
+        , 'mean': statistics.mean(values)
+        , 'all': values
+        }
+
+
+def run_benchmark(benchmark, repeat=1):
+  state = benchmark.setup()
+  walls, cpus = [], []
+  info = None
+  for _ in range(repeat):
+    start = time.perf_counter(), time.process_time()
+    info = benchmark.run(state)
+    walls.append(time.perf_counter() - start[0])
+    cpus.append(time.process_time() - start[1])
+  return {'wall': _summarize(walls), 'cpu': _summarize(cpus), 'info': info}
+
+
+def compare(results, old_results):
+  """ Return lines comparing the minimum wall times of results to
+  old_results.
+  """
+  lines = []
+  for name, result in results.items():
+    if name not in old_results:
+      continue
+    old = old_results[name]['wall']['min']
+    new = result['wall']['min']
+    change = (new - old) / old * 100 if old else 0
+    lines.append(f'{name:32} {old:10.3f}s {new:10.3f}s {change:+8.1f}%')
+  return lines
+
+
+def main(args=None):
+  parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+  parser.add_argument('-o', '--output', type=argparse.FileType('w')
+                    , help='Write the results as JSON to this file.')
+  parser.add_argument('-k', '--filter', default='*'
+                    , help='Run only benchmarks with a name matching this'
+                           ' glob pattern (default: "*").')
+  parser.add_argument('-f', '--families', default='*'
+                    , help='Use only the directories in data/test matching this'
+                           ' glob pattern (default: "*").')
+  parser.add_argument('-r', '--repeat', type=int, default=1
+                    , help='Measure each benchmark this many times (default: 1).')
+  parser.add_argument('--compare', type=argparse.FileType('r'), metavar='OLD_JSON'
+                    , help='Compare the results to these of an earlier run.')
+  args = parser.parse_args(args)
+
+  families = get_families(args.families)
+  results = OrderedDict()
+  for benchmark in get_benchmarks(families):
+    if not fnmatch.fnmatch(benchmark.name, args.filter):
+      continue
+    result = results[benchmark.name] = run_benchmark(benchmark, args.repeat)
+    print(f"{benchmark.name:32} wall {result['wall']['min']:10.3f}s"
+                                f" cpu {result['cpu']['min']:10.3f}s")
+    for family, error in result['info'].get('errors', {}).items():
+      print(f'  {family}: {error}')
+
+  if args.output:
+    doc = {'python': platform.python_version()
+         , 'platform': platform.platform()
+         , 'families': list(families)
+         , 'benchmarks': results
+         }
+    json.dump(doc, args.output, indent=2)
+
+  if args.compare:
+    print(f"\n{'benchmark':32} {'old':>11} {'new':>11} {'change':>9}")
+    for line in compare(results, json.load(args.compare)['benchmarks']):
+      print(line)
+  return results
+
+
+if __name__ == '__main__':
+  sys.exit(main() and 0)
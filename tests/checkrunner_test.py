@@ -0,0 +1,505 @@
+import asyncio
+import os
+
+import pytest
+
+from fontbakery.callable import (check,
+                                 condition,
+                                 FontBakeryExpectedValue as ExpectedValue)
+from fontbakery.checkrunner import (
+              CheckRunner
+            , Profile
+            , Section
+            , PASS
+            , FAIL
+            , ERROR
+            , START
+            , END
+            , ENDCHECK
+            , MissingValueError
+            )
+from fontbakery.message import Message
+from fontbakery.timing import (count_resource_use,
+                               timed_resource)
+
+
+@condition
+def pid(thing):
+  return os.getpid()
+
+
+@check(id='com.example/check/thing_pid')
+def check_thing_pid(thing, pid):
+  """Which process checks thing?"""
+  yield PASS, Message('pid', f'{pid}')
+
+
+@check(id='com.example/check/thing_is_short')
+def check_thing_is_short(thing):
+  """Thing is short?"""
+  if len(thing) > 3:
+    yield FAIL, Message('too-long', f'{thing} is too long.')
+  else:
+    yield PASS, f'{thing} is short.'
+
+
+@check(id='com.example/check/thing_raises')
+def check_thing_raises(thing):
+  """Thing raises?"""
+  raise ValueError(thing)
+
+
+@check(id='com.example/check/all_things')
+def check_all_things(things):
+  """All things are there?"""
+  yield PASS, f'{len(things)} things.'
+
+
+things_expected_value = ExpectedValue('things', default=[])
+
+
+def make_runner(things, **kwds):
+  section = Section('Things', checks=[
+      check_thing_pid
+    , check_thing_is_short
+    , check_thing_raises
+    , check_all_things
+  ])
+  profile = Profile(sections=[section]
+                  , iterargs={'thing': 'things'}
+                  , conditions={pid.name: pid}
+                  , expected_values={'things': things_expected_value})
+  return CheckRunner(profile, values={'things': things}, **kwds)
+
+
+def _comparable(events):
+  return [(status, f'{message}', identity)
+          for status, message, identity in events
+          if status not in (START, END)
+             and (identity[1] is None
+                  or identity[1].id != 'com.example/check/thing_pid')]
+
+
+def test_run_with_jobs_matches_serial_run():
+  things = ['a', 'bb', 'cccc', 'dd', 'eeeee']
+  serial = list(make_runner(things).run())
+  parallel = list(make_runner(things, jobs=3).run())
+
+  assert [s for s, _, _ in serial] == [s for s, _, _ in parallel]
+  assert _comparable(serial) == _comparable(parallel)
+  assert serial[-1][1] == parallel[-1][1]
+
+  # Messages are transported with their codes and tracebacks.
+  codes = [getattr(message, 'code', None) for _, message, _ in parallel]
+  assert 'too-long' in codes
+  errors = [message for status, message, _ in parallel if status == ERROR]
+  assert errors and all(hasattr(message, 'traceback') for message in errors)
+  assert {message for status, message, _ in parallel
+                  if status == ENDCHECK} <= {PASS, FAIL, ERROR}
+
+
+def test_run_with_jobs_shards_by_iterarg():
+  runner = make_runner(['a', 'bb', 'ccc', 'dd'], jobs=2)
+  pids = {}
+  for status, message, (_, check, iterargs) in runner.run():
+    if status == PASS and check.id == 'com.example/check/thing_pid':
+      (_, index), = iterargs
+      pids[index] = int(message.message)
+
+  assert os.getpid() not in pids.values()
+  assert pids[0] == pids[2] and pids[1] == pids[3]
+  assert pids[0] != pids[1]
+
+
+def test_evict_conditions_after_last_use():
+  runner = make_runner(['a', 'bb', 'ccc'], evict_conditions=True
+                     , custom_order=['*check'])
+  order = runner.order
+  evictions = runner._get_condition_evictions(order)
+  # With `-o "*check"` all `thing_pid` items run first, that's
+  # also where each `pid` value is used the last time.
+  assert sorted(key for keys in evictions.values() for key in keys) == [
+      ('pid', (('thing', index),)) for index in range(3)]
+  for position, keys in evictions.items():
+    _, check, _ = order[position]
+    assert check.id == 'com.example/check/thing_pid'
+
+  cached = []
+  for status, _, (_, check, _) in runner.run():
+    if status == ENDCHECK:
+      cached.append(len(runner._cache['conditions']))
+  # values are dropped before the next item runs
+  assert max(cached) == 1
+  assert not runner._cache['conditions']
+
+
+def test_max_cached_conditions():
+  runner = make_runner(['a', 'bb', 'ccc'], max_cached_conditions=1)
+  for index in range(3):
+    runner.get('pid', (('thing', index),))
+  assert list(runner._cache['conditions']) == [('pid', (('thing', 2),))]
+
+
+def test_result_cache_replays_unchanged(tmp_path):
+  from fontbakery.result_cache import ResultCache
+  documents = tmp_path / 'documents'
+  documents.mkdir()
+  things = []
+  for name in ('a', 'b'):
+    path = documents / name
+    path.write_text(name)
+    things.append(str(path))
+
+  def run():
+    cache = ResultCache(str(tmp_path / 'cache'), version='1')
+    runner = make_runner(things, result_cache=cache)
+    return [(status, f'{message}', getattr(message, 'code', None))
+            for status, message, (_, check, _) in runner.run()
+            if check and check.id == 'com.example/check/thing_is_short']
+
+  first = run()
+  # The check of the first run and the replayed one are equal.
+  assert run() == first
+  assert any(code == 'too-long' for _, _, code in first)
+
+  cache_dir = tmp_path / 'cache'
+  entries = set(os.listdir(cache_dir))
+  # thing_raises has an ERROR result, it's not cached.
+  assert len(entries) == 2 * 2 + 1
+  run()
+  assert set(os.listdir(cache_dir)) == entries
+
+  # changing a file in the directory of the things invalidates
+  (documents / 'METADATA').write_text('changed')
+  run()
+  assert len(set(os.listdir(cache_dir)) - entries) == 5
+
+
+def test_result_cache_evict(tmp_path):
+  from fontbakery.result_cache import ResultCache
+  cache = ResultCache(str(tmp_path), max_size=None)
+  for index in range(5):
+    assert cache.set(f'{index}', [(PASS, Message('ok', 'fine'))
+                                , (ENDCHECK, PASS)])
+    os.utime(tmp_path / f'{index}.json', ns=(index, index))
+  size = os.path.getsize(tmp_path / '0.json')
+  cache.max_size = size * 2
+  cache.evict()
+  assert sorted(os.listdir(tmp_path)) == ['3.json', '4.json']
+  (status, message), end = cache.get('4')
+  assert status is PASS and message.code == 'ok' and end == (ENDCHECK, PASS)
+
+
+def test_timings():
+  for jobs in (1, 2):
+    runner = make_runner(['a', 'bb'], timings=True, jobs=jobs)
+    pid_evaluations = []
+    for status, _, identity in runner.run():
+      if status != ENDCHECK:
+        continue
+      # complete when ENDCHECK is received
+      timing = runner.get_timing(identity)
+      assert timing['wall'] >= timing['check']['wall'] >= 0
+      assert timing['cpu'] >= 0
+      if 'pid' in timing['conditions']:
+        pid_evaluations.append(identity[2])
+    # attributed to the first item that used the condition
+    assert sorted(pid_evaluations) == [(('thing', 0),), (('thing', 1),)]
+    assert len(list(runner.timings)) == len(runner.order)
+
+  assert make_runner(['a']).get_timing(runner.order[0]) is None
+
+
+@check(id='com.example/check/thing_resources')
+def check_thing_resources(thing):
+  """Thing uses resources?"""
+  with timed_resource('parts', 'head'):
+    count_resource_use('parts', 'head')
+  count_resource_use('parts', 'tail')
+  yield PASS, 'used'
+
+
+def test_timed_resources():
+  section = Section('Things', checks=[check_thing_resources])
+  profile = Profile(sections=[section], iterargs={'thing': 'things'}
+                  , expected_values={'things': things_expected_value})
+  runner = CheckRunner(profile, values={'things': ['a']}, timings=True)
+  list(runner.run())
+  timing, = (timing for _, timing in runner.timings)
+  assert timing['parts']['head']['uses'] == 1
+  assert timing['parts']['head']['wall'] >= 0
+  assert timing['parts']['tail'] == {'wall': 0.0, 'cpu': 0.0, 'uses': 1}
+  # not recorded outside of a run
+  with timed_resource('parts', 'head'):
+    count_resource_use('parts', 'head')
+  assert timing['parts']['head']['uses'] == 1
+
+
+@condition
+def thing_length(thing):
+  return len(thing)
+
+
+def test_args_plan():
+  def uses_aliases(item, length, missing, optional=None):
+    pass
+  section = Section('Aliases', checks=[check_thing_is_short])
+  profile = Profile(sections=[section]
+                  , iterargs={'thing': 'things'}
+                  , conditions={thing_length.name: thing_length}
+                  , aliases={'item': 'thing', 'length': 'thing_length'}
+                  , expected_values={'things': things_expected_value})
+  runner = CheckRunner(profile, values={'things': ['a', 'bb']})
+  item = condition(uses_aliases)
+
+  plan = runner._get_args_plan(item)
+  assert [(name, optional, kind) for name, optional, (kind, _) in plan] == [
+      ('item', False, 'iterargs')
+    , ('length', False, 'conditions')
+    , ('missing', False, 'missing')
+    , ('optional', True, 'missing')]
+  # compiled once
+  assert runner._get_args_plan(item) is plan
+
+  iterargs = (('thing', 1),)
+  assert runner.get('length', iterargs) == 2
+  assert runner.get('missing', iterargs, 'fallback') == 'fallback'
+  with pytest.raises(MissingValueError, match='Value "missing" is undefined.'):
+    runner._get_args(item, iterargs)
+  # an optional argument that can't be resolved is left out
+  runner = CheckRunner(profile, values={'things': ['a', 'bb'], 'missing': 0})
+  assert runner._get_args(item, iterargs) == {'item': 'bb', 'length': 2
+                                            , 'missing': 0}
+
+
+def test_deserialize_and_check_order():
+  runner = make_runner(['a', 'bb', 'ccc'])
+  profile = runner.profile
+  sub_order = runner.order[1::2]
+  serialized = list(profile.serialize_order(sub_order))
+
+  order = runner.deserialize_order(serialized)
+  assert order == sub_order
+  assert all(ours is theirs for ours, theirs in zip(order, sub_order))
+  assert runner.check_order(profile.deserialize_order(serialized)) == sub_order
+  assert len(list(runner.run(order=order))) > len(sub_order)
+
+  other = make_runner(['a'])
+  with pytest.raises(ValueError):
+    other.deserialize_order(serialized)
+  with pytest.raises(ValueError):
+    other.check_order(sub_order)
+
+
+@condition
+async def thing_echo(thing):
+  await asyncio.sleep(0.2)
+  if thing == 'boom':
+    raise ValueError(thing)
+  return thing
+
+
+@check(id='com.example/check/thing_echo')
+def check_thing_echo(thing, thing_echo):
+  """Thing echoes?"""
+  yield PASS, f'{thing_echo}'
+
+
+@check(id='com.example/check/thing_async')
+async def check_thing_async(thing):
+  """Thing is checked by a coroutine?"""
+  await asyncio.sleep(0.2)
+  if thing == 'boom':
+    raise ValueError(thing)
+  return PASS, f'{thing} awaited'
+
+
+@check(id='com.example/check/thing_async_generator')
+async def check_thing_async_generator(thing, thing_echo):
+  """Thing is checked by an async generator?"""
+  for character in thing_echo:
+    await asyncio.sleep(0)
+    yield PASS, character
+
+
+def make_async_runner(things, **kwds):
+  section = Section('Async things', checks=[
+      check_thing_echo
+    , check_thing_async
+    , check_thing_async_generator
+  ])
+  profile = Profile(sections=[section]
+                  , iterargs={'thing': 'things'}
+                  , conditions={thing_echo.name: thing_echo}
+                  , expected_values={'things': things_expected_value})
+  return CheckRunner(profile, values={'things': things}, **kwds)
+
+
+def test_async_checks_and_conditions():
+  import time
+  things = ['a', 'bb', 'boom', 'ccc', 'd']
+  start = time.perf_counter()
+  events = list(make_async_runner(things, timings=True).run())
+  duration = time.perf_counter() - start
+  # 10 awaitables of 0.2 seconds overlap
+  assert duration < 1
+
+  results = {}
+  for status, message, (_, check, iterargs) in events:
+    if status in (PASS, ERROR):
+      (_, index), = iterargs
+      results.setdefault((check.id.split('/')[-1], things[index]), []) \
+             .append((status, f'{message}'))
+  assert results[('thing_echo', 'bb')] == [(PASS, 'bb')]
+  assert results[('thing_async', 'ccc')] == [(PASS, 'ccc awaited')]
+  assert results[('thing_async_generator', 'bb')] == [(PASS, 'b'), (PASS, 'b')]
+  for check_name in ('thing_echo', 'thing_async', 'thing_async_generator'):
+    (status, _), = results[(check_name, 'boom')]
+    assert status == ERROR
+
+  # the same events in the same order, without overlapping
+  serial = list(make_async_runner(things, async_lookahead=0).run())
+  assert _comparable(events) == _comparable(serial)
+  assert serial[-1][1] == events[-1][1]
+
+  # and in worker processes
+  parallel = list(make_async_runner(things, jobs=2).run())
+  assert _comparable(parallel) == _comparable(serial)
+
+
+@condition(prefetch=True)
+def thing_fetched(thing):
+  import threading
+  import time
+  time.sleep(0.2)
+  if thing == 'boom':
+    raise ValueError(thing)
+  return thing, threading.current_thread() is threading.main_thread()
+
+
+@check(id='com.example/check/thing_fetched')
+def check_thing_fetched(thing, thing_fetched):
+  """Thing is fetched?"""
+  value, in_main_thread = thing_fetched
+  yield PASS, f'{value} main thread: {in_main_thread}'
+
+
+def make_prefetch_runner(things, **kwds):
+  section = Section('Prefetched things', checks=[check_thing_fetched])
+  profile = Profile(sections=[section]
+                  , iterargs={'thing': 'things'}
+                  , conditions={thing_fetched.name: thing_fetched}
+                  , expected_values={'things': things_expected_value})
+  return CheckRunner(profile, values={'things': things}, **kwds)
+
+
+def test_prefetch_conditions():
+  import time
+  things = ['a', 'bb', 'boom', 'ccc', 'd']
+  start = time.perf_counter()
+  events = list(make_prefetch_runner(things, prefetch_workers=5).run())
+  duration = time.perf_counter() - start
+  # 5 conditions of 0.2 seconds overlap
+  assert duration < 0.8
+
+  messages = [f'{message}' for status, message, _ in events if status == PASS]
+  assert messages == [f'{thing} main thread: False'
+                            for thing in things if thing != 'boom']
+  assert [status for status, _, _ in events].count(ERROR) == 1
+
+  serial = list(make_prefetch_runner(things, prefetch_workers=0).run())
+  assert [status for status, _, _ in serial] \
+         == [status for status, _, _ in events]
+  assert [f'{message}' for status, message, _ in serial if status == PASS] \
+         == [f'{thing} main thread: True' for thing in things if thing != 'boom']
+
+
+@condition(prefetch=True)
+def thing_downloaded(thing):
+  import threading
+  import time
+  time.sleep(0.1)
+  return thing, threading.current_thread() is threading.main_thread()
+
+
+@condition
+def thing_unpacked(thing_downloaded):
+  thing, in_main_thread = thing_downloaded
+  return thing.upper(), in_main_thread
+
+
+@condition(prefetch=True)
+def thing_analysed(thing_unpacked):
+  return thing_unpacked
+
+
+@check(id='com.example/check/thing_analysed')
+def check_thing_analysed(thing_analysed):
+  """Thing is analysed?"""
+  thing, in_main_thread = thing_analysed
+  yield PASS, f'{thing} downloaded in main thread: {in_main_thread}'
+
+
+def test_prefetch_dependencies_first():
+  things = ['a', 'bb', 'ccc']
+  conditions = [thing_downloaded, thing_unpacked, thing_analysed]
+  section = Section('Analysed things', checks=[check_thing_analysed])
+  profile = Profile(sections=[section]
+                  , iterargs={'thing': 'things'}
+                  , conditions={c.name: c for c in conditions}
+                  , expected_values={'things': things_expected_value})
+  runner = CheckRunner(profile, values={'things': things}, prefetch_workers=3)
+  messages = [f'{message}' for status, message, _ in runner.run()
+                                                      if status == PASS]
+  # thing_analysed waits for thing_downloaded, which was prefetched
+  # instead of being evaluated for it in the thread of the runner.
+  assert messages == [f'{thing.upper()} downloaded in main thread: False'
+                                                      for thing in things]
+
+
+busy_things = []
+
+
+@condition(prefetch=True)
+def thing_busy(thing):
+  import time
+  busy_things.append(thing)
+  time.sleep(0.2)
+  busy_things.remove(thing)
+  return thing
+
+
+@condition(prefetch=True, thread_safe=False)
+def thing_in_main_thread(thing):
+  import threading
+  return threading.current_thread() is threading.main_thread()
+
+
+@check(id='com.example/check/thing_alone', thread_safe=False)
+def check_thing_alone(thing, thing_in_main_thread):
+  """Thing is checked alone?"""
+  yield PASS, f'busy: {busy_things} main thread: {thing_in_main_thread}'
+
+
+@check(id='com.example/check/thing_busy')
+def check_thing_busy(thing_busy):
+  """Thing is busy?"""
+  yield PASS, thing_busy
+
+
+def test_not_thread_safe():
+  things = ['a', 'bb', 'ccc']
+  section = Section('Busy things', checks=[check_thing_alone, check_thing_busy])
+  profile = Profile(sections=[section]
+                  , iterargs={'thing': 'things'}
+                  , conditions={thing_busy.name: thing_busy
+                              , thing_in_main_thread.name: thing_in_main_thread}
+                  , expected_values={'things': things_expected_value})
+  runner = CheckRunner(profile, values={'things': things}, prefetch_workers=3)
+  messages = [f'{message}' for status, message, _ in runner.run()
+                                                      if status == PASS]
+  # the prefetched thing_busy conditions were started before the first
+  # item, check_thing_alone waited for them.
+  assert messages == [message for thing in things
+                              for message in ('busy: [] main thread: True'
+                                            , thing)]
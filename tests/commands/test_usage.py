@@ -11,7 +11,7 @@ def test_list_subcommands_has_all_scripts():
   commands_dir = os.path.dirname(fontbakery.commands.__file__)
 
   scripts = [
-      f.rstrip(".py").replace("_", "-")
+      f[:-len(".py")].replace("_", "-")
       for f in os.listdir(commands_dir)
       if (f.endswith(".py") and not f.startswith('_'))
   ]
@@ -57,3 +57,21 @@ def test_command_check_ufo_sources():
 
   with pytest.raises(subprocess.CalledProcessError):
     subprocess.check_output(["fontbakery", "check-ufo-sources"])
+
+
+def test_command_replay(tmp_path):
+  """Test if `fontbakery replay` can report a run recorded with --ndjson."""
+  subprocess.check_output(["fontbakery", "replay", "-h"])
+
+  test_font = os.path.join("data", "test", "nunito", "Nunito-Regular.ttf")
+  log = str(tmp_path / "events.ndjson")
+  report = str(tmp_path / "report.json")
+  subprocess.check_output([
+      "fontbakery", "check-googlefonts", "-c", "com.google.fonts/check/canonical_filename",
+      "--ndjson", log, test_font
+  ])
+  subprocess.check_output(["fontbakery", "replay", log, "--json", report])
+  assert os.path.exists(report)
+
+  with pytest.raises(subprocess.CalledProcessError):
+    subprocess.check_output(["fontbakery", "replay"])
@@ -0,0 +1,91 @@
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fontbakery.fetcher import Fetcher, OfflineError
+
+
+@pytest.fixture
+def server():
+  """ A local HTTP server that counts the requests of each path.
+      /family has an ETag. """
+  requests = Counter()
+
+  class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+      requests[self.path] += 1
+      if self.path == '/family':
+        if self.headers.get('If-None-Match') == '"v1"':
+          self.send_response(304)
+          self.end_headers()
+          return
+        body = b'family v1'
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+      else:
+        body = b'not found'
+        self.send_response(404)
+      self.send_header('Content-Length', str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def log_message(self, *args):
+      pass
+
+  httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+  threading.Thread(target=httpd.serve_forever, daemon=True).start()
+  httpd.requests = requests
+  httpd.url = 'http://127.0.0.1:{}'.format(httpd.server_address[1])
+  yield httpd
+  httpd.shutdown()
+  httpd.server_close()
+
+
+def test_fetch_cache(server, tmp_path):
+  url = server.url + '/family'
+  fetcher = Fetcher(cache_dir=str(tmp_path))
+  response = fetcher.fetch(url)
+  assert response.status_code == 200 and response.content == b'family v1'
+  assert response.headers['etag'] == '"v1"'
+  assert fetcher.fetch(url) == response
+  assert server.requests['/family'] == 1
+
+  missing = fetcher.fetch(server.url + '/missing')
+  assert missing.status_code == 404
+
+  # expired entries are revalidated with their ETag
+  expired = Fetcher(cache_dir=str(tmp_path), max_age=-1)
+  assert expired.fetch(url) == response
+  assert server.requests['/family'] == 2
+
+  offline = Fetcher(cache_dir=str(tmp_path), offline=True, max_age=-1)
+  assert offline.fetch(url) == response
+  assert offline.fetch(server.url + '/missing').status_code == 404
+  with pytest.raises(OfflineError):
+    offline.fetch(server.url + '/other')
+  assert server.requests == {'/family': 2, '/missing': 1}
+
+
+def test_fetch_base_urls(server):
+  fetcher = Fetcher(base_urls={'https://fonts.example/': server.url + '/'
+                             , 'https://fonts.example/download/': server.url + '/'})
+  assert fetcher.resolve('https://fonts.example/download/family') \
+         == server.url + '/family'
+  assert fetcher.fetch('https://fonts.example/family').content == b'family v1'
+  assert fetcher.resolve('https://other.example/family') \
+         == 'https://other.example/family'
+
+
+def test_download_file(server):
+  from fontbakery.fetcher import get_fetcher, set_fetcher
+  from fontbakery.utils import download_file
+
+  default = get_fetcher()
+  set_fetcher(Fetcher(base_urls={'https://fonts.example/': server.url + '/'}))
+  try:
+    assert download_file('https://fonts.example/family').read() == b'family v1'
+    assert download_file('https://fonts.example/missing') is None
+  finally:
+    set_fetcher(default)
@@ -0,0 +1,48 @@
+import io
+import json
+
+from fontbakery import glyphdata
+from fontbakery.commands.generate_glyphdata import dump_glyph_data
+
+
+def test_glyphdata_lookup_maps():
+  """The lookup maps are built once and leave out the Private Use Areas."""
+  by_codepoint = glyphdata.desired_glyph_contours_by_codepoint()
+  by_glyphname = glyphdata.desired_glyph_contours_by_glyphname()
+  assert by_codepoint is glyphdata.desired_glyph_contours_by_codepoint()
+  assert by_glyphname is glyphdata.desired_glyph_contours_by_glyphname()
+
+  assert by_codepoint[ord('a')] == by_glyphname['a']
+  assert not any(glyphdata.in_PUA_range(codepoint) for codepoint in by_codepoint)
+
+  glyph_data = glyphdata.get_desired_glyph_data()
+  assert {glyph['name'] for glyph in glyph_data} == set(by_glyphname)
+  # each call returns a new list, it can be changed by the caller
+  assert glyph_data is not glyphdata.get_desired_glyph_data()
+
+
+def test_generate_glyphdata_format():
+  """`fontbakery generate-glyphdata` writes the rows read by glyphdata."""
+  glyph_file = io.StringIO()
+  dump_glyph_data([{'name': 'a', 'unicode': 97, 'contours': {3, 2}},
+                   {'name': 'b', 'unicode': 98, 'contours': {2}}],
+                  glyph_file)
+  assert glyph_file.getvalue() == '[\n["a",97,[2,3]],\n["b",98,[2]]\n]\n'
+  assert json.loads(glyph_file.getvalue()) == [["a", 97, [2, 3]],
+                                               ["b", 98, [2]]]
+
+
+def test_desired_glyph_data_attribute(monkeypatch):
+  """`desired_glyph_data` is still available, also on Python 3.6."""
+  import importlib.util
+  import sys
+  from fontbakery.glyphdata import desired_glyph_data
+  assert desired_glyph_data == glyphdata.get_desired_glyph_data()
+
+  monkeypatch.setattr(sys, 'version_info', (3, 6, 15))
+  spec = importlib.util.spec_from_file_location('glyphdata_py36'
+                                              , glyphdata.__file__)
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  assert not hasattr(module, '__getattr__')
+  assert module.desired_glyph_data == desired_glyph_data
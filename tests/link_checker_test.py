@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from fontbakery.link_checker import LinkChecker
+
+
+@pytest.fixture
+def server():
+  """ A local HTTP server that counts the requests of each path. """
+  requests = Counter()
+
+  class Handler(BaseHTTPRequestHandler):
+    def do_HEAD(self):
+      requests[self.path] += 1
+      if self.path == '/slow':
+        time.sleep(0.5)
+      if self.path == '/moved':
+        self.send_response(301)
+        self.send_header('Location', '/ok')
+      else:
+        self.send_response(404 if self.path == '/missing' else 200)
+      self.end_headers()
+
+    def log_message(self, *args):
+      pass
+
+  httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+  thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+  thread.start()
+  httpd.requests = requests
+  httpd.url = 'http://127.0.0.1:{}'.format(httpd.server_address[1])
+  yield httpd
+  httpd.shutdown()
+  httpd.server_close()
+
+
+def test_check_links(server):
+  checker = LinkChecker(timeout=0.2)
+  urls = [server.url + path for path in ('/ok', '/missing', '/moved'
+                                        , '/slow', '/ok')]
+  statuses = checker.check(urls)
+  assert list(statuses) == urls[:4]
+  ok, missing, moved, slow = statuses.values()
+  assert ok.ok and ok.status_code == 200
+  assert not missing.ok and missing.status_code == 404
+  assert moved.ok
+  assert slow.timed_out and slow.status_code is None
+
+  # each URL was requested once, the results are kept
+  assert checker.check(urls[:2]) == {url: statuses[url] for url in urls[:2]}
+  assert server.requests['/ok'] == 2 # once directly, once redirected
+  assert server.requests['/missing'] == 1
+
+  closed = checker.check(['http://127.0.0.1:1/'])['http://127.0.0.1:1/']
+  assert closed.status_code is None and closed.error and not closed.timed_out
+
+
+def test_check_links_cache_dir(server, tmp_path):
+  urls = [server.url + '/missing', server.url + '/slow']
+  LinkChecker(timeout=0.2, cache_dir=str(tmp_path)).check(urls)
+  # the timeout is not stored
+  assert len(list(tmp_path.iterdir())) == 1
+
+  statuses = LinkChecker(timeout=2, cache_dir=str(tmp_path)).check(urls)
+  assert statuses[urls[0]].status_code == 404
+  assert statuses[urls[1]].ok
+  assert server.requests == {'/missing': 1, '/slow': 2}
+
+  # expired
+  LinkChecker(cache_dir=str(tmp_path), max_age=-1).check(urls[:1])
+  assert server.requests['/missing'] == 2
@@ -53,11 +53,12 @@ def test_get_family_checks():
 def test_check_find_empty_letters():
     from fontbakery.profiles.adobefonts import \
         com_adobe_fonts_check_find_empty_letters as check
+    from fontbakery.profiles.shared_conditions import ink_map
 
     # this font has inked glyphs for all letters
     font_path = TEST_FILE('source-sans-pro/OTF/SourceSansPro-Regular.otf')
     test_font = TTFont(font_path)
-    status, message = list(check(test_font))[-1]
+    status, message = list(check(test_font, ink_map(test_font)))[-1]
     assert status == PASS
 
     # this font has empty glyphs for several letters
@@ -65,6 +66,6 @@ def test_check_find_empty_letters():
     test_font = TTFont(font_path)
 
     expected_message = "U+007A should be visible, but its glyph ('z') is empty."
-    status, message = list(check(test_font))[-1]
+    status, message = list(check(test_font, ink_map(test_font)))[-1]
     assert status == FAIL
     assert message == expected_message
@@ -56,3 +56,24 @@ def test_check_cff2_call_depth():
 
     for status, msg in results:
       assert (status, msg.code, msg.message) in EXPECTED_RESULTS
+
+
+def test_subr_call_depths():
+    from types import SimpleNamespace
+    from fontbakery.profiles.cff import _SubrCallDepths, MAX_CALL_DEPTH
+
+    def chain(length):
+        # subr i calls subr i + 1 (bias 0), the last one calls nothing
+        return [SimpleNamespace(program=[i + 1, 'callsubr'] if i + 1 < length else [])
+                for i in range(length)]
+
+    for length in (MAX_CALL_DEPTH, MAX_CALL_DEPTH + 1, 5000):
+        call_depths = _SubrCallDepths([], 0, chain(length), 0)
+        assert call_depths.max_depth([0, 'callsubr']) == \
+            min(length, MAX_CALL_DEPTH + 1)
+
+    # a global subr that calls itself
+    global_subrs = [SimpleNamespace(program=['rlineto', 0, 'callgsubr'])]
+    call_depths = _SubrCallDepths(global_subrs, 0, None, None)
+    assert call_depths.max_depth([0, 'callgsubr']) == MAX_CALL_DEPTH + 1
+    assert call_depths.max_depth(['endchar']) == 0
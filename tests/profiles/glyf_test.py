@@ -49,16 +49,36 @@ def test_check_glyf_unused_data():
   assert message.code == "missing-data"
 
 
+def test_glyph_outlines():
+  """ The decoded outlines match the glyf table, composites flattened. """
+  from fontbakery.utils import GlyphOutlines
+
+  ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+  glyf = ttFont['glyf']
+  outlines = GlyphOutlines(ttFont)
+  for name in ['a', 'aacute', 'space', 'quotedbl']:
+    coordinates, end_points, flags = glyf[name].getCoordinates(glyf)
+    assert outlines.points(name) == list(coordinates)
+    assert outlines[name].end_points == tuple(end_points)
+    assert outlines[name].flags == bytes(flags)
+    # memoized
+    assert outlines[name] is outlines[name]
+
+  assert outlines['aacute'].components
+  assert outlines.contour_count('aacute') == 3
+
+
 def test_check_points_out_of_bounds():
   """ Check for points out of bounds. """
   from fontbakery.profiles.glyf import com_google_fonts_check_points_out_of_bounds as check
+  from fontbakery.profiles.shared_conditions import glyph_outlines
 
   test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_outlines(test_font)))[-1]
   assert status == WARN and message.code == "points-out-of-bounds"
 
   test_font2 = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
-  status, _ = list(check(test_font2))[-1]
+  status, _ = list(check(test_font2, glyph_outlines(test_font2)))[-1]
   assert status == PASS
 
 
@@ -213,36 +213,61 @@ def test_check_canonical_filename():
   # TODO: FAIL, "varfont-with-static-filename"
 
 
-def test_check_description_broken_links():
+@pytest.fixture
+def link_server():
+  """ A local stand-in for the linked websites.
+      Paths starting with /broken are not found. """
+  import threading
+  from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+  class Handler(BaseHTTPRequestHandler):
+    def do_HEAD(self):
+      self.send_response(404 if self.path.startswith('/broken') else 200)
+      self.end_headers()
+
+    def log_message(self, *args):
+      pass
+
+  httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+  threading.Thread(target=httpd.serve_forever, daemon=True).start()
+  yield 'http://127.0.0.1:{}'.format(httpd.server_address[1])
+  httpd.shutdown()
+  httpd.server_close()
+
+
+def test_check_description_broken_links(link_server):
   """ Does DESCRIPTION file contain broken links ? """
+  from fontbakery.link_checker import LinkChecker
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_description_broken_links as check,
     description,
     descfile)
 
+  link_checker = LinkChecker()
   good_desc = description(descfile(TEST_FILE("cabin/Cabin-Regular.ttf")))
   print('Test PASS with description file that has no links...')
-  status, message = list(check(good_desc))[-1]
+  status, message = list(check(good_desc, link_checker))[-1]
   assert status == PASS
 
-  good_desc += ("<a href='http://example.com'>Good Link</a>"
-                "<a href='http://fonts.google.com'>Another Good One</a>")
+  good_desc += (f"<a href='{link_server}/'>Good Link</a>"
+                f"<a href='{link_server}/fonts'>Another Good One</a>")
   print('Test PASS with description file that has good links...')
-  status, message = list(check(good_desc))[-1]
+  status, message = list(check(good_desc, link_checker))[-1]
   assert status == PASS
 
   good_desc += "<a href='mailto:juca@members.fsf.org'>An example mailto link</a>"
   print('Test INFO/PASS with a description file containing a mailto links...')
-  status, message = list(check(good_desc))[-2]
+  status, message = list(check(good_desc, link_checker))[-2]
   assert status == INFO and message.code == "email"
 
-  status, message = list(check(good_desc))[-1]
+  status, message = list(check(good_desc, link_checker))[-1]
   assert status == PASS
 
-  bad_desc = good_desc + "<a href='http://thisisanexampleofabrokenurl.com/'>This is a Bad Link</a>"
+  bad_desc = good_desc + f"<a href='{link_server}/broken'>This is a Bad Link</a>"
   print('Test FAIL with a description file containing a known-bad URL...')
-  status, message = list(check(bad_desc))[-1]
+  status, message = list(check(bad_desc, link_checker))[-1]
   assert status == FAIL and message.code == "broken-links"
+  assert f"{link_server}/broken (status code: 404)" in message.message
 
   #TODO: WARN, "timeout"
 
@@ -354,6 +379,7 @@ def test_check_description_max_length():
 
 def test_check_name_family_and_style_max_length(): 
   """ Combined length of family and style must not exceed 27 characters. """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import ( 
     com_google_fonts_check_name_family_and_style_max_length as check) 
  
@@ -362,7 +388,7 @@ def test_check_name_family_and_style_max_length():
  
   # So it must PASS the check: 
   print ("Test PASS with a good font...") 
-  status, message = list(check(ttFont))[-1] 
+  status, message = list(check(ttFont, name_index(ttFont)))[-1] 
   assert status == PASS 
  
   # Then we emit a WARNing with long family/style names 
@@ -380,7 +406,7 @@ def test_check_name_family_and_style_max_length():
       break 
 
   print ("Test WARN with a bad font...") 
-  status, message = list(check(ttFont))[-1] 
+  status, message = list(check(ttFont, name_index(ttFont)))[-1] 
   assert status == WARN and message.code == "too-long"
 
   # Now let's restore the good Cabin Regular...
@@ -395,7 +421,7 @@ def test_check_name_family_and_style_max_length():
       break 
  
   print ("Test WARN with a bad font...") 
-  status, message = list(check(ttFont))[-1] 
+  status, message = list(check(ttFont, name_index(ttFont)))[-1] 
   assert status == WARN and message.code == "too-long"
 
 
@@ -458,14 +484,31 @@ def test_check_metadata_designer_values():
   assert status == FAIL and message.code == "slash"
 
 
-def test_check_metadata_broken_links():
+def test_check_metadata_broken_links(link_server):
   """ Does DESCRIPTION file contain broken links? """
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_broken_links as check)
-  # TODO: Implement-me!
-  # INFO, "email"
-  # WARN, "timeout"
-  # FAIL, "broken-links"
+  from fontbakery.profiles.googlefonts_conditions import family_metadata
+  from fontbakery.link_checker import LinkChecker
+
+  link_checker = LinkChecker()
+  md = family_metadata(portable_path("data/test/cabin"))
+  for font_metadata in md.fonts:
+    font_metadata.copyright = ("Copyright 2018 The Cabin Project Authors"
+                               f" ({link_server}/impallari/Cabin)")
+  print('Test PASS with good links...')
+  status, message = list(check(md, link_checker))[-1]
+  assert status == PASS
+
+  md.fonts[0].copyright = "Copyright 2018 (mailto:juca@members.fsf.org)"
+  print('Test INFO with an email address...')
+  assert_results_contain(check(md, link_checker), INFO, "email")
+
+  md.fonts[1].copyright = f"Copyright 2018 ({link_server}/broken/Cabin)"
+  print('Test FAIL with a broken link...')
+  assert_results_contain(check(md, link_checker), FAIL, "broken-links")
+
+  # TODO: WARN, "timeout"
 
 
 def test_check_metadata_undeclared_fonts():
@@ -1282,6 +1325,7 @@ def test_check_metadata_regular_is_400():
 def test_check_metadata_nameid_family_name():
   """ Checks METADATA.pb font.name field matches
       family name declared on the name table. """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_nameid_family_name as check,
     font_metadata,
@@ -1296,13 +1340,13 @@ def test_check_metadata_nameid_family_name():
 
   # We know that Family Sans Regular is good here:
   print("Test PASS...")
-  status, message = list(check(ttFont, font_meta))[-1]
+  status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
   assert status == PASS
 
   # Then cause it to fail:
   font_meta.name = "Foo"
   print("Test FAIL...")
-  status, message = list(check(ttFont, font_meta))[-1]
+  status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
   assert status == FAIL and message.code == "mismatch"
 
   # TODO: the failure-mode below seems more generic than the scope
@@ -1387,6 +1431,7 @@ def test_check_metadata_nameid_full_name():
 
 def test_check_metadata_nameid_font_name():
   """ METADATA.pb font.name value should be same as the family name declared on the name table. """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_nameid_font_name as check,
     family_metadata,
@@ -1404,7 +1449,7 @@ def test_check_metadata_nameid_font_name():
   family_meta = family_metadata(family_directory)
   font_meta = font_metadata(family_meta, font)
   font_style = style(font)
-  status, message = list(check(ttFont, font_style, font_meta))[-1]
+  status, message = list(check(ttFont, font_style, font_meta, name_index(ttFont)))[-1]
   assert status == PASS
 
   for i, name in enumerate(ttFont["name"].names):
@@ -1412,7 +1457,7 @@ def test_check_metadata_nameid_font_name():
       good = name.string.decode(name.getEncoding()) # keep a copy of the good value
       print("Test FAIL with a bad FULL_FONT_NAME entry...")
       ttFont["name"].names[i].string = (good + "bad-suffix").encode(name.getEncoding())
-      status, message = list(check(ttFont, font_style, font_meta))[-1]
+      status, message = list(check(ttFont, font_style, font_meta, name_index(ttFont)))[-1]
       assert status == FAIL and message.code == "mismatch"
       ttFont["name"].names[i].string = good # restore good value
 
@@ -1518,6 +1563,7 @@ MONTSERRAT_NON_RIBBI = [
 
 def test_check_metadata_valid_name_values():
   """ METADATA.pb font.name field contains font name in right format? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_valid_name_values as check,
     style,
@@ -1533,7 +1579,7 @@ def test_check_metadata_valid_name_values():
     family_directory = os.path.dirname(fontfile)
     family_meta = family_metadata(family_directory)
     font_meta = font_metadata(family_meta, fontfile)
-    font_fnames = font_familynames(ttFont)
+    font_fnames = font_familynames(ttFont, name_index(ttFont))
     font_tfnames = []
 
     # So it must PASS the check:
@@ -1555,7 +1601,7 @@ def test_check_metadata_valid_name_values():
     family_meta = family_metadata(family_directory)
     font_meta = font_metadata(family_meta, fontfile)
     font_fnames = []
-    font_tfnames = typographic_familynames(ttFont)
+    font_tfnames = typographic_familynames(ttFont, name_index(ttFont))
 
     # So it must PASS the check:
     print (f"Test PASS with a good NON-RIBBI font ({fontfile})...")
@@ -1571,6 +1617,7 @@ def test_check_metadata_valid_name_values():
 
 def test_check_metadata_valid_full_name_values():
   """ METADATA.pb font.full_name field contains font name in right format ? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_valid_full_name_values as check,
     style,
@@ -1586,7 +1633,7 @@ def test_check_metadata_valid_full_name_values():
     family_directory = os.path.dirname(fontfile)
     family_meta = family_metadata(family_directory)
     font_meta = font_metadata(family_meta, fontfile)
-    font_fnames = font_familynames(ttFont)
+    font_fnames = font_familynames(ttFont, name_index(ttFont))
     font_tfnames = []
 
     # So it must PASS the check:
@@ -1608,7 +1655,7 @@ def test_check_metadata_valid_full_name_values():
     family_meta = family_metadata(family_directory)
     font_meta = font_metadata(family_meta, fontfile)
     font_fnames = []
-    font_tfnames = typographic_familynames(ttFont)
+    font_tfnames = typographic_familynames(ttFont, name_index(ttFont))
 
     # So it must PASS the check:
     print (f"Test PASS with a good NON-RIBBI font ({fontfile})...")
@@ -1648,6 +1695,7 @@ def test_check_metadata_valid_filename_values():
 
 def test_check_metadata_valid_post_script_name_values():
   """ METADATA.pb font.post_script_name field contains font name in right format? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_valid_post_script_name_values as check,
     family_metadata,
@@ -1661,7 +1709,7 @@ def test_check_metadata_valid_post_script_name_values():
     family_meta = family_metadata(family_directory)
     font_meta = font_metadata(family_meta, fontfile)
     ttFont = TTFont(fontfile)
-    font_fnames = font_familynames(ttFont)
+    font_fnames = font_familynames(ttFont, name_index(ttFont))
 
     # So it must PASS the check:
     print (f"Test PASS with a good font ({fontfile})...")
@@ -1864,6 +1912,7 @@ def test_check_metadata_italic_style():
 
 def test_check_metadata_normal_style():
   """ METADATA.pb font.style "normal" matches font internals ? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.constants import MacStyle
   from fontbakery.profiles.googlefonts import (com_google_fonts_check_metadata_normal_style as check,
                                                      family_metadata,
@@ -1880,7 +1929,7 @@ def test_check_metadata_normal_style():
 
   # So it must PASS the check:
   print ("Test PASS with a good font...")
-  status, message = list(check(ttFont, font_meta))[-1]
+  status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
   assert status == PASS
 
   # now we sadically insert brokenness into
@@ -1890,7 +1939,7 @@ def test_check_metadata_normal_style():
       backup = name.string
       ttFont['name'].names[i].string = "Merriweather-Italic".encode(name.getEncoding())
       print ("Test FAIL with a non-italic font that has a '-Italic' in FONT_FAMILY_NAME...")
-      status, message = list(check(ttFont, font_meta))[-1]
+      status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
       assert status == FAIL and message.code == "familyname-italic"
       # and restore the good value:
       ttFont['name'].names[i].string = backup
@@ -1902,7 +1951,7 @@ def test_check_metadata_normal_style():
       backup = name.string
       ttFont['name'].names[i].string = "Merriweather-Italic".encode(name.getEncoding())
       print ("Test FAIL with a non-italic font that has a '-Italic' in FULL_FONT_NAME...")
-      status, message = list(check(ttFont, font_meta))[-1]
+      status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
       assert status == FAIL and message.code == "fullfont-italic"
       # and restore the good value:
       ttFont['name'].names[i].string = backup
@@ -1914,13 +1963,14 @@ def test_check_metadata_normal_style():
   # comparison to test_check_106 above. Here we have to set the
   # bit back to 1 to get a wrongful "this font is an italic" setting:
   ttFont['head'].macStyle |= MacStyle.ITALIC
-  status, message = list(check(ttFont, font_meta))[-1]
+  status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
   # Not it's not! FAIL! :-D
   assert status == FAIL and message.code == "bad-macstyle"
 
 
 def test_check_metadata_nameid_family_and_full_names():
   """ METADATA.pb font.name and font.full_name fields match the values declared on the name table? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_metadata_nameid_family_and_full_names as check,
     family_metadata,
@@ -1935,7 +1985,7 @@ def test_check_metadata_nameid_family_and_full_names():
 
   # So it must PASS the check:
   print ("Test PASS with a good font...")
-  status, message = list(check(ttFont, font_meta))[-1]
+  status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
   assert status == PASS
 
   # There we go again:
@@ -1946,7 +1996,7 @@ def test_check_metadata_nameid_family_and_full_names():
       backup = name.string
       ttFont['name'].names[i].string = "This is utterly wrong!".encode(name.getEncoding())
       print ("Test FAIL with a METADATA.pb / FULL_FONT_NAME mismatch...")
-      status, message = list(check(ttFont, font_meta))[-1]
+      status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
       assert status == FAIL and message.code == "fullname-mismatch"
       # and restore the good value:
       ttFont['name'].names[i].string = backup
@@ -1957,7 +2007,7 @@ def test_check_metadata_nameid_family_and_full_names():
       backup = name.string
       ttFont['name'].names[i].string = "I'm listening to deadmau5 :-)".encode(name.getEncoding())
       print ("Test FAIL with a METADATA.pb / FONT_FAMILY_NAME mismatch...")
-      status, message = list(check(ttFont, font_meta))[-1]
+      status, message = list(check(ttFont, font_meta, name_index(ttFont)))[-1]
       assert status == FAIL and message.code == "familyname-mismatch"
       # and restore the good value:
       ttFont['name'].names[i].string = backup
@@ -2251,19 +2301,20 @@ def test_check_mac_style():
 def test_check_contour_count(montserrat_ttFonts):
   """Check glyphs contain the recommended contour count"""
   from fontbakery.profiles.googlefonts import com_google_fonts_check_contour_count as check
+  from fontbakery.profiles.shared_conditions import glyph_outlines
 
   # TODO: FAIL, "lacks-cmap"
 
 
   # Montserrat should PASS this check since it was used to assemble the glyph data
   for ttFont in montserrat_ttFonts:
-    status, message = list(check(ttFont))[-1]
+    status, message = list(check(ttFont, glyph_outlines(ttFont)))[-1]
     assert status == PASS
 
   # Lets swap the glyf a (2 contours) with glyf c (1 contour)
   for ttFont in montserrat_ttFonts:
     ttFont['glyf']['a'] = ttFont['glyf']['c']
-    status, message = list(check(ttFont))[-1]
+    status, message = list(check(ttFont, glyph_outlines(ttFont)))[-1]
     assert status == WARN and message.code == "contour-count"
 
 
@@ -3042,11 +3093,11 @@ def test_check_integer_ppem_if_hinted():
 def test_check_ligature_carets():
   """ Is there a caret position declared for every ligature ? """
   from fontbakery.profiles.googlefonts import com_google_fonts_check_ligature_carets as check
-  from fontbakery.profiles.shared_conditions import ligatures
+  from fontbakery.profiles.shared_conditions import layout_index, ligature_glyphs
 
   # Our reference Mada Medium is known to be bad
   ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
-  lig = ligatures(ttFont)
+  lig = ligature_glyphs(layout_index(ttFont))
 
   # So it must emit a WARN:
   print ("Test WARN with a bad font...")
@@ -3055,7 +3106,7 @@ def test_check_ligature_carets():
 
   # And FamilySans Regular is known to be bad
   ttFont = TTFont("data/test/familysans/FamilySans-Regular.ttf")
-  lig = ligatures(ttFont)
+  lig = ligature_glyphs(layout_index(ttFont))
 
   # So it must emit a WARN:
   print ("Test WARN with a bad font...")
@@ -3073,25 +3124,27 @@ def test_check_kerning_for_non_ligated_sequences():
   from fontbakery.profiles.gpos import has_kerning_info
   from fontbakery.profiles.googlefonts import (
     com_google_fonts_check_kerning_for_non_ligated_sequences as check)
-  from fontbakery.profiles.shared_conditions import ligatures
+  from fontbakery.profiles.shared_conditions import layout_index, ligatures
   # Our reference Mada Medium is known to be good
   ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
-  lig = ligatures(ttFont)
-  has_kinfo = has_kerning_info(ttFont)
+  index = layout_index(ttFont)
+  lig = ligatures(index)
+  has_kinfo = has_kerning_info(index)
 
   # So it must PASS the check:
   print ("Test PASS with a good font...")
-  status, message = list(check(ttFont, lig, has_kinfo))[-1]
+  status, message = list(check(index, lig, has_kinfo))[-1]
   assert status == PASS
 
   # And Merriweather Regular is known to be bad
   ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
-  lig = ligatures(ttFont)
-  has_kinfo = has_kerning_info(ttFont)
+  index = layout_index(ttFont)
+  lig = ligatures(index)
+  has_kinfo = has_kerning_info(index)
 
   # So the check must emit a WARN in this testcase:
   print ("Test WARN with a bad font...")
-  status, message = list(check(ttFont, lig, has_kinfo))[-1]
+  status, message = list(check(index, lig, has_kinfo))[-1]
   assert status == WARN and message.code == "lacks-kern-info"
 
 
@@ -3149,35 +3202,34 @@ def NOT_IMPLEMENTED__test_com_google_fonts_check_repo_dirname_match_nameid_1():
 #  assert status == PASS
 
 
-def test_check_repo_vf_has_static_fonts():
+def test_check_repo_vf_has_static_fonts(tmp_path):
   """Check VF family dirs in google/fonts contain static fonts"""
   from fontbakery.profiles.googlefonts import (family_directory,
                                                com_google_fonts_check_repo_vf_has_static_fonts as check)
-  import tempfile
   import shutil
   # in order for this check to work, we need to mimmic the folder structure of
-  # the Google Fonts repository
-  with tempfile.TemporaryDirectory() as tmp_gf_dir:
-    family_dir = portable_path(tmp_gf_dir + "/ofl/testfamily")
-    src_family = portable_path("data/test/varfont")
-    shutil.copytree(src_family, family_dir)
-
-    print("Test FAIL for a vf family which does not has a static dir.")
-    status, message = list(check(family_dir))[-1]
-    assert status == FAIL and message.code == "missing"
-
-    print("Test FAIL for a vf family which has a static dir but no fonts in the static dir.")
-    static_dir = portable_path(family_dir + "/static")
-    os.mkdir(static_dir)
-    status, message = list(check(family_dir))[-1]
-    assert status == FAIL and message.code == "empty"
-
-    print("Test PASS for a vf family which has a static dir and static fonts")
-    static_fonts = portable_path("data/test/cabin")
-    shutil.rmtree(static_dir)
-    shutil.copytree(static_fonts, static_dir)
-    status, message = list(check(family_dir))[-1]
-    assert status == PASS
+  # the Google Fonts repository.
+  # Not portable_path: it turns an absolute path into a relative one.
+  family_dir = str(tmp_path / "ofl" / "testfamily")
+  src_family = portable_path("data/test/varfont")
+  shutil.copytree(src_family, family_dir)
+
+  print("Test FAIL for a vf family which does not has a static dir.")
+  status, message = list(check(family_dir))[-1]
+  assert status == FAIL and message.code == "missing"
+
+  print("Test FAIL for a vf family which has a static dir but no fonts in the static dir.")
+  static_dir = os.path.join(family_dir, "static")
+  os.mkdir(static_dir)
+  status, message = list(check(family_dir))[-1]
+  assert status == FAIL and message.code == "empty"
+
+  print("Test PASS for a vf family which has a static dir and static fonts")
+  static_fonts = portable_path("data/test/cabin")
+  shutil.rmtree(static_dir)
+  shutil.copytree(static_fonts, static_dir)
+  status, message = list(check(family_dir))[-1]
+  assert status == PASS
 
 
 def test_check_vertical_metrics_regressions(cabin_ttFonts):
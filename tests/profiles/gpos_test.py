@@ -15,7 +15,9 @@ from fontTools.ttLib import TTFont
 
 def test_check_gpos_kerning_info():
   """ Does GPOS table have kerning information? """
-  from fontbakery.profiles.gpos import com_google_fonts_check_gpos_kerning_info as check
+  from fontbakery.profiles.gpos import (com_google_fonts_check_gpos_kerning_info as check,
+                                        has_kerning_info)
+  from fontbakery.profiles.shared_conditions import layout_index
 
   # Our reference Mada Regular is known to have kerning-info
   # exclusively on an extension subtable
@@ -24,7 +26,7 @@ def test_check_gpos_kerning_info():
 
   # So it must PASS the check:
   print ("Test PASS with a font that has got kerning info...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(has_kerning_info(layout_index(ttFont))))[-1]
   assert status == PASS
 
   # delete all Pair Adjustment lookups:
@@ -43,18 +45,37 @@ def test_check_gpos_kerning_info():
       break
 
   print ("Test WARN with a font lacking kerning info...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(has_kerning_info(layout_index(ttFont))))[-1]
   assert status == WARN and message.code == "lacks-kern-info"
 
   # setup a fake type=2 Pair Adjustment lookup
   ttFont["GPOS"].table.LookupList.Lookup[0].LookupType = 2
   # and make sure the check emits a PASS result:
   print ("Test PASS with kerning info on a type=2 lookup...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(has_kerning_info(layout_index(ttFont))))[-1]
   assert status == PASS
 
   # remove the GPOS table and make sure to get a WARN:
   del ttFont["GPOS"]
   print ("Test WARN with a font lacking a GPOS table...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(has_kerning_info(layout_index(ttFont))))[-1]
   assert status == WARN and message.code == "lacks-kern-info"
+
+
+def test_layout_index():
+  """ The lookups of the features, with the extension subtables unwrapped. """
+  from fontbakery.profiles.shared_conditions import layout_index
+
+  # Mada Regular has its kerning in extension subtables.
+  index = layout_index(TTFont(TEST_FILE("mada/Mada-Regular.ttf")))
+  assert index.has_pair_positioning
+  kern_lookups = index.features('GPOS')['kern']
+  assert kern_lookups
+  for lookup_index in kern_lookups:
+    assert {lookup_type for lookup_type, _ in index.lookups('GPOS')[lookup_index]} == {2}
+
+  # format 1 pair sets and format 2 class pairs
+  assert index.is_kerned('quotedblbase', 'asterisk')
+  assert index.is_kerned('T', 'o')
+  assert not index.is_kerned('space', 'space')
+  assert not index.is_kerned('T', 'o', feature_tag='mark')
@@ -46,12 +46,13 @@ def test_check_linegaps():
 def test_check_maxadvancewidth():
   """ MaxAdvanceWidth is consistent with values in the Hmtx and Hhea tables? """
   from fontbakery.profiles.hhea import com_google_fonts_check_maxadvancewidth as check
+  from fontbakery.profiles.shared_conditions import glyph_metrics
 
   test_font = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
 
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == PASS
 
   test_font["hmtx"].metrics["A"] = (1234567, 1234567)
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == FAIL and message.code == "mismatch"
@@ -71,7 +71,8 @@ def results_contain(results, expected_status, expected_code):
 def test_check_monospace():
   """ Checking correctness of monospaced metadata. """
   from fontbakery.profiles.name import com_google_fonts_check_monospace as check
-  from fontbakery.profiles.shared_conditions import glyph_metrics_stats
+  from fontbakery.profiles.shared_conditions import (glyph_metrics,
+                                                     glyph_metrics_stats)
   from fontbakery.constants import (PANOSE_Proportion,
                                     IsFixedWidth)
 
@@ -86,14 +87,15 @@ def test_check_monospace():
   # Our reference Mada Regular is a non-monospace font
   # know to have good metadata for this check.
   ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
-  stats = glyph_metrics_stats(ttFont)
-  status, message = list(check(ttFont, stats))[-1]
+  metrics = glyph_metrics(ttFont)
+  stats = glyph_metrics_stats(ttFont, metrics)
+  status, message = list(check(ttFont, stats, metrics))[-1]
   assert status == PASS and message.code == "good"
 
   # We'll mark it as monospaced on the post table and make sure it fails:
   print('Test FAIL with a non-monospaced font with bad post.isFixedPitch value ...')
   ttFont["post"].isFixedPitch = 42 # *any* non-zero value means monospaced
-  status, message = list(check(ttFont, stats))[-1]
+  status, message = list(check(ttFont, stats, metrics))[-1]
   assert status == FAIL and message.code == "bad-post-isFixedPitch"
 
   # restore good value:
@@ -102,7 +104,7 @@ def test_check_monospace():
   # Now we mark it as monospaced on the OS/2 and it should also fail:
   print('Test FAIL with a non-monospaced font with bad OS/2.panose.bProportion value (MONOSPACED) ...')
   ttFont["OS/2"].panose.bProportion = PANOSE_Proportion.MONOSPACED
-  status, message = list(check(ttFont, stats))[-1]
+  status, message = list(check(ttFont, stats, metrics))[-1]
   assert status == FAIL and message.code == "bad-panose-proportion"
 
   # --------------------------------------------
@@ -114,9 +116,10 @@ def test_check_monospace():
   # a monospaced font with good metadata here.
   ttFont = TTFont(TEST_FILE("overpassmono/OverpassMono-Regular.ttf"))
 
-  stats = glyph_metrics_stats(ttFont)
+  metrics = glyph_metrics(ttFont)
+  stats = glyph_metrics_stats(ttFont, metrics)
   assert stats['most_common_width'] == 616
-  status, message = list(check(ttFont, stats))[-1]
+  status, message = list(check(ttFont, stats, metrics))[-1]
   # WARN is emitted when there's at least one outlier.
   # I don't see a good reason to be picky and also test that one separately here...
   assert (status == WARN and message.code == "mono-outliers") or \
@@ -128,7 +131,7 @@ def test_check_monospace():
   # here we search for the expected FAIL among all results
   # instead of simply looking at the last one
   # because we may also get an outliers WARN in some cases:
-  results = list(check(ttFont, stats))
+  results = list(check(ttFont, stats, metrics))
   assert results_contain(results, FAIL, "mono-bad-post-isFixedPitch")
 
   # There are several bad panose proportion values for a monospaced font.
@@ -150,7 +153,7 @@ def test_check_monospace():
     print(f'Test FAIL with a monospaced font with bad OS/2.panose.bProportion value ({bad_value}) ...')
     ttFont["OS/2"].panose.bProportion = bad_value
     # again, we search the expected FAIL because we may algo get an outliers WARN here:
-    results = list(check(ttFont, stats))
+    results = list(check(ttFont, stats, metrics))
     assert results_contain(results, FAIL, "mono-bad-panose-proportion")
 
 
@@ -177,13 +180,14 @@ def test_check_name_line_breaks():
 
 def test_check_name_match_familyname_fullfont():
   """ Does full font name begin with the font family name? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.name import com_google_fonts_check_name_match_familyname_fullfont as check
   # Our reference Mada Regular is known to be good
   ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
 
   # So it must PASS the check:
   print ("Test PASS with a good font...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(ttFont, name_index(ttFont)))[-1]
   assert status == PASS
 
   # alter the full-font-name prepending a bad prefix:
@@ -193,7 +197,7 @@ def test_check_name_match_familyname_fullfont():
 
   # and make sure the check FAILs:
   print ("Test FAIL with a font in which the family name begins with a digit...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(ttFont, name_index(ttFont)))[-1]
   assert status == FAIL and message.code == "does-not"
 
   print ("Test FAIL with no FULL_FONT_NAME entries...")
@@ -201,7 +205,7 @@ def test_check_name_match_familyname_fullfont():
   for i, name in enumerate(ttFont["name"].names):
     if name.nameID == NameID.FULL_FONT_NAME:
       del ttFont["name"].names[i]
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(ttFont, name_index(ttFont)))[-1]
   assert status == FAIL and message.code == "no-full-font-name"
 
   print ("Test FAIL with no FONT_FAMILY_NAME entries...")
@@ -209,15 +213,16 @@ def test_check_name_match_familyname_fullfont():
   for i, name in enumerate(ttFont["name"].names):
     if name.nameID == NameID.FONT_FAMILY_NAME:
       del ttFont["name"].names[i]
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(ttFont, name_index(ttFont)))[-1]
   assert status == FAIL and message.code == "no-font-family-name"
 
 def assert_name_table_check_result(ttFont, index, name, check, value, expected_result, expected_keyword=None):
+  from fontbakery.profiles.shared_conditions import name_index
   backup = name.string
   # set value
   ttFont["name"].names[index].string = value.encode(name.getEncoding())
   # run check
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(ttFont, name_index(ttFont)))[-1]
   # restore value
   ttFont["name"].names[index].string = backup
   assert status == expected_result
@@ -227,13 +232,14 @@ def assert_name_table_check_result(ttFont, index, name, check, value, expected_r
 
 def test_check_family_naming_recommendations():
   """ Font follows the family naming recommendations ? """
+  from fontbakery.profiles.shared_conditions import name_index
   from fontbakery.profiles.name import com_google_fonts_check_family_naming_recommendations as check
   # Our reference Mada Medium is known to be good
   ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
 
   # So it must PASS the check:
   print ("Test PASS with a good font...")
-  status, message = list(check(ttFont))[-1]
+  status, message = list(check(ttFont, name_index(ttFont)))[-1]
   assert status == PASS
 
   # We'll test rule violations in all entries one-by-one
@@ -85,19 +85,20 @@ def test_check_family_panose_familytype(mada_ttFonts):
 def test_check_xavgcharwidth():
   """ Check if OS/2 xAvgCharWidth is correct. """
   from fontbakery.profiles.os2 import com_google_fonts_check_xavgcharwidth as check
+  from fontbakery.profiles.shared_conditions import glyph_metrics
 
   test_font_path = TEST_FILE("nunito/Nunito-Regular.ttf")
 
   test_font = TTFont(test_font_path)
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == PASS
 
   test_font['OS/2'].xAvgCharWidth = 556
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == INFO
 
   test_font['OS/2'].xAvgCharWidth = 500
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == WARN
 
   test_font = TTFont()
@@ -108,7 +109,7 @@ def test_check_xavgcharwidth():
   test_font['glyf'].glyphs = {}
   test_font['hmtx'] = fontTools.ttLib.newTable('hmtx')
   test_font['hmtx'].metrics = {}
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == FAIL
   assert message.code == "missing-glyphs"
 
@@ -121,22 +122,22 @@ def test_check_xavgcharwidth():
   temp_file = io.BytesIO()
   test_font.save(temp_file)
   test_font = TTFont(temp_file)
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == PASS
 
   test_font['OS/2'].xAvgCharWidth = 450
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == INFO
 
   test_font['OS/2'].xAvgCharWidth = 500
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == WARN
 
   test_font = TTFont(temp_file)
   subsetter = fontTools.subset.Subsetter()
   subsetter.populate(glyphs=['b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z', 'space'])
   subsetter.subset(test_font)
-  status, message = list(check(test_font))[-1]
+  status, message = list(check(test_font, glyph_metrics(test_font)))[-1]
   assert status == FAIL
   assert message.code == "missing-glyphs"
 
@@ -221,3 +222,26 @@ def test_check_code_pages():
   ttFont['OS/2'].ulCodePageRange2 = 0
   status, message = list(check(ttFont))[-1]
   assert status == FAIL
+
+
+def test_condition_is_cjk_font():
+  """ The OS/2 code page and UnicodeRange bits and the cmap ranges. """
+  from fontbakery.profiles.shared_conditions import is_cjk_font
+
+  ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+  assert not is_cjk_font(ttFont)
+
+  ttFont['OS/2'].ulCodePageRange1 |= 1 << 17 # JIS/Japan
+  assert is_cjk_font(ttFont)
+
+  ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+  ttFont['OS/2'].ulUnicodeRange2 |= 1 << (59 - 32) # CJK Unified Ideographs
+  assert is_cjk_font(ttFont)
+
+  ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+  cmap = ttFont.getBestCmap()
+  # Yijing Hexagram Symbols, right after CJK Unified Ideographs Extension A
+  cmap[0x4DC0] = '.notdef'
+  assert not is_cjk_font(ttFont)
+  cmap[0x4DBF] = '.notdef'
+  assert is_cjk_font(ttFont)
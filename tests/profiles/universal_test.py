@@ -171,7 +171,7 @@ def DISABLED_test_check_glyphnames_max_length():
   assert status == PASS
 
 
-def test_check_ttx_roundtrip(): 
+def test_check_ttx_roundtrip(tmp_path):
   """ Checking with fontTools.ttx """ 
   from fontbakery.profiles.universal import com_google_fonts_check_ttx_roundtrip as check 
  
@@ -179,10 +179,40 @@ def test_check_ttx_roundtrip():
   status, _ = list(check(good_font_path))[-1] 
   assert status == PASS 
  
-  # TODO: Can anyone show us a font file that fails ttx roundtripping?! 
-  #bad_font_path = TEST_FILE("...") 
-  #status, _ = list(check(bad_font_path))[-1] 
-  #assert status == FAIL 
+  # ttx raises a RecursionError on this one.
+  import logging
+  handlers = list(logging.getLogger("fontTools").handlers)
+  bad_font_path = TEST_FILE("subr_test_fonts/subr_test_font_infinite_recursion.otf")
+  status, message = list(check(bad_font_path))[-1]
+  assert status == FAIL and "recursed too deeply" in message
+  assert logging.getLogger("fontTools").handlers == handlers
+
+  # Other errors are not a problem of the font, they reach the runner.
+  from unittest import mock
+  with mock.patch("fontTools.ttx.TTFont.saveXML", side_effect=OSError("disk full")):
+    with pytest.raises(OSError):
+      list(check(good_font_path))
+  assert logging.getLogger("fontTools").handlers == handlers
+
+  # fontTools warns about the bytes after the OS/2 table data.
+  from fontTools.ttLib.tables.DefaultTable import DefaultTable
+  ttFont = TTFont(good_font_path)
+  os2 = DefaultTable('OS/2')
+  os2.data = ttFont.reader['OS/2'] + b'\0' * 8
+  ttFont['OS/2'] = os2
+  warning_font_path = str(tmp_path / "Mada-Regular.ttf")
+  ttFont.save(warning_font_path)
+  status, message = list(check(warning_font_path))[-1]
+  assert status == FAIL and message == "too much 'OS/2' table data"
+
+  # the messages of a check running at the same time are not mixed up
+  from concurrent.futures import ThreadPoolExecutor
+  with ThreadPoolExecutor(max_workers=4) as executor:
+    results = list(executor.map(lambda path: list(check(path))[-1]
+                              , [good_font_path, warning_font_path] * 4))
+  assert results == [(PASS, "Hey! It all looks good!")
+                   , (FAIL, "too much 'OS/2' table data")] * 4
+  assert os.listdir(tmp_path) == ["Mada-Regular.ttf"]
  
  
 def test_is_up_to_date(): 
@@ -301,16 +331,17 @@ def test_check_mandatory_glyphs():
   """ Font contains the first few mandatory glyphs (.null or NULL, CR and
   space)? """
   from fontbakery.profiles.universal import com_google_fonts_check_mandatory_glyphs as check
+  from fontbakery.profiles.shared_conditions import ink_map
 
   test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, ink_map(test_font)))[-1]
   assert status == PASS
 
   import fontTools.subset
   subsetter = fontTools.subset.Subsetter()
   subsetter.populate(glyphs="n")  # Arbitrarily remove everything except n.
   subsetter.subset(test_font)
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, ink_map(test_font)))[-1]
   assert status == WARN
 
 
@@ -401,19 +432,20 @@ def test_check_whitespace_glyphnames():
 def test_check_whitespace_ink():
   """ Whitespace glyphs have ink? """
   from fontbakery.profiles.universal import com_google_fonts_check_whitespace_ink as check
+  from fontbakery.profiles.shared_conditions import ink_map
 
   test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, ink_map(test_font)))[-1]
   assert status == PASS
 
   print ("Test for whitespace character having composites (with ink).")
   test_font["cmap"].tables[0].cmap[0x0020] = "uni1E17"
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, ink_map(test_font)))[-1]
   assert status == FAIL
 
   print ("Test for whitespace character having outlines (with ink).")
   test_font["cmap"].tables[0].cmap[0x0020] = "scedilla"
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, ink_map(test_font)))[-1]
   assert status == FAIL
 
   print ("Test for whitespace character having composites (without ink).")
@@ -421,7 +453,7 @@ def test_check_whitespace_ink():
   pen = fontTools.pens.ttGlyphPen.TTGlyphPen(test_font.getGlyphSet())
   pen.addComponent("space", (1, 0, 0, 1, 0, 0))
   test_font["glyf"].glyphs["uni200B"] = pen.glyph()
-  status, _ = list(check(test_font))[-1]
+  status, _ = list(check(test_font, ink_map(test_font)))[-1]
   assert status == FAIL
 
 
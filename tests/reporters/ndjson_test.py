@@ -0,0 +1,93 @@
+import io
+import json
+
+from fontbakery.callable import check
+from fontbakery.checkrunner import (
+              CheckRunner
+            , Profile
+            , Section
+            , PASS
+            , WARN
+            , message_from_data
+            )
+from fontbakery.message import Message
+from fontbakery.reporters.ndjson import NDJSONReporter
+
+
+@check(id='com.example/check/thing_is_short')
+def check_thing_is_short(thing):
+  """Thing is short?"""
+  if len(thing) > 3:
+    yield WARN, Message('too-long', f'{thing} is too long.')
+  else:
+    yield PASS, f'{thing} is short.'
+
+
+class LineCountingFile(io.StringIO):
+  def __init__(self):
+    super().__init__()
+    self.flushed = []
+
+  def flush(self):
+    self.flushed.append(self.getvalue().count('\n'))
+
+
+def test_ndjson_reporter():
+  profile = Profile(sections=[Section('Things', checks=[check_thing_is_short])]
+                  , iterargs={'thing': 'things'})
+  runner = CheckRunner(profile, values={'things': ['a', 'bbbbb']})
+  out = LineCountingFile()
+  reporter = NDJSONReporter(out, runner=runner)
+  reporter.run()
+
+  lines = [json.loads(line) for line in out.getvalue().splitlines()]
+  assert [line['event'] for line in lines] == [
+      'START', 'ENDCHECK', 'ENDCHECK', 'ENDSECTION', 'END']
+  # each line is flushed when it is written
+  assert out.flushed == [1, 2, 3, 4, 5]
+
+  start, short, long, section, end = lines
+  assert start['iterargs'] == {'thing': ['a', 'bbbbb']}
+  assert start['order'][1] == {'section': 'Things'
+                             , 'check': 'com.example/check/thing_is_short'
+                             , 'iterargs': [['thing', 1]]}
+  assert short['result'] == 'PASS'
+  assert short['logs'] == [{'status': 'PASS', 'message': 'a is short.'}]
+  assert long['iterargs'] == [['thing', 1]] and long['result'] == 'WARN'
+  message = message_from_data(long['logs'][0]['message'])
+  assert message.code == 'too-long' and message.message == 'bbbbb is too long.'
+  assert section == {'event': 'ENDSECTION', 'section': 'Things'
+                   , 'result': {'PASS': 1, 'WARN': 1}}
+  assert end['result'] == {'PASS': 1, 'WARN': 1}
+  # nothing is kept once the checks ended
+  assert not reporter._logs
+
+
+def test_recorded_run_replays_events():
+  from fontbakery.reporters.ndjson import RecordedRun
+  from fontbakery.reporters.serialize import SerializeReporter
+  profile = Profile(sections=[Section('Things', checks=[check_thing_is_short])]
+                  , iterargs={'thing': 'things'})
+  runner = CheckRunner(profile, values={'things': ['a', 'bbbbb']}, timings=True)
+  out = io.StringIO()
+  reporters = [NDJSONReporter(out, runner=runner)
+             , SerializeReporter(runner=runner, collect_results_by='thing')]
+  events = []
+  for event in runner.run():
+    events.append(event)
+    for reporter in reporters:
+      reporter.receive(event)
+
+  recorded = RecordedRun(out.getvalue().splitlines())
+  assert recorded.get_iterarg('thing', 1) == 'bbbbb'
+  replayed = list(recorded.run())
+  assert [(status, f'{message}', f'{identity}') for status, message, identity
+                                                                in replayed] \
+      == [(status, f'{message}', f'{identity}') for status, message, identity
+                                                                in events]
+
+  # the same document, including the timings
+  recorded = RecordedRun(out.getvalue().splitlines())
+  reporter = SerializeReporter(runner=recorded, collect_results_by='thing')
+  reporter.run()
+  assert reporter.getdoc() == reporters[1].getdoc()
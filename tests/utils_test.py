@@ -0,0 +1,114 @@
+from fontbakery.constants import UNICODERANGE_DATA
+from fontbakery.utils import unicoderange_char_counts
+
+
+def test_unicoderange_char_counts():
+  """The interval index counts like a lookup in each range would."""
+  codepoints = [0x0, 0x41, 0x7F, 0x80, 0x3042, 0x4E00, 0xAC00, 0xD7AF,
+                0xE000, 0x1F000, 0x20000, 0x10FFFD, 0x10FFFF]
+  expected = [sum(1 for c in codepoints
+                    for _, _, first, last in entries if first <= c <= last)
+              for entries in UNICODERANGE_DATA]
+  assert unicoderange_char_counts(reversed(codepoints)) == expected
+  assert unicoderange_char_counts([]) == [0] * len(UNICODERANGE_DATA)
+
+
+def test_compute_unicoderange_bits():
+  """Only the bits of the ranges that hold characters are set, also where
+  a UNICODERANGE_DATA position holds the ranges of several bits."""
+  from fontTools.ttLib import TTFont
+  from fontbakery.utils import (TEST_FILE, compute_unicoderange_bits,
+                                get_preferred_cmap)
+
+  ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+  cmap = get_preferred_cmap(ttFont)
+  # Hangul Jamo (bit 28) is in the same position as Balinese (bit 27)
+  cmap[0x1100] = cmap[0x41]
+  expected = 0
+  for c in cmap:
+    for entries in UNICODERANGE_DATA:
+      for bit, _, first, last in entries:
+        if first <= c <= last:
+          expected |= 1 << bit
+  assert compute_unicoderange_bits(ttFont) == expected
+  assert expected & (1 << 28) and not expected & (1 << 27)
+
+
+def test_name_index():
+  """The name index finds the records the scan of the name table would."""
+  from fontTools.ttLib import TTFont
+  from fontbakery.utils import TEST_FILE, NameIndex, get_name_entry_strings
+
+  ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
+  index = NameIndex(ttFont)
+  names = ttFont['name'].names
+  for name in names:
+    for ids in [(None, None, None),
+                (name.platformID, None, None),
+                (name.platformID, name.platEncID, name.langID)]:
+      expected = [entry for entry in names
+                  if entry.nameID == name.nameID and
+                     all(wanted is None or wanted == actual
+                         for wanted, actual in zip(ids, (entry.platformID,
+                                                         entry.platEncID,
+                                                         entry.langID)))]
+      assert index.entries(name.nameID, *ids) == expected
+      assert get_name_entry_strings(ttFont, name.nameID, *ids, name_index=index) == \
+             [entry.toUnicode() for entry in expected]
+  assert index.entries(12345) == []
+
+
+def test_get_shared_ttFont(tmp_path):
+  """The parsed font is shared while in use and parsed again once the file changed."""
+  import gc
+  import os
+  import shutil
+  from fontbakery import utils
+  from fontbakery.utils import TEST_FILE, get_shared_ttFont
+
+  path = str(tmp_path / "Mada-Regular.ttf")
+  shutil.copy(TEST_FILE("mada/Mada-Regular.ttf"), path)
+  ttFont = get_shared_ttFont(path)
+  assert get_shared_ttFont(os.path.relpath(path)) is ttFont
+
+  stat = os.stat(path)
+  os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+  changed = get_shared_ttFont(path)
+  assert changed is not ttFont
+  assert get_shared_ttFont(path) is changed
+
+  # it is dropped once nobody uses it anymore
+  del ttFont, changed
+  gc.collect()
+  assert not [key for key in utils._shared_ttFonts.keys()
+                  if key[0] == os.path.abspath(path)]
+
+
+def test_tracked_ttFont_table_uses():
+  from fontbakery.utils import TEST_FILE, TrackedTTFont
+
+  from fontbakery.callable import check
+  from fontbakery.checkrunner import CheckRunner, Profile, Section, PASS
+
+  ttFont = TrackedTTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+  # counted only while the runner records timings
+  ttFont["head"]
+  assert ttFont.table_uses == {}
+
+  @check(id='com.example/check/name_table')
+  def check_name_table(font):
+    """Font has a name table?"""
+    ttFont["name"]
+    ttFont[b"name"]
+    yield PASS, "ok"
+
+  profile = Profile(sections=[Section('Tables', checks=[check_name_table])]
+                  , iterargs={'font': 'fonts'})
+  runner = CheckRunner(profile, values={'fonts': ['Mada-Regular.ttf']}
+                     , timings=True)
+  list(runner.run())
+  assert ttFont.table_uses == {"name": 2}
+  (_, timing), = runner.timings
+  assert timing['tables']['name']['uses'] == 2
+  assert timing['tables']['name']['wall'] > 0
+  assert not ttFont.isLoaded("GSUB")